@@ -1,6 +1,6 @@
 from rest_framework.exceptions import PermissionDenied
 
-from authentication.hybrid_authentication import HybridAuthentication
+from authentication.hybrid_authentication import HybridAuthentication, get_auth_context
 
 from .models import AuthorizedUser
 
@@ -26,6 +26,9 @@ def authorized_user_required(view_func):
         1. Authenticates the user using `HybridAuthentication`.
         2. Checks if the user exists in the `AuthorizedUser` model.
         3. Validates that the user is active and has the necessary permissions.
+
+    The authentication result and the `AuthorizedUser` row are kept in the request's auth context,
+    so DRF's `authentication_classes` and any later check reuse them instead of querying again.
     """
 
     def _wrapped_view(request, *args, **kwargs):
@@ -39,10 +42,15 @@ def authorized_user_required(view_func):
             user_email = user.email if user else None
 
             if user_email:
-                # Check if the user exists and is authorized
-                authorized_user = AuthorizedUser.objects.filter(
-                    user__email=user_email
-                ).first()
+                # Check if the user exists and is authorized, reusing the row loaded during authentication
+                context = get_auth_context(request)
+                authorized_user = context.authorized_user if context else None
+                if authorized_user is None:
+                    authorized_user = AuthorizedUser.objects.filter(
+                        user__email=user_email
+                    ).first()
+                    if context:
+                        context.authorized_user = authorized_user
 
                 if not authorized_user:
                     raise PermissionDenied("User is not authorized.")
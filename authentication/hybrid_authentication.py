@@ -1,16 +1,55 @@
 import logging
 
-import google.auth.transport.requests
-from google.oauth2.id_token import verify_oauth2_token
+from django.utils.functional import SimpleLazyObject
 from rest_framework.authentication import BaseAuthentication, TokenAuthentication
 from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
 
 from authentication.models import AuthorizedUser
+from authentication.session_tokens import (
+    authorized_user_from_claims,
+    decode_session_token,
+    is_session_token,
+)
+from authentication.verification_cache import token_cache
 from hub.settings import GOOGLE_SECRET_KEY
 from uvaq.models import PersonalInformation
 
 logger = logging.getLogger(__name__)
 
+AUTH_CONTEXT_ATTR = "_hybrid_auth_context"
+
+
+class RequestAuthContext:
+    """
+    Result of a successful authentication, stored on the request that produced it.
+
+    Attributes:
+        user (User): The authenticated Django user.
+        auth: The credentials returned alongside the user by the authentication class.
+        authorized_user (AuthorizedUser | None): The authorization row, once it has been loaded.
+    """
+
+    def __init__(self, user, auth, authorized_user=None):
+        self.user = user
+        self.auth = auth
+        self.authorized_user = authorized_user
+
+
+def get_auth_context(request):
+    """
+    Returns the authentication context stored on the request, if any.
+
+    Both Django's `HttpRequest` and DRF's `Request` are accepted; the context always lives on
+    the underlying `HttpRequest`, so it is shared between middleware, decorators and DRF views.
+    """
+    return getattr(getattr(request, "_request", request), AUTH_CONTEXT_ATTR, None)
+
+
+def set_auth_context(request, context):
+    setattr(getattr(request, "_request", request), AUTH_CONTEXT_ATTR, context)
+    return context
+
 
 class BaseOAuth2Authentication(BaseAuthentication):
     """
@@ -18,9 +57,14 @@ class BaseOAuth2Authentication(BaseAuthentication):
 
     This class provides functionality for extracting and verifying bearer tokens,
     particularly for Google OAuth2, and retrieving user email information from the ID token.
+    Verified tokens and Google's signing certificates are served from `token_cache`, so only
+    the first request with a given token pays for certificate fetching and signature checks.
+    Bearer tokens may also be local session tokens (see `authentication.session_tokens`), which
+    are verified with a local HMAC check only.
 
     Methods:
         authenticate_bearer_token(token): Verifies the provided bearer token and extracts the institutional email.
+        authenticate_session_token(token): Verifies a local session token and returns its claims.
         authenticate_header(request): Extracts and validates the authorization header from the request.
 
     Raises:
@@ -40,12 +84,11 @@ class BaseOAuth2Authentication(BaseAuthentication):
         Raises:
             AuthenticationFailed: If the token is invalid or does not contain a valid email.
         """
+        if is_session_token(token):
+            return self.authenticate_session_token(token)["email"]
+
         try:
-            id_info = verify_oauth2_token(
-                token,
-                google.auth.transport.requests.Request(),
-                audience=GOOGLE_SECRET_KEY,
-            )
+            id_info = token_cache.verify(token, audience=GOOGLE_SECRET_KEY)
 
             # Check issuer
             if id_info.get("iss") not in [
@@ -64,6 +107,24 @@ class BaseOAuth2Authentication(BaseAuthentication):
             logger.warning("Authentication failed: Invalid token.")
             raise AuthenticationFailed("Invalid token.")
 
+    def authenticate_session_token(self, token):
+        """
+        Verifies a local session token without any database or network access.
+
+        Args:
+            token (str): The session token issued by `SessionTokenView`.
+
+        Returns:
+            dict: The token claims.
+
+        Raises:
+            AuthenticationFailed: If the token is invalid or expired.
+        """
+        try:
+            return decode_session_token(token).payload
+        except TokenError as e:
+            raise AuthenticationFailed(str(e))
+
     def authenticate_header(self, request):
         """
         Extracts and validates the authorization header from the request.
@@ -93,15 +154,21 @@ class IdPAuthentication(BaseOAuth2Authentication):
     """
     Authentication class for handling Identity Provider (IdP) based authentication.
 
-    This class uses the OAuth2 token to extract the institutional email from the ID token.
+    This class uses the OAuth2 token to extract the institutional email from the ID token. Local session tokens
+    carry the person id instead, and the person is loaded lazily on first access.
 
     Methods:
+        get_queryset(): Returns the queryset used to resolve the person behind the token. Subclasses override it
+            to preload the relations their views need.
         authenticate(request): Authenticates the request by extracting the bearer token and validating the email.
 
     Raises:
         AuthenticationFailed: If the token is invalid or the email is missing.
     """
 
+    def get_queryset(self):
+        return PersonalInformation.objects.all()
+
     def authenticate(self, request):
         """
         Authenticates the request using a bearer token.
@@ -116,13 +183,21 @@ class IdPAuthentication(BaseOAuth2Authentication):
             AuthenticationFailed: If authentication fails due to missing or invalid token.
         """
         auth_type, token = self.authenticate_header(request)
+        if auth_type == "bearer" and is_session_token(token):
+            # The person is only loaded if the view reads it.
+            person_id = self.authenticate_session_token(token)["person_id"]
+            if person_id is None:
+                raise AuthenticationFailed("User not found in the university database.")
+            personal_info = SimpleLazyObject(lambda: self.get_queryset().get(pk=person_id))
+            return (UserProxy(personal_info), token)
+
         if auth_type == "bearer":
             institutional_email = self.authenticate_bearer_token(token)
             if not institutional_email:
                 raise AuthenticationFailed("The token does not contain a valid email.")
 
             try:
-                personal_info = PersonalInformation.objects.get(
+                personal_info = self.get_queryset().get(
                     contact_info__institutional_email=institutional_email
                 )
             except PersonalInformation.DoesNotExist:
@@ -140,7 +215,9 @@ class HybridAuthentication(BaseOAuth2Authentication):
     Handles hybrid authentication using either bearer tokens (OAuth2) or Django's token authentication.
 
     This class first attempts to authenticate using an OAuth2 bearer token. If that fails, it falls back to Django's
-    TokenAuthentication.
+    TokenAuthentication. Local session tokens are accepted as bearer tokens and resolved from their claims
+    without querying the database. The first successful result is memoized on the request, so later checks within the same
+    request (e.g. `authorized_user_required` followed by DRF's `authentication_classes`) reuse it.
 
     Methods:
         authenticate(request): Authenticates the request using either OAuth2 bearer tokens or Django's token authentication.
@@ -162,17 +239,39 @@ class HybridAuthentication(BaseOAuth2Authentication):
         Raises:
             AuthenticationFailed: If the authentication fails due to an invalid or unsupported token.
         """
+        context = get_auth_context(request)
+        if context is not None:
+            request.user = context.user
+            return (context.user, context.auth)
+
         auth_type, token = self.authenticate_header(request)
+        if auth_type.lower() == "bearer" and is_session_token(token):
+            claims = self.authenticate_session_token(token)
+            if claims["authorized_user"] is None:
+                raise AuthenticationFailed("User is not authorized to use this service.")
+
+            authorized_user = authorized_user_from_claims(claims)
+            set_auth_context(
+                request,
+                RequestAuthContext(authorized_user.user, None, authorized_user),
+            )
+            request.user = authorized_user.user
+            return (authorized_user.user, None)
+
         if auth_type.lower() == "bearer":
             try:
                 institutional_email = self.authenticate_bearer_token(token)
                 try:
-                    authorized_user = AuthorizedUser.objects.get(
+                    authorized_user = AuthorizedUser.objects.select_related("user").get(
                         user__email=institutional_email
                     )
                     if not authorized_user.is_active:
                         raise AuthenticationFailed("User is not active.")
 
+                    set_auth_context(
+                        request,
+                        RequestAuthContext(authorized_user.user, None, authorized_user),
+                    )
                     request.user = authorized_user.user
                     return (authorized_user.user, None)
                 except AuthorizedUser.DoesNotExist:
@@ -186,6 +285,7 @@ class HybridAuthentication(BaseOAuth2Authentication):
         elif auth_type.lower() == "token":
             user_auth = TokenAuthentication().authenticate(request)
             if user_auth:
+                set_auth_context(request, RequestAuthContext(*user_auth))
                 request.user = user_auth[0]
                 return user_auth
             else:
@@ -0,0 +1,105 @@
+import jwt
+from django.contrib.auth.models import User
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import AuthorizedUser
+from uvaq.models import PersonalInformation
+
+
+class SessionToken(AccessToken):
+    """
+    Short-lived, locally signed token issued in exchange for a verified Google ID token.
+
+    The token carries everything the authentication classes need, so accepting it only costs an
+    HMAC check:
+
+    Claims:
+        email (str): The institutional email from the Google ID token.
+        person_id (int | None): The matching `PersonalInformation` id, used by `IdPAuthentication`.
+        authorized_user (dict | None): The matching `AuthorizedUser` id, user id, username and flags,
+            used by `HybridAuthentication` and `authorized_user_required`.
+
+    Authorization flags are snapshotted at exchange time; the token lifetime
+    (`SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"]`) bounds how long a revoked user keeps access.
+    """
+
+    token_type = "session"
+
+
+def is_session_token(token):
+    """
+    Tells local session tokens apart from Google ID tokens by their signing algorithm, without
+    verifying anything.
+    """
+    try:
+        return jwt.get_unverified_header(token).get("alg") == api_settings.ALGORITHM
+    except jwt.PyJWTError:
+        return False
+
+
+def issue_session_token(institutional_email):
+    """
+    Issues a session token for the person and authorized user behind an institutional email.
+
+    Args:
+        institutional_email (str): Email extracted from a verified Google ID token.
+
+    Returns:
+        SessionToken | None: The token, or None if the email matches neither a person nor an
+        authorized user.
+    """
+    person_id = (
+        PersonalInformation.objects.filter(contact_info__institutional_email=institutional_email)
+        .values_list("pk", flat=True)
+        .first()
+    )
+    authorized_user = (
+        AuthorizedUser.objects.select_related("user")
+        .filter(user__email=institutional_email, is_active=True)
+        .first()
+    )
+    if person_id is None and authorized_user is None:
+        return None
+
+    token = SessionToken()
+    token["email"] = institutional_email
+    token["person_id"] = person_id
+    token["authorized_user"] = (
+        {
+            "id": authorized_user.pk,
+            "user_id": authorized_user.user_id,
+            "username": authorized_user.user.username,
+            "is_authorized": authorized_user.is_authorized,
+            "can_manage_users": authorized_user.can_manage_users,
+        }
+        if authorized_user
+        else None
+    )
+    return token
+
+
+def decode_session_token(token):
+    """
+    Verifies a session token locally.
+
+    Raises:
+        TokenError: If the signature, expiry or token type is invalid.
+    """
+    return SessionToken(token)
+
+
+def authorized_user_from_claims(claims):
+    """
+    Rebuilds the `AuthorizedUser` and its `User` from session token claims, without querying.
+    """
+    data = claims["authorized_user"]
+    user = User(pk=data["user_id"], username=data["username"], email=claims["email"])
+    return AuthorizedUser(
+        pk=data["id"],
+        user=user,
+        is_authorized=data["is_authorized"],
+        can_manage_users=data["can_manage_users"],
+        is_active=True,
+    )
+
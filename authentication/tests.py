@@ -0,0 +1,269 @@
+import base64
+import json
+import time
+from datetime import timedelta
+from unittest import mock
+
+import google.auth.transport.requests
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from authentication.hybrid_authentication import HybridAuthentication, IdPAuthentication
+from authentication.models import AuthorizedUser
+from authentication.session_tokens import (
+    SessionToken,
+    decode_session_token,
+    is_session_token,
+    issue_session_token,
+)
+from authentication.verification_cache import (
+    CERTS_DEFAULT_MAX_AGE,
+    CachedCertsRequest,
+    VerifiedTokenCache,
+    token_cache,
+)
+from uvaq import factories
+from uvaq.models import Subject
+
+
+def google_token(**claims):
+    """
+    An unsigned token shaped like a Google ID token; verification is mocked in the tests.
+    """
+
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'RS256', 'kid': 'google', 'typ': 'JWT'})}.{encode(claims)}.sig"
+
+
+def google_claims(email):
+    return {"iss": "accounts.google.com", "email": email}
+
+
+class SessionTokenTestCase(TestCase):
+    def setUp(self):
+        self.person = factories.student().personal_info
+        self.email = self.person.contact_info.institutional_email
+        self.user = User.objects.create(username="staff", email=self.email)
+        self.authorized_user = AuthorizedUser.objects.create(
+            user=self.user, is_authorized=True
+        )
+
+    def request(self, token):
+        return RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def expired(self, token):
+        token.set_exp(from_time=token.current_time - SessionToken.lifetime - timedelta(seconds=1))
+        return str(token)
+
+
+class SessionTokenExchangeTests(SessionTokenTestCase):
+    def exchange(self, id_token="google-token", **verify):
+        with mock.patch.object(token_cache, "verify", **verify) as verifier:
+            response = APIClient().post(reverse("session-token"), {"id_token": id_token})
+        return response, verifier
+
+    def test_google_token_is_exchanged_for_a_session_token(self):
+        response, verifier = self.exchange(return_value=google_claims(self.email))
+
+        self.assertEqual(response.status_code, 200)
+        verifier.assert_called_once()
+        data = response.json()
+        self.assertEqual(data["expires_in"], SessionToken.lifetime.total_seconds())
+        claims = decode_session_token(data["access"]).payload
+        self.assertEqual(claims["email"], self.email)
+        self.assertEqual(claims["person_id"], self.person.pk)
+        self.assertEqual(claims["authorized_user"]["id"], self.authorized_user.pk)
+        self.assertTrue(claims["authorized_user"]["is_authorized"])
+
+    def test_exchange_rejects_invalid_requests(self):
+        with self.assertLogs("django.request", "WARNING"):
+            response, _ = self.exchange(id_token="")
+        self.assertEqual(response.status_code, 400)
+
+        with self.assertLogs("authentication", "WARNING"), self.assertLogs("django.request"):
+            response, _ = self.exchange(side_effect=ValueError("Token expired"))
+        self.assertEqual(response.status_code, 401)
+
+        with self.assertLogs("django.request", "WARNING"):
+            response, _ = self.exchange(return_value=google_claims("nobody@uvaq.edu.mx"))
+        self.assertEqual(response.status_code, 404)
+
+    def test_inactive_authorized_user_is_left_out_of_the_claims(self):
+        AuthorizedUser.objects.filter(pk=self.authorized_user.pk).update(is_active=False)
+
+        claims = issue_session_token(self.email).payload
+
+        self.assertEqual(claims["person_id"], self.person.pk)
+        self.assertIsNone(claims["authorized_user"])
+
+
+class SessionTokenVerificationTests(SessionTokenTestCase):
+    def test_session_token_is_verified_locally(self):
+        token = str(issue_session_token(self.email))
+        request = self.request(token)
+
+        with mock.patch.object(token_cache, "verify") as verifier, self.assertNumQueries(0):
+            user, _ = HybridAuthentication().authenticate(request)
+
+        verifier.assert_not_called()
+        self.assertEqual((user.pk, user.email), (self.user.pk, self.email))
+
+    def test_expired_token_is_rejected(self):
+        token = self.expired(issue_session_token(self.email))
+
+        with self.assertRaises(AuthenticationFailed):
+            HybridAuthentication().authenticate(self.request(token))
+        with self.assertRaises(AuthenticationFailed):
+            IdPAuthentication().authenticate(self.request(token))
+
+    def test_tampered_token_is_rejected(self):
+        header, payload, signature = str(issue_session_token(self.email)).split(".")
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        claims["authorized_user"]["can_manage_users"] = True
+        forged = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+
+        for token in (f"{header}.{forged}.{signature}", f"{header}.{payload}.{signature[:-4]}AAAA"):
+            with self.subTest(token=token), self.assertRaises(AuthenticationFailed):
+                HybridAuthentication().authenticate(self.request(token))
+
+    def test_algorithm_header_picks_the_verifier(self):
+        session = str(issue_session_token(self.email))
+        google = google_token(email=self.email)
+        self.assertTrue(is_session_token(session))
+        self.assertFalse(is_session_token(google))
+        self.assertFalse(is_session_token("not-a-jwt"))
+
+        with mock.patch.object(
+            token_cache, "verify", return_value=google_claims(self.email)
+        ) as verifier:
+            user, _ = HybridAuthentication().authenticate(self.request(google))
+
+        verifier.assert_called_once_with(google, audience=settings.GOOGLE_SECRET_KEY)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_revoked_user_keeps_access_until_the_token_expires(self):
+        self.assertEqual(SessionToken.lifetime, settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"])
+        token = issue_session_token(self.email)
+        AuthorizedUser.objects.filter(pk=self.authorized_user.pk).update(is_active=False)
+
+        user, _ = HybridAuthentication().authenticate(self.request(str(token)))
+        self.assertEqual(user.pk, self.user.pk)
+
+        with self.assertRaises(AuthenticationFailed):
+            HybridAuthentication().authenticate(self.request(self.expired(token)))
+
+
+class VerifiedTokenCacheTests(SimpleTestCase):
+    def verify(self, cache, token, exp):
+        claims = {"email": "ana@uvaq.edu.mx", "exp": exp}
+        with mock.patch(
+            "authentication.verification_cache.verify_oauth2_token", return_value=claims
+        ) as verifier:
+            self.assertEqual(cache.verify(token, audience="client"), claims)
+        return verifier.call_count
+
+    def test_repeat_token_is_served_from_the_cache(self):
+        cache = VerifiedTokenCache()
+        exp = time.time() + 3600
+
+        self.assertEqual(self.verify(cache, "token", exp), 1)
+        self.assertEqual(self.verify(cache, "token", exp), 0)
+        self.assertEqual(self.verify(cache, "other", exp), 1)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(cache.stats()["tokens"]["size"], 2)
+
+    def test_entries_never_outlive_the_token(self):
+        cache = VerifiedTokenCache()
+        expired = time.time() - 1
+
+        self.assertEqual(self.verify(cache, "token", expired), 1)
+        self.assertEqual(self.verify(cache, "token", expired), 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_entries_never_outlive_max_ttl(self):
+        cache = VerifiedTokenCache(max_ttl=0)
+        exp = time.time() + 3600
+
+        self.assertEqual(self.verify(cache, "token", exp), 1)
+        self.assertEqual(self.verify(cache, "token", exp), 1)
+
+    def test_clear_resets_entries_and_counters(self):
+        cache = VerifiedTokenCache()
+        self.verify(cache, "token", time.time() + 3600)
+
+        cache.clear()
+
+        self.assertEqual(self.verify(cache, "token", time.time() + 3600), 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+
+class CachedCertsRequestTests(SimpleTestCase):
+    def fetch(self, request, *responses):
+        with mock.patch.object(
+            google.auth.transport.requests.Request, "__call__", side_effect=responses
+        ) as transport:
+            for _ in responses:
+                request("https://www.googleapis.com/oauth2/v1/certs")
+        return transport.call_count
+
+    def response(self, status=200, **headers):
+        return mock.Mock(status=status, headers=headers)
+
+    def test_max_age_is_read_from_cache_control(self):
+        for headers, max_age in (
+            ({"Cache-Control": "public, max-age=19830, must-revalidate"}, 19830),
+            ({"cache-control": "max-age=60"}, 60),
+            ({}, CERTS_DEFAULT_MAX_AGE),
+            ({"Cache-Control": "no-cache"}, CERTS_DEFAULT_MAX_AGE),
+            ({"Cache-Control": "max-age=soon"}, CERTS_DEFAULT_MAX_AGE),
+        ):
+            with self.subTest(headers=headers):
+                self.assertEqual(CachedCertsRequest.get_max_age(headers), max_age)
+
+    def test_certificates_are_fetched_once_per_max_age(self):
+        request = CachedCertsRequest()
+        response = self.response(**{"Cache-Control": "max-age=3600"})
+
+        self.assertEqual(self.fetch(request, response, response), 1)
+        self.assertEqual((request.hits, request.misses), (1, 1))
+
+    def test_expired_and_failed_responses_are_fetched_again(self):
+        for response in (
+            self.response(**{"Cache-Control": "max-age=0"}),
+            self.response(status=500, **{"Cache-Control": "max-age=3600"}),
+        ):
+            with self.subTest(status=response.status):
+                request = CachedCertsRequest()
+                self.assertEqual(self.fetch(request, response, response), 2)
+                self.assertEqual((request.hits, request.misses), (0, 2))
+
+
+class RequestAuthContextTests(SessionTokenTestCase):
+    def test_authorized_request_verifies_and_loads_the_user_once(self):
+        factories.subject()
+        client = APIClient()
+
+        with mock.patch.object(
+            token_cache, "verify", return_value=google_claims(self.email)
+        ) as verifier:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(
+                    reverse("subject-list"), HTTP_AUTHORIZATION=f"Bearer {google_token()}"
+                )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], Subject.objects.count())
+        # One AuthorizedUser lookup shared by the mixin and DRF, then count, page and prefetch.
+        verifier.assert_called_once()
+        self.assertEqual(len(queries), 4)
+        table = AuthorizedUser._meta.db_table
+        self.assertEqual(len([q for q in queries if table in q["sql"]]), 1)
@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import AuthorizedUserViewSet, LoginView
+from .views import AuthorizedUserViewSet, LoginView, SessionTokenView
 
 # Create a DefaultRouter instance for handling user-related URLs.
 router = DefaultRouter()
@@ -9,5 +9,6 @@ router.register(r"users", AuthorizedUserViewSet, basename="authorizeduser")
 
 urlpatterns = [
     path("login/", LoginView.as_view(), name="login"),  # Route for user login
+    path("token/", SessionTokenView.as_view(), name="session-token"),  # Google ID token exchange
     path("", include(router.urls)),  # Include all routes registered with the router
 ]
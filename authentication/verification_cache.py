@@ -0,0 +1,159 @@
+import hashlib
+import re
+import threading
+import time
+
+import google.auth.transport.requests
+from cachetools import TLRUCache
+from google.oauth2.id_token import verify_oauth2_token
+
+TOKEN_CACHE_MAXSIZE = 4096
+TOKEN_CACHE_MAX_TTL = 300
+CERTS_DEFAULT_MAX_AGE = 300
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class CachedCertsRequest(google.auth.transport.requests.Request):
+    """
+    Transport request that caches GET responses according to their `Cache-Control` header.
+
+    Google's signing certificates are served with a `max-age` directive, so the certificate
+    payload only needs to be fetched once per expiry window instead of on every verification.
+    A single `requests.Session` is reused so certificate refreshes keep the connection pool warm.
+
+    Attributes:
+        hits (int): Number of requests answered from the cache.
+        misses (int): Number of requests that reached the network.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._responses = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, url, method="GET", body=None, **kwargs):
+        if method != "GET" or body is not None:
+            return super().__call__(url, method=method, body=body, **kwargs)
+
+        now = time.time()
+        with self._lock:
+            cached = self._responses.get(url)
+            if cached and cached[0] > now:
+                self.hits += 1
+                return cached[1]
+
+        response = super().__call__(url, method=method, **kwargs)
+        self.misses += 1
+        if response.status == 200:
+            expires_at = now + self.get_max_age(response.headers)
+            with self._lock:
+                self._responses[url] = (expires_at, response)
+        return response
+
+    @staticmethod
+    def get_max_age(headers):
+        """
+        Extracts the `max-age` directive from a response's `Cache-Control` header.
+
+        Args:
+            headers (Mapping): The response headers.
+
+        Returns:
+            int: Seconds the response may be reused, or `CERTS_DEFAULT_MAX_AGE` if absent.
+        """
+        cache_control = headers.get("Cache-Control") or headers.get("cache-control") or ""
+        match = _MAX_AGE_RE.search(cache_control)
+        return int(match.group(1)) if match else CERTS_DEFAULT_MAX_AGE
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of successfully verified Google ID tokens.
+
+    Tokens are keyed by their SHA-256 hash so raw bearer tokens are never kept in memory
+    as dictionary keys. Each entry lives at most `max_ttl` seconds and never past the
+    token's own `exp` claim, so an expired token always falls through to full verification.
+
+    Attributes:
+        request (CachedCertsRequest): Transport used to fetch Google's signing certificates.
+        hits (int): Number of verifications served from the cache.
+        misses (int): Number of verifications that required signature checks.
+    """
+
+    def __init__(self, maxsize=TOKEN_CACHE_MAXSIZE, max_ttl=TOKEN_CACHE_MAX_TTL):
+        self.max_ttl = max_ttl
+        self.request = CachedCertsRequest()
+        self._tokens = TLRUCache(maxsize=maxsize, ttu=self._time_to_use, timer=time.time)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _time_to_use(self, key, id_info, now):
+        expires_at = id_info.get("exp") or now
+        return min(expires_at, now + self.max_ttl)
+
+    @staticmethod
+    def get_key(token):
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def verify(self, token, audience):
+        """
+        Returns the claims of a Google ID token, verifying it only on a cache miss.
+
+        Args:
+            token (str): The raw ID token.
+            audience (str): The expected client ID.
+
+        Returns:
+            dict: The decoded token claims.
+
+        Raises:
+            ValueError: If the token is invalid or expired.
+        """
+        key = self.get_key(token)
+        with self._lock:
+            id_info = self._tokens.get(key)
+            if id_info is not None:
+                self.hits += 1
+                return id_info
+            self.misses += 1
+
+        id_info = verify_oauth2_token(token, self.request, audience=audience)
+        with self._lock:
+            self._tokens[key] = id_info
+        return id_info
+
+    def stats(self):
+        """
+        Returns the hit/miss counters of the token and certificate caches.
+        """
+        with self._lock:
+            return {
+                "tokens": {
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "size": self._tokens.currsize,
+                    "maxsize": self._tokens.maxsize,
+                },
+                "certs": {
+                    "hits": self.request.hits,
+                    "misses": self.request.misses,
+                },
+            }
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+            self.hits = 0
+            self.misses = 0
+        self.request.clear()
+
+
+token_cache = VerifiedTokenCache()
@@ -2,13 +2,14 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework import status, viewsets
 from rest_framework.authtoken.models import Token
-from rest_framework.exceptions import PermissionDenied
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from authentication.hybrid_authentication import HybridAuthentication
+from authentication.hybrid_authentication import BaseOAuth2Authentication, HybridAuthentication
 from authentication.serializers import AuthorizedUserSerializer
+from authentication.session_tokens import SessionToken, issue_session_token
 
 from .models import AuthorizedUser
 
@@ -72,6 +73,57 @@ class LoginView(APIView):
             )
 
 
+class SessionTokenView(APIView):
+    """
+    API View that exchanges a Google ID token for a short-lived local session token.
+
+    The Google ID token is verified once here; the returned session token is then accepted as a
+    bearer token by `IdPAuthentication` and `HybridAuthentication`, which verify it locally with
+    an HMAC check instead of re-verifying the Google token and querying the database.
+
+    Methods:
+        post: Verifies the Google ID token and returns a session token.
+
+    Workflow:
+        1. The client submits a Google ID token as `id_token`.
+        2. The token is verified and its institutional email extracted.
+        3. The matching `PersonalInformation` and active `AuthorizedUser` ids are embedded in a new token.
+        4. Returns the token and its lifetime in seconds, or an error if the email matches no one.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        id_token = request.data.get("id_token")
+        if not id_token:
+            return Response(
+                {"error": "id_token is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            institutional_email = BaseOAuth2Authentication().authenticate_bearer_token(id_token)
+        except AuthenticationFailed as e:
+            return Response({"error": str(e.detail)}, status=status.HTTP_401_UNAUTHORIZED)
+
+        token = issue_session_token(institutional_email)
+        if token is None:
+            return Response(
+                {"error": "User not found with this email"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {
+                "access": str(token),
+                "token_type": "Bearer",
+                "expires_in": int(SessionToken.lifetime.total_seconds()),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class AuthorizedUserViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing authorized users.
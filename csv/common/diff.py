@@ -0,0 +1,266 @@
+"""
+Diff of two CSV extracts of the same people, matched by a key column (`identity_number`).
+
+Two strategies produce the same rows:
+
+- Indexed (default): the old file is loaded into a dictionary keyed by the key column and the
+  new file is streamed against it, so each file is read once. Rows come out in the new file's
+  order, followed by the deleted rows in the old file's order.
+- Sorted merge: both files are sorted by key in runs of `run_size` rows spilled to temporary
+  files, then merged like a join. Memory stays bounded by the run size, for extracts that do
+  not fit comfortably in memory. Rows come out in key order.
+
+When a key is repeated, its first row in the old file is the one every new row is compared to.
+"""
+
+import csv
+import heapq
+import tempfile
+import time
+from contextlib import ExitStack
+from itertools import groupby, islice
+from operator import itemgetter
+
+DEFAULT_KEY = "identity_number"
+MERGE_RUN_SIZE = 100_000
+NEW_ROW = "New row"
+
+
+class DiffReport:
+    """
+    Counters of a CSV diff run.
+    """
+
+    def __init__(self):
+        self.new = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.deleted = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    def summary(self):
+        return (
+            f"{self.new} new, {self.changed} changed, {self.unchanged} unchanged, "
+            f"{self.deleted} deleted in {self.elapsed:.1f}s"
+        )
+
+
+def key_position(header, key, path):
+    try:
+        return header.index(key)
+    except ValueError:
+        raise ValueError(f"Column '{key}' not found in {path}")
+
+
+def padded(rows, width):
+    """
+    Pad short rows with empty values, so every row has a value for every column.
+    """
+    for row in rows:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        yield row
+
+
+class CsvDiff:
+    """
+    Compares an old and a new CSV extract row by row, matched by `key`.
+
+    The columns of the old file are the ones compared; a column the new file lacks counts as
+    changed. `rows()` yields `(kind, values, changed_columns)` tuples, where `kind` is "new",
+    "changed" or "deleted", `values` the row in its own file's column order and
+    `changed_columns` the names of the columns that differ (changed rows only). Unchanged rows
+    are only counted, in `report`.
+
+    :param old_file: Path of the previous extract.
+    :param new_file: Path of the current extract.
+    :param key: Column identifying a person in both files.
+    """
+
+    def __init__(self, old_file, new_file, key=DEFAULT_KEY):
+        self.old_file = old_file
+        self.new_file = new_file
+        self.key = key
+        self.old_header = self.read_header(old_file)
+        self.new_header = self.read_header(new_file)
+        self.old_key = key_position(self.old_header, key, old_file)
+        self.new_key = key_position(self.new_header, key, new_file)
+        positions = {column: i for i, column in enumerate(self.new_header)}
+        self.aligned = [positions.get(column) for column in self.old_header]
+        self.same_columns = self.aligned == list(range(len(self.old_header)))
+        self.report = DiffReport()
+
+    @staticmethod
+    def read_header(path):
+        with open(path, newline="", encoding="utf-8") as csvfile:
+            return next(csv.reader(csvfile), [])
+
+    def read(self, path, header):
+        """
+        Stream the rows of a CSV file, without its header.
+        """
+        with open(path, newline="", encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader, None)
+            yield from padded(reader, len(header))
+
+    def changed_columns(self, old_row, new_row):
+        """
+        Names of the old file's columns whose value differs in `new_row`.
+        """
+        if self.same_columns and old_row == new_row:
+            return []
+        return [
+            column
+            for column, old_value, position in zip(self.old_header, old_row, self.aligned)
+            if position is None or new_row[position] != old_value
+        ]
+
+    def compare(self, old_row, new_row):
+        if old_row is None:
+            self.report.new += 1
+            return "new", new_row, None
+        changed = self.changed_columns(old_row, new_row)
+        if not changed:
+            self.report.unchanged += 1
+            return None
+        self.report.changed += 1
+        return "changed", new_row, changed
+
+    def rows(self, sort=False, run_size=MERGE_RUN_SIZE):
+        """
+        Yield the new, changed and deleted rows.
+
+        :param sort: Use the sorted-merge strategy instead of indexing the old file.
+        :param run_size: Rows sorted in memory at a time in the sorted-merge strategy.
+        """
+        rows = self.merged(run_size) if sort else self.indexed()
+        for row in rows:
+            if row is not None:
+                yield row
+        self.report.finished = time.monotonic()
+
+    def indexed(self):
+        old_rows = {}
+        for row in self.read(self.old_file, self.old_header):
+            old_rows.setdefault(row[self.old_key], row)
+
+        seen = set()
+        for row in self.read(self.new_file, self.new_header):
+            key = row[self.new_key]
+            seen.add(key)
+            yield self.compare(old_rows.get(key), row)
+
+        for key, row in old_rows.items():
+            if key not in seen:
+                self.report.deleted += 1
+                yield "deleted", row, None
+
+    def merged(self, run_size):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_groups = groupby(
+                self.sorted_rows(self.old_file, self.old_header, self.old_key, run_size, tmpdir),
+                key=itemgetter(self.old_key),
+            )
+            new_groups = groupby(
+                self.sorted_rows(self.new_file, self.new_header, self.new_key, run_size, tmpdir),
+                key=itemgetter(self.new_key),
+            )
+            old = next(old_groups, None)
+            new = next(new_groups, None)
+            while old is not None or new is not None:
+                if new is None or (old is not None and old[0] < new[0]):
+                    self.report.deleted += 1
+                    yield "deleted", next(old[1]), None
+                    old = next(old_groups, None)
+                elif old is None or new[0] < old[0]:
+                    for row in new[1]:
+                        yield self.compare(None, row)
+                    new = next(new_groups, None)
+                else:
+                    old_row = next(old[1])
+                    for row in new[1]:
+                        yield self.compare(old_row, row)
+                    old = next(old_groups, None)
+                    new = next(new_groups, None)
+
+    def sorted_rows(self, path, header, key, run_size, tmpdir):
+        """
+        Stream the rows of a CSV file sorted by the `key` column.
+
+        The file is sorted in runs of `run_size` rows; when there is more than one run, each is
+        spilled to a temporary file and the runs are merged. The sort is stable, so rows sharing
+        a key keep their file order.
+        """
+        rows = self.read(path, header)
+        runs = []
+        try:
+            while run := list(islice(rows, run_size)):
+                run.sort(key=itemgetter(key))
+                if not runs and len(run) < run_size:
+                    yield from run
+                    return
+                run_file = tempfile.TemporaryFile(
+                    "w+", newline="", encoding="utf-8", dir=tmpdir
+                )
+                csv.writer(run_file).writerows(run)
+                run_file.seek(0)
+                runs.append(run_file)
+            readers = [padded(csv.reader(run_file), len(header)) for run_file in runs]
+            yield from heapq.merge(*readers, key=itemgetter(key))
+        finally:
+            for run_file in runs:
+                run_file.close()
+
+
+def compare_csv_files(
+    old_file,
+    new_file,
+    output_file,
+    deleted_file=None,
+    key=DEFAULT_KEY,
+    sort=False,
+    run_size=MERGE_RUN_SIZE,
+):
+    """
+    Compare two CSV extracts and save the new or modified rows to an output file.
+
+    The output has the new file's columns plus "changed_columns", holding "New row" or the
+    comma-separated names of the columns that changed.
+
+    :param old_file: Path of the previous extract.
+    :param new_file: Path of the current extract.
+    :param output_file: Destination of the new and changed rows.
+    :param deleted_file: Destination of the rows missing from the new file, or None to only
+                         count them.
+    :param key: Column identifying a person in both files.
+    :param sort: Use the sorted-merge strategy, for files that do not fit in memory.
+    :param run_size: Rows sorted in memory at a time in the sorted-merge strategy.
+    :return: The `DiffReport` of the run.
+    """
+    diff = CsvDiff(old_file, new_file, key=key)
+    with ExitStack() as files:
+        writer = csv.writer(
+            files.enter_context(open(output_file, mode="w", newline="", encoding="utf-8"))
+        )
+        writer.writerow(diff.new_header + ["changed_columns"])
+        deleted_writer = None
+        if deleted_file:
+            deleted_writer = csv.writer(
+                files.enter_context(open(deleted_file, mode="w", newline="", encoding="utf-8"))
+            )
+            deleted_writer.writerow(diff.old_header)
+
+        for kind, values, changed in diff.rows(sort=sort, run_size=run_size):
+            if kind == "new":
+                writer.writerow(values + [NEW_ROW])
+            elif kind == "changed":
+                writer.writerow(values + [", ".join(changed)])
+            elif deleted_writer is not None:
+                deleted_writer.writerow(values)
+    return diff.report
@@ -0,0 +1,146 @@
+"""
+Row fingerprints for incremental CSV imports.
+
+Each imported row leaves a hash of its normalized values in `ImportFingerprint`, keyed by the
+import source and the row's business id. The next import of the same source loads those hashes
+in one query and only writes the rows that are new or whose hash changed, so a monthly refresh
+costs in proportion to the churn instead of the population.
+"""
+
+import hashlib
+import json
+
+from django.db import transaction
+from django.utils import timezone
+
+from evoti.detail_cache import detail_cache
+from evoti.models import ImportFingerprint
+from evoti.statistics import statistics_cache
+from santander.documents import invalidate_credentials
+
+BATCH_SIZE = 500
+
+
+def row_fingerprint(values):
+    """
+    SHA-256 of a CSV row, insensitive to column order and to surrounding whitespace.
+
+    :param values: Dict of column -> value of the row.
+    """
+    normalized = {str(column): str(value).strip() for column, value in values.items()}
+    content = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """
+    The fingerprints of one import source, and the profiles (`Student`, `Professor`,
+    `StaffProfile`) they activate and deactivate.
+
+    :param source: One of `ImportFingerprint.Source`.
+    :param profile_model: Model holding the business id and the `is_active` flag.
+    :param key_field: Field of `profile_model` holding the business id.
+    """
+
+    def __init__(self, source, profile_model, key_field):
+        self.source = source
+        self.profile_model = profile_model
+        self.key_field = key_field
+        self.known = None
+
+    def fingerprints(self):
+        return ImportFingerprint.objects.filter(source=self.source)
+
+    def load(self):
+        """
+        Load the hashes of the people currently imported from the source, in one query.
+        Deactivated people are left out, so their rows are written again if they reappear.
+        """
+        self.known = dict(
+            self.fingerprints()
+            .filter(deactivated_at__isnull=True)
+            .values_list("business_key", "fingerprint")
+        )
+
+    def is_unchanged(self, key, fingerprint):
+        return self.known.get(key) == fingerprint
+
+    def write(self, rows):
+        """
+        Store the hashes of written rows and reactivate the people they bring back.
+
+        Called inside the chunk's transaction, so a row whose write is rolled back keeps its
+        previous hash and is retried by the next import.
+
+        :param rows: List of (business id, fingerprint, `PersonalInformation` id) triples.
+        """
+        if not rows:
+            return
+        existing = {
+            obj.business_key: obj
+            for obj in self.fingerprints().filter(business_key__in=[key for key, _, _ in rows])
+        }
+        now = timezone.now()
+        created, updated, reactivated = [], [], []
+        for key, fingerprint, person_id in rows:
+            obj = existing.get(key)
+            if obj is None:
+                created.append(
+                    ImportFingerprint(
+                        source=self.source,
+                        business_key=key,
+                        fingerprint=fingerprint,
+                        person_id=person_id,
+                        imported_at=now,
+                    )
+                )
+                continue
+            if obj.deactivated_at is not None:
+                reactivated.append(key)
+            obj.fingerprint = fingerprint
+            obj.person_id = person_id
+            obj.imported_at = now
+            obj.deactivated_at = None
+            updated.append(obj)
+
+        ImportFingerprint.objects.bulk_create(created, batch_size=BATCH_SIZE)
+        ImportFingerprint.objects.bulk_update(
+            updated,
+            ["fingerprint", "person_id", "imported_at", "deactivated_at"],
+            batch_size=BATCH_SIZE,
+        )
+        if reactivated:
+            self.profile_model.objects.filter(**{f"{self.key_field}__in": reactivated}).update(
+                is_active=True
+            )
+
+    def deactivate_missing(self, present):
+        """
+        Deactivate the people imported from the source whose business id is not in `present`.
+
+        Only people written by an earlier import of the source are considered, so profiles
+        created by other means are never touched.
+
+        :param present: Set of every business id in the current extract, valid rows or not.
+        :return: Number of people deactivated.
+        """
+        missing = [
+            (key, person_id)
+            for key, person_id in self.fingerprints()
+            .filter(deactivated_at__isnull=True)
+            .values_list("business_key", "person_id")
+            if key not in present
+        ]
+        now = timezone.now()
+        for start in range(0, len(missing), BATCH_SIZE):
+            batch = missing[start : start + BATCH_SIZE]
+            keys = [key for key, _ in batch]
+            with transaction.atomic():
+                self.profile_model.objects.filter(**{f"{self.key_field}__in": keys}).update(
+                    is_active=False
+                )
+                self.fingerprints().filter(business_key__in=keys).update(deactivated_at=now)
+                invalidate_credentials(person_id__in=[person_id for _, person_id in batch])
+                detail_cache.invalidate()
+                statistics_cache.invalidate()
+        return len(missing)
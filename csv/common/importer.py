@@ -0,0 +1,943 @@
+"""
+Set-based import of people from the cleaned CSV files.
+
+Django must be configured before this module is imported. Rows are validated up front, the
+people that already exist are found by institutional email in a single query, and every model
+is then written with `bulk_create` / `bulk_update` in dependency order, one transaction per
+chunk of rows. The references (universities, notifications, careers, subjects) of the whole file
+are loaded beforehand, see `common.references`. A chunk that fails in the database is retried row
+by row, so only the offending rows end up in the error file.
+
+Incremental imports skip the rows whose fingerprint is unchanged since the last import and can
+deactivate the people missing from the file, see `common.fingerprints`.
+"""
+
+import datetime
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+
+import pandas as pd
+from django.db import transaction
+
+from common.fingerprints import FingerprintStore, row_fingerprint
+from common.references import (
+    UnknownReference,
+    career_table,
+    notification_table,
+    subject_table,
+    university_table,
+)
+from evoti.bulk import bulk_insert
+from evoti.detail_cache import detail_cache
+from evoti.models import ImportFingerprint
+from evoti.statistics import statistics_cache
+from santander.documents import invalidate_credentials
+from uvaq.models import (
+    AcademicPeriod,
+    AcademicProfile,
+    AccessControl,
+    AdmissionData,
+    Career,
+    ContactInformation,
+    EmergencyInformation,
+    Enrollment,
+    FinancialInformation,
+    Identification,
+    InsuranceInformation,
+    PersonalInformation,
+    Professor,
+    ProfessorSubject,
+    Role,
+    StaffProfile,
+    Student,
+    SubjectStatus,
+    UserUniversity,
+    Vehicle,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+BULK_BATCH_SIZE = 500
+INSTITUTIONAL_DOMAIN = "@uvaq.edu.mx"
+
+
+class RowError(ValueError):
+    """A row that cannot be imported; the message goes to the error file."""
+
+
+class ImportReport:
+    """
+    Counters, throughput and per-row errors of an import run.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deactivated = 0
+        self.errors = []
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def failed(self):
+        return len(self.errors)
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rows_per_second(self):
+        processed = self.inserted + self.updated + self.unchanged + self.failed
+        return processed / self.elapsed if self.elapsed else 0.0
+
+    def add_error(self, number, values, error):
+        self.errors.append({"row": number, "error": str(error), **values})
+
+    def summary(self):
+        return (
+            f"{self.rows} rows: {self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.failed} failed, {self.deactivated} deactivated "
+            f"in {self.elapsed:.1f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+    def write_errors(self, path):
+        """
+        Write the rejected rows, with their CSV line number and error, to a CSV file.
+
+        :param path: Destination of the error file.
+        """
+        errors = sorted(self.errors, key=lambda error: error["row"])
+        pd.DataFrame(errors, columns=self.error_columns()).to_csv(
+            path, index=False, encoding="utf-8"
+        )
+
+    def error_columns(self):
+        columns = {"row": None, "error": None}
+        for error in self.errors:
+            columns.update(dict.fromkeys(error))
+        return list(columns)
+
+
+class ImportRow:
+    """
+    A validated CSV row, plus the people and references it resolves to while importing.
+    """
+
+    def __init__(self, number, values):
+        self.number = number
+        self.values = values
+        self.data = {}
+        self.fingerprint = None
+        self.person_id = None
+        self.person = None
+
+    def __getitem__(self, column):
+        return self.values.get(column, "")
+
+
+def parse_json(row, column, default):
+    value = row[column]
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as e:
+        raise RowError(f"Invalid JSON in column '{column}': {e}")
+
+
+def parse_date(value, column):
+    try:
+        return datetime.date.fromisoformat(value.strip()[:10])
+    except ValueError:
+        raise RowError(f"Invalid date in column '{column}': '{value}'")
+
+
+def assign(obj, values):
+    """
+    Set the values that differ from the instance's current ones and return their field names.
+
+    Values are converted with the field's `to_python` first, so "2024-08-01" equals the stored
+    date and unchanged rows are left out of the `bulk_update`.
+    """
+    changed = set()
+    for name, value in values.items():
+        value = obj._meta.get_field(name).to_python(value)
+        if getattr(obj, name) != value:
+            setattr(obj, name, value)
+            changed.add(name)
+    return changed
+
+
+def upsert(model, key, items):
+    """
+    Insert or update rows of `model` identified by the value of their `key` field.
+
+    Existing rows are loaded with one query and the changed ones written with one `bulk_update`;
+    the rest are inserted with `bulk_insert`, which sets their primary keys.
+
+    :param model: The model to write.
+    :param key: Field identifying a row, e.g. "user_id" or "plate_number".
+    :param items: List of (key value, field values) pairs; the last pair of a key wins.
+    :return: Dict of key value -> saved instance.
+    """
+    items = dict(items)
+    if not items:
+        return {}
+    existing = {}
+    for obj in model.objects.filter(**{f"{key}__in": list(items)}).order_by("pk"):
+        existing.setdefault(getattr(obj, key), obj)
+
+    rows, created, updated, fields = {}, [], [], set()
+    for value, values in items.items():
+        obj = existing.get(value)
+        if obj is None:
+            obj = model(**{key: value}, **values)
+            created.append(obj)
+        else:
+            changed = assign(obj, values)
+            if changed:
+                fields.update(changed)
+                updated.append(obj)
+        rows[value] = obj
+
+    bulk_insert(model, created)
+    if updated:
+        model.objects.bulk_update(updated, sorted(fields), batch_size=BULK_BATCH_SIZE)
+    return rows
+
+
+class PersonImporter(ABC):
+    """
+    Imports one kind of person (students, professors or staff) from a cleaned CSV DataFrame.
+
+    Subclasses set the role, the fingerprint source, the profile model and the column holding
+    the business id, and add the rows specific to the role in `prepare` and `write_profiles`.
+
+    :param df: The cleaned CSV file.
+    :param chunk_size: Rows written per transaction.
+    :param log: Logger for progress messages.
+    :param incremental: Skip the rows unchanged since the last import of the source.
+    :param deactivate_missing: Deactivate the previously imported people absent from the file.
+    """
+
+    role = None
+    source = None
+    profile_model = None
+    identifier_column = None
+
+    def __init__(
+        self,
+        df,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        log=None,
+        incremental=False,
+        deactivate_missing=False,
+    ):
+        self.df = df.fillna("").astype(str)
+        self.chunk_size = chunk_size
+        self.log = log or logger
+        self.incremental = incremental
+        self.deactivate_missing = deactivate_missing
+        self.report = ImportReport()
+        self.references = {}
+        self.fingerprints = FingerprintStore(
+            self.source, self.profile_model, self.identifier_column
+        )
+
+    def run(self):
+        """
+        Import every row of the DataFrame and return the `ImportReport`.
+        """
+        rows = self.parse()
+        if self.incremental:
+            rows = self.skip_unchanged(rows)
+        rows = self.resolve(self.find_existing(rows))
+
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start : start + self.chunk_size]
+            try:
+                with transaction.atomic():
+                    self.write(chunk)
+            except Exception as e:
+                self.log.warning(
+                    f"Chunk at row {chunk[0].number if chunk else start} failed ({e}); "
+                    "retrying row by row."
+                )
+                chunk = self.write_each(chunk)
+            self.count(chunk)
+            self.log.info(
+                f"{min(start + self.chunk_size, len(rows))}/{len(rows)} rows imported "
+                f"({self.report.rows_per_second:.0f} rows/s)"
+            )
+
+        if self.deactivate_missing:
+            self.deactivate()
+        self.report.finished = time.monotonic()
+        return self.report
+
+    def write_each(self, chunk):
+        written = []
+        for row in chunk:
+            row.person = None
+            try:
+                with transaction.atomic():
+                    self.write([row])
+            except Exception as e:
+                self.report.add_error(row.number, row.values, e)
+            else:
+                written.append(row)
+        return written
+
+    def count(self, chunk):
+        for row in chunk:
+            if row.person_id:
+                self.report.updated += 1
+            else:
+                self.report.inserted += 1
+
+    # Validation
+
+    def parse(self):
+        """
+        Validate every row, reporting the rejected ones, and return the valid `ImportRow`s.
+        """
+        records = self.df.to_dict("records")
+        self.report.rows = len(records)
+        duplicated_photo = (
+            self.df["photo"].duplicated(keep=False).tolist()
+            if "photo" in self.df
+            else [False] * len(records)
+        )
+
+        rows, seen = [], {}
+        # Line numbers count the header as line 1.
+        for number, (values, is_duplicate) in enumerate(zip(records, duplicated_photo), start=2):
+            row = ImportRow(number, values)
+            try:
+                self.validate(row, is_duplicate)
+                for key in ("email", "curp", "identifier"):
+                    if row.data[key] in seen.setdefault(key, set()):
+                        raise RowError(f"Duplicated {key} in the file: {row.data[key]}")
+                    seen[key].add(row.data[key])
+            except RowError as e:
+                self.report.add_error(number, values, e)
+                continue
+            row.fingerprint = row_fingerprint(values)
+            rows.append(row)
+        return rows
+
+    def validate(self, row, is_duplicate):
+        first_name = row["first_name"] or row["name"]
+        last_name = row["last_name"]
+        second_last_name = row["second_last_name"]
+
+        institutional_email = row["institutional_email"].strip().lower()
+        if not institutional_email.endswith(INSTITUTIONAL_DOMAIN):
+            raise RowError(
+                f"The institutional email '{institutional_email}' does not have the mandatory "
+                f"domain '{INSTITUTIONAL_DOMAIN}'."
+            )
+        curp = row["curp"].strip().upper()
+        if not curp:
+            raise RowError(f"The CURP for {first_name} {last_name} is incorrect.")
+        if is_duplicate:
+            raise RowError(
+                f"Duplicated found: {row['photo']} for {first_name} {last_name} "
+                f"{second_last_name}"
+            )
+        if not row["identity_number"]:
+            raise RowError(
+                f"The identity number for {first_name} {last_name} {second_last_name} "
+                "is incorrect."
+            )
+        identifier = row[self.identifier_column].strip()
+        if not identifier:
+            raise RowError(f"Missing {self.identifier_column}.")
+
+        vehicles = parse_json(row, "vehicle_details", [])
+        row.data.update(
+            first_name=first_name,
+            email=institutional_email,
+            curp=curp,
+            identifier=identifier,
+            vehicles=vehicles,
+            biometric_data=parse_json(row, "biometric_data", []),
+            access_devices=parse_json(row, "access_devices", []),
+            notifications=[
+                notification["name"]
+                for notification in parse_json(row, "optional_notifications", [])
+            ],
+            birth_date=parse_date(row["birth_date"], "birth_date"),
+            enrollment_date=parse_date(row["enrollment_date"], "enrollment_date"),
+        )
+        for vehicle in vehicles:
+            if not vehicle.get("plate_number"):
+                raise RowError("Vehicle without plate_number.")
+
+    def find_existing(self, rows):
+        """
+        Match rows to existing people by institutional email, in one query, and reject the rows
+        whose CURP already belongs to someone else.
+        """
+        people = dict(
+            ContactInformation.objects.filter(
+                institutional_email__in=[row.data["email"] for row in rows],
+            ).values_list("institutional_email", "user_id")
+        )
+        curps = dict(
+            Identification.objects.filter(
+                curp__in=[row.data["curp"] for row in rows],
+            ).values_list("curp", "user_id")
+        )
+        matched = []
+        for row in rows:
+            row.person_id = people.get(row.data["email"])
+            owner = curps.get(row.data["curp"], row.person_id)
+            if owner != row.person_id:
+                error = f"The CURP {row.data['curp']} belongs to another person."
+                self.report.add_error(row.number, row.values, error)
+                continue
+            matched.append(row)
+        return matched
+
+    # Fingerprints
+
+    def skip_unchanged(self, rows):
+        """
+        Drop the rows whose fingerprint matches the last import, counting them as unchanged.
+        """
+        self.fingerprints.load()
+        changed = []
+        for row in rows:
+            if self.fingerprints.is_unchanged(row.data["identifier"], row.fingerprint):
+                self.report.unchanged += 1
+            else:
+                changed.append(row)
+        self.log.info(f"{self.report.unchanged} rows unchanged since the last import.")
+        return changed
+
+    def deactivate(self):
+        if self.identifier_column not in self.df:
+            self.log.warning(
+                f"No {self.identifier_column} column in the file; nobody was deactivated."
+            )
+            return
+        present = set(self.df[self.identifier_column].str.strip())
+        self.report.deactivated = self.fingerprints.deactivate_missing(present)
+        self.log.info(f"{self.report.deactivated} people missing from the file deactivated.")
+
+    # References
+
+    def reference_tables(self):
+        return {
+            "universities": university_table(),
+            "notifications": notification_table(self.role),
+        }
+
+    def reference_keys(self, rows):
+        """
+        The distinct values each reference table is looked up by, across the whole file.
+        """
+        return {
+            "universities": {
+                (row["university_identifier"], row["university_name"]) for row in rows
+            },
+            "notifications": {name for row in rows for name in row.data["notifications"]},
+        }
+
+    def load_references(self, rows):
+        """
+        Load every reference the file points to, one query per table, creating the missing
+        subjects, notifications and (for professors) careers in one bulk insert each.
+        """
+        self.references = self.reference_tables()
+        for table, keys in self.reference_keys(rows).items():
+            self.references[table].load(keys)
+            created = self.references[table].created
+            if created:
+                self.log.info(f"Created {created} missing {table}.")
+
+    def reference(self, table, key):
+        references = self.references[table]
+        try:
+            return references[key]
+        except UnknownReference:
+            raise RowError(f"Unknown {references.model._meta.verbose_name}: {key}")
+
+    def resolve(self, rows):
+        """
+        Resolve the references of every row, reporting and dropping the rows that point to
+        unknown ones, so the write stage only does dictionary lookups.
+        """
+        self.load_references(rows)
+        resolved = []
+        for row in rows:
+            try:
+                self.prepare(row)
+            except RowError as e:
+                self.report.add_error(row.number, row.values, e)
+            else:
+                resolved.append(row)
+        return resolved
+
+    def prepare(self, row):
+        row.data["university_id"] = self.reference(
+            "universities", (row["university_identifier"], row["university_name"])
+        )
+        row.data["notification_ids"] = [
+            self.reference("notifications", name) for name in row.data["notifications"]
+        ]
+        row.data["career_id"] = None
+
+    # Writing
+
+    def write(self, chunk):
+        self.write_people(chunk)
+        self.write_details(chunk)
+        self.write_profiles(chunk)
+        self.write_access(chunk)
+        self.write_user_university(chunk)
+        # bulk_create / bulk_update send no signals: drop what the chunk changed once it commits.
+        invalidate_credentials(person_id__in=[row.person_id for row in chunk if row.person_id])
+        detail_cache.invalidate()
+        statistics_cache.invalidate()
+        self.fingerprints.write(
+            [(row.data["identifier"], row.fingerprint, row.person.pk) for row in chunk]
+        )
+
+    def write_people(self, chunk):
+        existing = PersonalInformation.objects.in_bulk(
+            [row.person_id for row in chunk if row.person_id]
+        )
+        created, updated, fields = [], [], set()
+        for row in chunk:
+            values = {
+                "first_name": row.data["first_name"],
+                "last_name": row["last_name"],
+                "second_last_name": row["second_last_name"],
+                "birth_date": row.data["birth_date"],
+                "gender": row["gender"],
+                "photo": row["photo"],
+                "digital_signature": row["digital_signature"],
+            }
+            row.person = existing.get(row.person_id)
+            if row.person is None:
+                row.person = PersonalInformation(role=self.role, **values)
+                created.append(row.person)
+            else:
+                changed = assign(row.person, values)
+                if changed:
+                    fields.update(changed)
+                    updated.append(row.person)
+        bulk_insert(PersonalInformation, created)
+        if updated:
+            PersonalInformation.objects.bulk_update(
+                updated, sorted(fields), batch_size=BULK_BATCH_SIZE
+            )
+
+    def one_to_one(self, model, chunk, values, key="user_id"):
+        return upsert(model, key, [(row.person.pk, values(row)) for row in chunk])
+
+    def write_details(self, chunk):
+        self.one_to_one(
+            ContactInformation,
+            chunk,
+            lambda row: {
+                "phone": row["phone"],
+                "cell_phone": row["cell_phone"],
+                "personal_email": row["personal_email"],
+                "institutional_email": row.data["email"],
+                "preferred_contact_method": row["preferred_contact_method"],
+            },
+        )
+        self.one_to_one(
+            Identification,
+            chunk,
+            lambda row: {
+                "curp": row.data["curp"],
+                "identity_number": row["identity_number"],
+                "nationality": row["nationality"] or "MX",
+            },
+        )
+        self.one_to_one(
+            EmergencyInformation,
+            chunk,
+            lambda row: {
+                "name": row["emergency_name"],
+                "phone": row["emergency_phone"],
+                "relationship": row["emergency_relationship"],
+            },
+        )
+
+    @abstractmethod
+    def write_profiles(self, chunk):
+        """
+        Write the role profile (student, professor or staff) of each row, and its related rows.
+        """
+
+    def write_access(self, chunk):
+        """
+        Write vehicles, their insurance and the access control linking them to their owner.
+        """
+        chunk = [row for row in chunk if row.data["vehicles"]]
+        vehicles = upsert(
+            Vehicle,
+            "plate_number",
+            [
+                (
+                    vehicle["plate_number"],
+                    {
+                        "owner_id": row.person.pk,
+                        "model": vehicle.get("model", ""),
+                        "vehicle_type": vehicle.get("vehicle_type", ""),
+                        "color": vehicle.get("color", ""),
+                        "year": vehicle.get("year") or 0,
+                        "make": vehicle.get("make", ""),
+                    },
+                )
+                for row in chunk
+                for vehicle in row.data["vehicles"]
+            ],
+        )
+        upsert(
+            InsuranceInformation,
+            "policy_number",
+            [
+                (
+                    vehicle["insurance_policy_number"],
+                    {
+                        "vehicle_id": vehicles[vehicle["plate_number"]].pk,
+                        "provider": vehicle.get("insurance_provider", ""),
+                    },
+                )
+                for row in chunk
+                for vehicle in row.data["vehicles"]
+                if vehicle.get("insurance_policy_number")
+            ],
+        )
+
+        access = self.one_to_one(AccessControl, chunk, self.access_values)
+        links = AccessControl.vehicle.through
+        links.objects.filter(accesscontrol_id__in=[obj.pk for obj in access.values()]).delete()
+        links.objects.bulk_create(
+            [
+                links(
+                    accesscontrol_id=access[row.person.pk].pk,
+                    vehicle_id=vehicles[vehicle["plate_number"]].pk,
+                )
+                for row in chunk
+                for vehicle in row.data["vehicles"]
+            ],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    def access_values(self, row):
+        biometric = (row.data["biometric_data"] or [{}])[0]
+        device = (row.data["access_devices"] or [{}])[0]
+        valid_from = row.data["enrollment_date"]
+        return {
+            "access_level": row["access_level"],
+            "access_hours": row["access_hours"],
+            "valid_from": valid_from,
+            "valid_until": valid_from.replace(year=valid_from.year + 1),
+            "areas_allowed": row["areas_allowed"],
+            "biometric_type": biometric.get("biometric_type", ""),
+            "data": biometric.get("data", ""),
+            "device_type": device.get("device_type", ""),
+            "device_id": device.get("device_id", ""),
+        }
+
+    def write_user_university(self, chunk):
+        links = self.one_to_one(
+            UserUniversity,
+            chunk,
+            lambda row: {
+                "user_identifier": row.data["identifier"],
+                "user_roles": self.role,
+                "mandatory_notification": self.role,
+                "enrollment_date": row.data["enrollment_date"],
+                "campus": row["campus"],
+                "career_id": row.data["career_id"],
+                "type": row["career_type"],
+                "university_id": row.data["university_id"],
+            },
+        )
+        through = UserUniversity.optional_notifications.through
+        through.objects.bulk_create(
+            [
+                through(useruniversity_id=links[row.person.pk].pk, notification_id=notification)
+                for row in chunk
+                for notification in row.data["notification_ids"]
+            ],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+class CurrentPeriodMixin:
+    """
+    Resolves the active academic period, which enrollments and course assignments hang from.
+    """
+
+    def load_references(self, rows):
+        super().load_references(rows)
+        self.active_period_id = (
+            AcademicPeriod.objects.filter(is_active=True)
+            .order_by("-start_date")
+            .values_list("pk", flat=True)
+            .first()
+        )
+
+    def current_period(self):
+        if self.active_period_id is None:
+            raise RowError("There is no active academic period.")
+        return self.active_period_id
+
+
+class StudentImporter(CurrentPeriodMixin, PersonImporter):
+    role = Role.STUDENT
+    source = ImportFingerprint.Source.STUDENTS
+    profile_model = Student
+    identifier_column = "student_id"
+
+    def validate(self, row, is_duplicate):
+        super().validate(row, is_duplicate)
+        row.data["subjects"] = parse_json(row, "subjects", [])
+        row.data["financial_info"] = parse_json(row, "financial_info", {})
+
+    def reference_tables(self):
+        # Careers are not created on the fly: a student's career needs an active study plan.
+        return {
+            **super().reference_tables(),
+            "careers": career_table(),
+            "subjects": subject_table(),
+        }
+
+    def reference_keys(self, rows):
+        return {
+            **super().reference_keys(rows),
+            "careers": {row["career"] for row in rows},
+            "subjects": {subject["name"] for row in rows for subject in row.data["subjects"]},
+        }
+
+    def load_references(self, rows):
+        super().load_references(rows)
+        self.study_plans = {}
+        for career_id, study_plan_id in (
+            Career.study_plans.through.objects.filter(
+                career_id__in=self.references["careers"].ids.values(),
+                studyplan__is_active=True,
+            )
+            .order_by("studyplan_id")
+            .values_list("career_id", "studyplan_id")
+        ):
+            self.study_plans.setdefault(career_id, study_plan_id)
+
+    def study_plan(self, career_id):
+        try:
+            return self.study_plans[career_id]
+        except KeyError:
+            raise RowError(f"Unknown study_plan: {career_id}")
+
+    def prepare(self, row):
+        super().prepare(row)
+        row.data["career_id"] = self.reference("careers", row["career"])
+        row.data["study_plan_id"] = self.study_plan(row.data["career_id"])
+        row.data["period_id"] = self.current_period()
+        row.data["subject_ids"] = [
+            self.reference("subjects", subject["name"]) for subject in row.data["subjects"]
+        ]
+
+    def write_profiles(self, chunk):
+        students = self.one_to_one(
+            Student,
+            chunk,
+            lambda row: {
+                "student_id": row.data["identifier"],
+                "career_id": row.data["career_id"],
+                "study_plan_id": row.data["study_plan_id"],
+                "admission_period_id": row.data["period_id"],
+                "current_period_id": row.data["period_id"],
+                "current_grade": row["current_grade"],
+                "campus": row["campus"],
+                "enrollment_date": row.data["enrollment_date"],
+                "admission_type": row["admission_type"] or "regular",
+                "study_modality": row["study_modality"] or "schooling",
+                "education_level": row["education_level"] or "undergraduate",
+            },
+            key="personal_info_id",
+        )
+        self.one_to_one(
+            AcademicProfile,
+            chunk,
+            lambda row: {
+                "previous_school": row["previous_school"],
+                "study_interest": row["study_interest"],
+                "academic_offer": row["academic_offer"],
+            },
+        )
+        self.one_to_one(
+            AdmissionData,
+            chunk,
+            lambda row: {
+                "found_out_through": row["found_out_through"],
+                "educational_advisor": row["educational_advisor"],
+                "comments": row["comments"],
+            },
+        )
+        self.one_to_one(
+            FinancialInformation,
+            chunk,
+            lambda row: {
+                "total_debt": row.data["financial_info"].get("total_debt", 0),
+                "overdue_balance": row.data["financial_info"].get("overdue_balance", 0),
+            },
+        )
+
+        statuses = set(SubjectStatus.values)
+        enrollments = {}
+        for row in chunk:
+            student_id = students[row.person.pk].pk
+            for subject, subject_id in zip(row.data["subjects"], row.data["subject_ids"]):
+                status = subject.get("status", "")
+                enrollments[student_id, subject_id, row.data["period_id"]] = {
+                    "enrollment_date": row.data["enrollment_date"],
+                    "final_grade": subject.get("grade") or None,
+                    "status": status if status in statuses else SubjectStatus.IN_PROGRESS,
+                    "group": subject.get("group", ""),
+                }
+        existing = {
+            (obj.student_id, obj.subject_id, obj.period_id): obj
+            for obj in Enrollment.objects.filter(
+                student_id__in={key[0] for key in enrollments}
+            )
+        }
+        created, updated, fields = [], [], set()
+        for key, values in enrollments.items():
+            obj = existing.get(key)
+            if obj is None:
+                student_id, subject_id, period_id = key
+                created.append(
+                    Enrollment(
+                        student_id=student_id, subject_id=subject_id, period_id=period_id, **values
+                    )
+                )
+            else:
+                changed = assign(obj, values)
+                if changed:
+                    fields.update(changed)
+                    updated.append(obj)
+        Enrollment.objects.bulk_create(created, batch_size=BULK_BATCH_SIZE)
+        if updated:
+            Enrollment.objects.bulk_update(updated, sorted(fields), batch_size=BULK_BATCH_SIZE)
+
+
+class ProfessorImporter(CurrentPeriodMixin, PersonImporter):
+    role = Role.PROFESSOR
+    source = ImportFingerprint.Source.PROFESSORS
+    profile_model = Professor
+    identifier_column = "professor_id"
+
+    def validate(self, row, is_duplicate):
+        super().validate(row, is_duplicate)
+        row.data["courses"] = parse_json(row, "courses_taught", [])
+        row.data["careers"] = [career["name"] for career in parse_json(row, "career", [])]
+
+    def reference_tables(self):
+        return {
+            **super().reference_tables(),
+            "careers": career_table(create=True),
+            "subjects": subject_table(),
+        }
+
+    def reference_keys(self, rows):
+        return {
+            **super().reference_keys(rows),
+            "careers": {name for row in rows for name in row.data["careers"]},
+            "subjects": {course["name"] for row in rows for course in row.data["courses"]},
+        }
+
+    def prepare(self, row):
+        super().prepare(row)
+        career_ids = [self.reference("careers", name) for name in row.data["careers"]]
+        row.data["career_id"] = career_ids[0] if career_ids else None
+        row.data["subject_ids"] = [
+            self.reference("subjects", course["name"]) for course in row.data["courses"]
+        ]
+        if row.data["courses"]:
+            row.data["period_id"] = self.current_period()
+
+    def write_profiles(self, chunk):
+        professors = self.one_to_one(
+            Professor,
+            chunk,
+            lambda row: {
+                "professor_id": row.data["identifier"],
+                "department": row["department"],
+                "work_hours": row["work_hours"],
+                "hire_date": row["hire_date"] or row.data["enrollment_date"],
+                "academic_degree": row["academic_degree"],
+                "specialization": row["specialization"],
+            },
+        )
+        # Existing assignments are kept, like `courses_taught.add()`.
+        ProfessorSubject.objects.bulk_create(
+            [
+                ProfessorSubject(
+                    professor_id=professors[row.person.pk].pk,
+                    subject_id=subject_id,
+                    period_id=row.data["period_id"],
+                    group=course.get("group", ""),
+                    classroom=course.get("classroom", ""),
+                    schedule=course.get("schedule", ""),
+                )
+                for row in chunk
+                for course, subject_id in zip(row.data["courses"], row.data["subject_ids"])
+            ],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+class StaffImporter(PersonImporter):
+    role = Role.SERVICES
+    source = ImportFingerprint.Source.STAFF
+    profile_model = StaffProfile
+    identifier_column = "staff_id"
+
+    def reference_tables(self):
+        return {**super().reference_tables(), "careers": career_table()}
+
+    def reference_keys(self, rows):
+        return {
+            **super().reference_keys(rows),
+            "careers": {row["career"] for row in rows if row["career"]},
+        }
+
+    def prepare(self, row):
+        super().prepare(row)
+        if row["career"]:
+            row.data["career_id"] = self.reference("careers", row["career"])
+
+    def write_profiles(self, chunk):
+        self.one_to_one(
+            StaffProfile,
+            chunk,
+            lambda row: {
+                "staff_id": row.data["identifier"],
+                "department": row["department"],
+                "job_title": row["job_title"],
+                "work_hours": row["work_hours"],
+                "hire_date": row["hire_date"] or row.data["enrollment_date"],
+                "staff_type": row["staff_type"] or "other",
+                "office_location": row["office_location"],
+                "extension": row["extension"],
+            },
+        )
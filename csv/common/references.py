@@ -0,0 +1,135 @@
+"""
+Preloaded reference data (subjects, notifications, universities, careers) for the CSV imports.
+
+Every distinct reference value in the file is collected before any row is written. Each table
+is then read with one query and, where the table allows it, the missing rows are created with
+one bulk insert, so the import itself only does dictionary lookups.
+"""
+
+import hashlib
+
+from django.db import transaction
+
+from evoti.bulk import bulk_insert
+from uvaq.models import Career, Notification, Subject, UniversityInfo
+
+
+class UnknownReference(KeyError):
+    """A reference value that is neither in the database nor creatable."""
+
+
+def import_code(prefix, name):
+    """
+    Build a stable unique code for a row created from a name alone, e.g. "SUB-1A2B3C4D5E".
+
+    :param prefix: Short prefix naming the table.
+    :param name: The name the row is created from.
+    """
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:10].upper()
+    return f"{prefix}-{digest}"
+
+
+class ReferenceTable:
+    """
+    Maps the distinct values of a CSV reference column to primary keys.
+
+    :param model: The referenced model.
+    :param fields: Model fields the CSV value matches; a key is a tuple when there are several.
+    :param defaults: Callable building the field values of a missing row from its key, or None
+                     when missing rows cannot be created and must be reported instead.
+    """
+
+    def __init__(self, model, fields, defaults=None):
+        self.model = model
+        self.fields = fields if isinstance(fields, tuple) else (fields,)
+        self.defaults = defaults
+        self.ids = {}
+        self.created = 0
+
+    def key(self, values):
+        return values if len(self.fields) > 1 else values[0]
+
+    def load(self, keys):
+        """
+        Read the rows matching `keys` in one query and create the missing ones if allowed.
+
+        :param keys: Set of the distinct values found in the file.
+        """
+        keys = {key for key in keys if key not in self.ids}
+        if not keys:
+            return
+        first = [key[0] for key in keys] if len(self.fields) > 1 else keys
+        rows = (
+            self.model.objects.filter(**{f"{self.fields[0]}__in": first})
+            .order_by("pk")
+            .values_list("pk", *self.fields)
+        )
+        for pk, *values in rows:
+            key = self.key(tuple(values))
+            if key in keys:
+                self.ids.setdefault(key, pk)
+
+        missing = sorted(keys - set(self.ids))
+        if missing and self.defaults is not None:
+            objs = [self.model(**self.defaults(key)) for key in missing]
+            with transaction.atomic():
+                bulk_insert(self.model, objs)
+            self.ids.update(zip(missing, (obj.pk for obj in objs)))
+            self.created += len(objs)
+
+    def __getitem__(self, key):
+        try:
+            return self.ids[key]
+        except KeyError:
+            raise UnknownReference(key)
+
+
+def subject_table():
+    return ReferenceTable(
+        Subject,
+        "name",
+        lambda name: {
+            "name": name,
+            "code": import_code("SUB", name),
+            "description": "",
+            "credits": 0,
+            "hours_per_week": 0,
+            "total_hours": 0,
+            "department": "",
+            "type": "core",
+        },
+    )
+
+
+def notification_table(role):
+    return ReferenceTable(
+        Notification,
+        "name",
+        lambda name: {
+            "name": name,
+            "notification_type": "administrative",
+            "description": "",
+            "target_roles": role,
+        },
+    )
+
+
+def university_table():
+    # Universities need an address, website, rector and foundation date the CSVs do not carry,
+    # so they are only looked up.
+    return ReferenceTable(UniversityInfo, ("identifier", "name"))
+
+
+def career_defaults(name):
+    return {
+        "name": name,
+        "code": import_code("CAR", name),
+        "description": "",
+        "duration_semesters": 0,
+        "total_credits": 0,
+        "faculty": "",
+    }
+
+
+def career_table(create=False):
+    return ReferenceTable(Career, "name", career_defaults if create else None)
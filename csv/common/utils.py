@@ -41,6 +41,61 @@ def clean_phone_number(phone):
     return phone if len(phone) == 10 else ""
 
 
+def clean_phone_numbers(phones):
+    """
+    Vectorized `clean_phone_number`: strip every non-digit character from each value and
+    blank out the numbers that do not have exactly 10 digits.
+
+    :param phones: Series of phone numbers.
+    :return: Series of cleaned phone numbers, "" where invalid or missing.
+    """
+    digits = phones.where(phones.notna(), "").astype(str).str.replace(r"\D", "", regex=True)
+    return digits.where(digits.str.len() == 10, "")
+
+
+def clean_and_cross_fill_phones(df, phone_col="phone", cell_phone_col="cell_phone"):
+    """
+    Clean both phone columns and fill each one with the other when it is empty.
+
+    :param df: DataFrame containing the phone columns.
+    :param phone_col: Name of the phone column.
+    :param cell_phone_col: Name of the cell phone column.
+    :return: DataFrame with the cleaned phone columns.
+    """
+    phone = clean_phone_numbers(df[phone_col])
+    cell_phone = clean_phone_numbers(df[cell_phone_col])
+    df[phone_col] = phone.where(phone != "", cell_phone)
+    df[cell_phone_col] = cell_phone.where(cell_phone != "", df[phone_col])
+    return df
+
+
+def map_distinct(values, function):
+    """
+    Apply `function` once per distinct value instead of once per row.
+
+    :param values: Series to map.
+    :param function: Function of a single value, e.g. `map_career_type`.
+    :return: Series with the mapped values.
+    """
+    return values.map({value: function(value) for value in values.unique()})
+
+
+def join_messages(index, conditions, sep="; "):
+    """
+    Build a column with, for each row, the messages of the conditions it meets, in order.
+
+    :param index: Index of the DataFrame the column is for.
+    :param conditions: Iterable of (boolean mask, message) pairs.
+    :param sep: Separator between the messages of a row.
+    :return: Series of joined messages, "" for rows meeting no condition.
+    """
+    messages = pd.Series("", index=index)
+    for mask, message in conditions:
+        prefix = messages.where(messages == "", messages + sep)
+        messages = messages.where(~mask, prefix + message)
+    return messages
+
+
 def merge_names(
     df, first_name_col="first_name", middle_name_col="middle_name", new_col="name"
 ):
@@ -53,12 +108,12 @@ def merge_names(
     :param new_col: Name for the combined column.
     :return: DataFrame with the new combined name column.
     """
-    df[new_col] = df.apply(
-        lambda x: f"{x[first_name_col]} {x[middle_name_col]}".strip()
-        if pd.notna(x[middle_name_col]) and x[middle_name_col].strip() != ""
-        else x[first_name_col],
-        axis=1,
-    )
+    first_name = df[first_name_col]
+    # Empty or numeric columns are not read as strings, so `.str` needs them converted first.
+    middle_name = df[middle_name_col].fillna("").astype(str).str.strip()
+    has_middle_name = middle_name != ""
+    full_name = (first_name.fillna("").astype(str) + " " + middle_name).str.strip()
+    df[new_col] = full_name.where(has_middle_name, first_name)
     return df.drop(columns=[first_name_col, middle_name_col])
 
 
@@ -84,27 +139,16 @@ def fill_missing_curp_and_phone(
     :param phone_default: Default value for phone and cell phone if missing.
     :return: Updated DataFrame.
     """
-    alerts = []
-
-    for idx, row in df.iterrows():
-        row_alerts = []
-        # Check CURP
-        if row[curp_col].strip() == "":
-            df.at[idx, curp_col] = curp_default
-            row_alerts.append("Missing CURP; default values inserted")
-        # Check Identity Number
-        if row[identity_number_col].strip() == "":
-            df.at[idx, identity_number_col] = curp_default
-            row_alerts.append("Missing Identity Number; default values inserted")
-        # Check Phone
-        if row[phone_col].strip() == "":
-            df.at[idx, phone_col] = phone_default
-            row_alerts.append("Missing Phone; default values inserted")
-        # Check Cell Phone
-        if row[cell_phone_col].strip() == "":
-            df.at[idx, cell_phone_col] = phone_default
-            row_alerts.append("Missing Cell Phone; default values inserted")
-        alerts.append("; ".join(row_alerts))
-
-    df["alert"] = alerts
+    defaults = [
+        (curp_col, curp_default, "Missing CURP; default values inserted"),
+        (identity_number_col, curp_default, "Missing Identity Number; default values inserted"),
+        (phone_col, phone_default, "Missing Phone; default values inserted"),
+        (cell_phone_col, phone_default, "Missing Cell Phone; default values inserted"),
+    ]
+    # Every mask is taken before any default is written, like the original row-by-row checks.
+    missing = [(df[col].str.strip() == "", col, default, alert) for col, default, alert in defaults]
+
+    for mask, col, default, _alert in missing:
+        df.loc[mask, col] = default
+    df["alert"] = join_messages(df.index, [(mask, alert) for mask, _, _, alert in missing])
     return df
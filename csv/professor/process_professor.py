@@ -4,9 +4,10 @@ import re
 
 import pandas as pd
 from common.utils import (
-    clean_phone_number,
+    clean_and_cross_fill_phones,
     fill_missing_curp_and_phone,
     get_project_base_dir,
+    map_distinct,
     merge_names,
     setup_logger,
 )
@@ -39,16 +40,8 @@ df = merge_names(
 )
 
 
-# Clean phone number columns using the common function
-df["phone"] = df["phone"].apply(clean_phone_number)
-df["cell_phone"] = df["cell_phone"].apply(clean_phone_number)
-
-df["phone"] = df.apply(
-    lambda x: x["cell_phone"] if not x["phone"] else x["phone"], axis=1
-)
-df["cell_phone"] = df.apply(
-    lambda x: x["phone"] if not x["cell_phone"] else x["cell_phone"], axis=1
-)
+# Clean the phone number columns and fill each one with the other when it is empty
+df = clean_and_cross_fill_phones(df, phone_col="phone", cell_phone_col="cell_phone")
 
 
 # Fill missing CURP (and update phone) if necessary; rows will have an alert if defaults were inserted
@@ -73,7 +66,7 @@ if "university_additional_info" in df.columns:
 df["institutional_email_lower"] = df["institutional_email"].str.strip().str.lower()
 
 
-df["career_type"] = df["career"].apply(map_career_type)
+df["career_type"] = map_distinct(df["career"], map_career_type)
 
 group_invalid_email = df[
     ~df["institutional_email_lower"].str.endswith("@uvaq.edu.mx", na=False)
@@ -1,6 +1,6 @@
 import logging
 import os
-import re
+import sys
 
 import pandas as pd
 from career_type_mapper import map_career_type
@@ -11,6 +11,15 @@ logger = logging.getLogger(__name__)
 
 # Construir la ruta al archivo CSV
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from common.utils import (  # noqa: E402
+    clean_and_cross_fill_phones,
+    join_messages,
+    map_distinct,
+    merge_names,
+)
+
 csv_path = os.path.join(BASE_DIR, "professor", "professors february 2025.csv")
 
 # Cargar el CSV con pandas
@@ -29,56 +38,28 @@ df = df.replace(r"\\N", "", regex=True)
 df = df.replace(r"\\N", "", regex=True)
 
 
-# Combinar first_name y middle_name en una sola columna name
-df["name"] = df.apply(
-    lambda x: f"{x['first_name']} {x['middle_name']}".strip()
-    if pd.notna(x["middle_name"]) and x["middle_name"].strip() != ""
-    else x["first_name"],
-    axis=1,
-)
-# Eliminar las columnas originales first_name y middle_name
-df = df.drop(columns=["first_name", "middle_name"])
+# Combinar first_name y middle_name en una sola columna name y eliminar las originales
+df = merge_names(df, first_name_col="first_name", middle_name_col="middle_name", new_col="name")
 
-
-# Función para limpiar y validar números de teléfono
-def clean_phone_number(phone):
-    phone = re.sub(r"\D", "", phone)  # Elimina todo lo que no sea número
-    return phone if len(phone) == 10 else ""  # Retorna vacío si no tiene 10 dígitos
-
-
-# Validar columnas de teléfono
-df["phone"] = df["phone"].apply(clean_phone_number)
-df["cell_phone"] = df["cell_phone"].apply(clean_phone_number)
-
-# Llenar una columna con la otra si está vacía
-df["phone"] = df.apply(
-    lambda x: x["cell_phone"] if not x["phone"] else x["phone"], axis=1
-)
-df["cell_phone"] = df.apply(
-    lambda x: x["phone"] if not x["cell_phone"] else x["cell_phone"], axis=1
-)
+# Validar columnas de teléfono (10 dígitos) y llenar una con la otra si está vacía
+df = clean_and_cross_fill_phones(df, phone_col="phone", cell_phone_col="cell_phone")
 
 
 column_order = ["name"] + [col for col in df.columns if col != "name"]
 df = df[column_order]
 
 
-# Identificar razones de invalidez para cada fila
-def identify_invalid_reasons(row):
-    reasons = []
-    if not row["institutional_email"].endswith("@uvaq.edu.mx"):
-        reasons.append("Correo institucional inválido")
-    if row["curp"].strip() == "":
-        reasons.append("CURP vacío")
-    if row["identity_number"].strip() == "":
-        reasons.append("Número de identidad vacío")
-    if row["cell_phone"] == "":
-        reasons.append("Número de celular inválido")
-    return ", ".join(reasons)
-
-
-# Crear la columna con las razones de invalidez
-df["reason_invalid"] = df.apply(identify_invalid_reasons, axis=1)
+# Crear la columna con las razones de invalidez de cada fila
+df["reason_invalid"] = join_messages(
+    df.index,
+    [
+        (~df["institutional_email"].str.endswith("@uvaq.edu.mx"), "Correo institucional inválido"),
+        (df["curp"].str.strip() == "", "CURP vacío"),
+        (df["identity_number"].str.strip() == "", "Número de identidad vacío"),
+        (df["cell_phone"] == "", "Número de celular inválido"),
+    ],
+    sep=", ",
+)
 
 # Filtrar filas inválidas
 invalid_rows_df = df[df["reason_invalid"] != ""]
@@ -98,7 +79,7 @@ df = df[df["reason_invalid"] == ""]
 # Eliminar la columna de razón de invalidez en el DataFrame limpio
 df = df.drop(columns=["reason_invalid"])
 
-df["career_type"] = df["career"].apply(map_career_type)
+df["career_type"] = map_distinct(df["career"], map_career_type)
 
 # Guardar el archivo original actualizado, sin las filas inválidas
 cleaned_csv_path = os.path.join(
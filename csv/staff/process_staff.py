@@ -2,7 +2,7 @@ import os
 
 import pandas as pd
 from common.utils import (
-    clean_phone_number,
+    clean_and_cross_fill_phones,
     fill_missing_curp_and_phone,
     get_project_base_dir,
     merge_names,
@@ -34,16 +34,8 @@ df = merge_names(
     df, first_name_col="first_name", middle_name_col="middle_name", new_col="name"
 )
 
-# Clean phone number columns using the common function
-df["phone"] = df["phone"].apply(clean_phone_number)
-df["cell_phone"] = df["cell_phone"].apply(clean_phone_number)
-
-df["phone"] = df.apply(
-    lambda x: x["cell_phone"] if not x["phone"] else x["phone"], axis=1
-)
-df["cell_phone"] = df.apply(
-    lambda x: x["phone"] if not x["cell_phone"] else x["cell_phone"], axis=1
-)
+# Clean the phone number columns and fill each one with the other when it is empty
+df = clean_and_cross_fill_phones(df, phone_col="phone", cell_phone_col="cell_phone")
 
 # Fill missing CURP (and update phone) if necessary; rows will have an alert if defaults were inserted
 df = fill_missing_curp_and_phone(
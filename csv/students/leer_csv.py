@@ -1,6 +1,6 @@
 import logging
 import os
-import re
+import sys
 
 import pandas as pd
 from career_type_mapper import map_career_type
@@ -11,6 +11,10 @@ logger = logging.getLogger(__name__)
 
 # Construir la ruta al archivo CSV
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from common.utils import clean_phone_numbers, join_messages, map_distinct  # noqa: E402
+
 csv_path = os.path.join(BASE_DIR, "students", "students february 2025.csv")
 
 # Cargar el CSV con pandas
@@ -29,37 +33,24 @@ df = df.replace(r"\\N", "", regex=True)
 df = df.replace(r"\\N", "", regex=True)
 
 
-# Función para limpiar y validar números de teléfono
-def clean_phone_number(phone):
-    phone = re.sub(r"\D", "", phone)  # Elimina todo lo que no sea número
-    return phone if len(phone) == 10 else ""  # Retorna vacío si no tiene 10 dígitos
-
-
-# Validar columnas de teléfono
-df["phone"] = df["phone"].apply(clean_phone_number)
-df["cell_phone"] = df["cell_phone"].apply(clean_phone_number)
+# Validar columnas de teléfono (vacío si no tienen 10 dígitos)
+df["phone"] = clean_phone_numbers(df["phone"])
+df["cell_phone"] = clean_phone_numbers(df["cell_phone"])
 
-df["career_type"] = df["career"].apply(map_career_type)
+df["career_type"] = map_distinct(df["career"], map_career_type)
 
-
-# Identificar razones de invalidez para cada fila
-def identify_invalid_reasons(row):
-    reasons = []
-    if not row["institutional_email"].endswith("@uvaq.edu.mx"):
-        reasons.append("Correo institucional inválido")
-    if row["curp"].strip() == "":
-        reasons.append("CURP vacío")
-    if row["identity_number"].strip() == "":
-        reasons.append("Número de identidad vacío")
-    if row["cell_phone"] == "":
-        reasons.append("Número de celular inválido")
-    if row["career_type"].strip() == "unknown":
-        reasons.append("Grado actual inválido")
-    return ", ".join(reasons)
-
-
-# Crear la columna con las razones de invalidez
-df["reason_invalid"] = df.apply(identify_invalid_reasons, axis=1)
+# Crear la columna con las razones de invalidez de cada fila
+df["reason_invalid"] = join_messages(
+    df.index,
+    [
+        (~df["institutional_email"].str.endswith("@uvaq.edu.mx"), "Correo institucional inválido"),
+        (df["curp"].str.strip() == "", "CURP vacío"),
+        (df["identity_number"].str.strip() == "", "Número de identidad vacío"),
+        (df["cell_phone"] == "", "Número de celular inválido"),
+        (df["career_type"].str.strip() == "unknown", "Grado actual inválido"),
+    ],
+    sep=", ",
+)
 
 # Filtrar filas inválidas
 invalid_rows_df = df[df["reason_invalid"] != ""]
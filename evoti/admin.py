@@ -1,3 +1,24 @@
 from django.contrib import admin
 
-# Register your models here.
+from evoti.models import BulkJob, CacheVersion, ImportFingerprint
+
+
+@admin.register(BulkJob)
+class BulkJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "operation", "status", "processed", "total", "failed", "created_at")
+    list_filter = ("operation", "status")
+    readonly_fields = ("started_at", "heartbeat_at", "finished_at")
+
+
+@admin.register(ImportFingerprint)
+class ImportFingerprintAdmin(admin.ModelAdmin):
+    list_display = ("business_key", "source", "imported_at", "deactivated_at")
+    list_filter = ("source",)
+    search_fields = ("business_key",)
+    raw_id_fields = ("person",)
+
+
+@admin.register(CacheVersion)
+class CacheVersionAdmin(admin.ModelAdmin):
+    list_display = ("name", "version", "updated_at")
+    readonly_fields = ("updated_at",)
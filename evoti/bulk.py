@@ -0,0 +1,665 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from evoti.detail_cache import detail_cache
+from evoti.serializers import (
+    ProfessorCreateUpdateSerializer,
+    StaffCreateUpdateSerializer,
+    StudentCreateUpdateSerializer,
+)
+from evoti.statistics import statistics_cache
+from santander.documents import invalidate_credentials
+from uvaq.models import (
+    AcademicPeriod,
+    AccessControl,
+    Career,
+    ContactInformation,
+    EmergencyInformation,
+    Identification,
+    PersonalInformation,
+    Professor,
+    StaffProfile,
+    Student,
+    StudyPlan,
+    Subject,
+    UniversityInfo,
+    UserUniversity,
+    Vehicle,
+)
+
+BULK_CREATE_BATCH_SIZE = 500
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Unique column that models without another natural key carry for `bulk_insert` to read the
+# inserted rows back by.
+BULK_INSERT_KEY = "bulk_insert_key"
+
+
+def without_unique_validators(serializer):
+    """
+    Drops the per-row `UniqueValidator` queries from a serializer and its nested serializers.
+
+    Bulk creators check uniqueness for the whole payload with one `IN` query per field instead.
+    """
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+        if isinstance(field, serializers.BaseSerializer):
+            without_unique_validators(field)
+        else:
+            field.validators = [
+                validator
+                for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+    return serializer
+
+
+def unique_message(model, field_name):
+    field = model._meta.get_field(field_name)
+    return field.error_messages["unique"] % {
+        "model_name": model._meta.verbose_name,
+        "field_label": field.verbose_name,
+    }
+
+
+def natural_key(model, objs):
+    """
+    Returns the attname of a unique field set on every object, to read inserted rows back by.
+    """
+    for field in model._meta.concrete_fields:
+        if field.unique and not field.primary_key:
+            if all(getattr(obj, field.attname) is not None for obj in objs):
+                return field.attname
+    return None
+
+
+def bulk_insert(model, objs):
+    """
+    Inserts unsaved `objs` with `bulk_create` and makes sure each one gets its primary key.
+
+    Backends that return rows from a bulk insert set the keys themselves. Elsewhere (MySQL) the
+    keys are left to AUTO_INCREMENT and read back afterwards:
+
+    - by a natural key, when the model has a unique field set on every object: one `IN` query
+      per batch. Models with a `BULK_INSERT_KEY` column (`PersonalInformation`) get a random
+      one per object;
+    - otherwise from `LAST_INSERT_ID()`, the id of the first row of the last insert. The other
+      rows of a multi-row insert only follow it (every `auto_increment_increment`) under
+      `innodb_autoinc_lock_mode` 0 or 1 ("traditional" / "consecutive"); with the interleaved
+      mode 2, the MySQL 8 default, rows are inserted one at a time.
+    """
+    if not objs or connection.features.can_return_rows_from_bulk_insert:
+        return model.objects.bulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+
+    if any(field.name == BULK_INSERT_KEY for field in model._meta.concrete_fields):
+        for obj in objs:
+            if getattr(obj, BULK_INSERT_KEY) is None:
+                setattr(obj, BULK_INSERT_KEY, uuid.uuid4())
+
+    key = natural_key(model, objs)
+    if key is not None:
+        model.objects.bulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+        ids = {}
+        for start in range(0, len(objs), BULK_CREATE_BATCH_SIZE):
+            values = [getattr(obj, key) for obj in objs[start : start + BULK_CREATE_BATCH_SIZE]]
+            ids.update(model.objects.filter(**{f"{key}__in": values}).values_list(key, "pk"))
+        for obj in objs:
+            obj.pk = ids[getattr(obj, key)]
+        return objs
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+        lock_mode, step = cursor.fetchone()
+    batch_size = BULK_CREATE_BATCH_SIZE if lock_mode in (0, 1) else 1
+    for start in range(0, len(objs), batch_size):
+        batch = objs[start : start + batch_size]
+        model.objects.bulk_create(batch)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT LAST_INSERT_ID()")
+            first_pk = cursor.fetchone()[0]
+        for offset, obj in enumerate(batch):
+            obj.pk = first_pk + offset * step
+    return objs
+
+
+class BulkCreator(ABC):
+    """
+    Set-based creation of many people of one role from `*CreateUpdateSerializer` payloads.
+
+    Items are validated in memory against references and unique values loaded with one `IN`
+    query per table, and every model is then inserted with `bulk_create` in dependency order:
+    people, their contact/identification/emergency/vehicle/access rows, the role profiles and
+    finally the university links. Invalid items are reported by index and skipped; the valid
+    ones are still created, as the item-by-item path did.
+    """
+
+    serializer_class = None
+    model = None
+    person_key = "user"
+    identifier_field = None
+    role = None
+
+    def __init__(self, data_list):
+        self.data_list = data_list
+        self.errors = []
+
+    def create(self):
+        """
+        Validates and creates every item of the payload.
+
+        Returns:
+            list: The created role profiles, in payload order.
+        """
+        self.context = self.load_references()
+        serializer = without_unique_validators(self.get_serializer())
+
+        validated = []
+        for index, data in enumerate(self.data_list):
+            try:
+                item = serializer.run_validation(data)
+            except serializers.ValidationError as exc:
+                self.errors.append({"index": index, "errors": serializers.as_serializer_error(exc)})
+            except Exception as exc:
+                self.errors.append({"index": index, "errors": str(exc)})
+            else:
+                validated.append((index, item))
+
+        validated = self.check_unique(validated)
+        self.errors.sort(key=lambda error: error["index"])
+        if not validated:
+            return []
+        return self.insert(validated)
+
+    def get_serializer(self):
+        return self.serializer_class(context=self.context)
+
+    def references(self, key):
+        """
+        Collects the distinct values of a top-level payload key.
+        """
+        values = set()
+        for data in self.data_list:
+            value = data.get(key) if isinstance(data, dict) else None
+            if isinstance(value, list):
+                values.update(value)
+            elif value is not None:
+                values.add(value)
+        return values
+
+    def load_references(self):
+        universities = UniversityInfo.objects.filter(
+            identifier__in=self.references("university_identifier"),
+        )
+        return {"universities": {university.identifier: university for university in universities}}
+
+    def check_unique(self, validated):
+        """
+        Rejects items whose unique values already exist, or repeat an earlier item's.
+        """
+        checks = [
+            (self.model, None, self.identifier_field),
+            (ContactInformation, "contact_info", "institutional_email"),
+            (Identification, "identification", "curp"),
+            (Vehicle, "vehicles", "plate_number"),
+        ]
+
+        def read(item, parent, field_name):
+            nested = item if parent is None else item.get(parent, [])
+            rows = nested if isinstance(nested, list) else [nested]
+            return [row[field_name] for row in rows if row.get(field_name)]
+
+        taken = {}
+        for model, parent, field_name in checks:
+            values = {value for _, item in validated for value in read(item, parent, field_name)}
+            taken[field_name] = set(
+                model.objects.filter(**{f"{field_name}__in": values}).values_list(
+                    field_name,
+                    flat=True,
+                ),
+            )
+
+        unique = []
+        for index, item in validated:
+            errors = {}
+            for model, parent, field_name in checks:
+                values = read(item, parent, field_name)
+                if taken[field_name].intersection(values) or len(set(values)) < len(values):
+                    error = {field_name: [unique_message(model, field_name)]}
+                    errors.update(error if parent is None else {parent: error})
+            if errors:
+                self.errors.append({"index": index, "errors": errors})
+                continue
+            for model, parent, field_name in checks:
+                taken[field_name].update(read(item, parent, field_name))
+            unique.append((index, item))
+        return unique
+
+    @abstractmethod
+    def build(self, person, item):
+        """
+        Returns the unsaved role profile and university link of a validated item.
+        """
+
+    @transaction.atomic
+    def insert(self, validated):
+        people, related, profiles, links = [], defaultdict(list), [], []
+        items = []
+        for _, item in validated:
+            person_data = item.pop(self.person_key)
+            if self.role:
+                person_data["role"] = self.role
+            person = PersonalInformation(**person_data)
+            people.append(person)
+            items.append((person, item))
+        bulk_insert(PersonalInformation, people)
+
+        for person, item in items:
+            related[ContactInformation].append(
+                ContactInformation(user=person, **item.pop("contact_info")),
+            )
+            related[Identification].append(
+                Identification(user=person, **item.pop("identification")),
+            )
+            related[EmergencyInformation].append(
+                EmergencyInformation(user=person, **item.pop("emergency_info")),
+            )
+            related[Vehicle].extend(
+                Vehicle(owner=person, **vehicle) for vehicle in item.pop("vehicles", [])
+            )
+            related[AccessControl].extend(
+                AccessControl(user=person, **access) for access in item.pop("access_control", [])
+            )
+            profile, link = self.build(person, item)
+            profiles.append(profile)
+            links.append(link)
+
+        for model, objs in related.items():
+            model.objects.bulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+        bulk_insert(self.model, profiles)
+        for profile, link in zip(profiles, links):
+            link.user_identifier = getattr(profile, self.identifier_field)
+        UserUniversity.objects.bulk_create(links, batch_size=BULK_CREATE_BATCH_SIZE)
+
+        # bulk_create sends no post_save signals.
+        statistics_cache.invalidate()
+        return profiles
+
+
+class BulkStudentCreateSerializer(StudentCreateUpdateSerializer):
+    def validate_career_code(self, value):
+        if value not in self.context["careers"]:
+            raise serializers.ValidationError("Invalid or inactive career code")
+        return value
+
+    def validate_admission_period_id(self, value):
+        if value not in self.context["periods"]:
+            raise serializers.ValidationError("Invalid admission period")
+        return value
+
+    def validate_current_period_id(self, value):
+        if value not in self.context["periods"]:
+            raise serializers.ValidationError("Invalid current period")
+        return value
+
+    def validate_study_plan_id(self, value):
+        if value not in self.context["study_plans"]:
+            raise serializers.ValidationError("Invalid study plan")
+        return value
+
+    def validate_university_identifier(self, value):
+        if value not in self.context["universities"]:
+            raise serializers.ValidationError("Invalid university identifier")
+        return value
+
+    def validate(self, data):
+        if not self.partial and data.get("study_plan_id") is None:
+            raise serializers.ValidationError({"study_plan_id": "This field is required."})
+        return data
+
+
+class StudentBulkCreator(BulkCreator):
+    serializer_class = BulkStudentCreateSerializer
+    model = Student
+    person_key = "personal_info"
+    identifier_field = "student_id"
+
+    def load_references(self):
+        references = super().load_references()
+        careers = Career.objects.filter(code__in=self.references("career_code"), is_active=True)
+        period_ids = self.references("admission_period_id") | self.references("current_period_id")
+        references["careers"] = {career.code: career for career in careers}
+        references["periods"] = AcademicPeriod.objects.in_bulk(period_ids)
+        references["study_plans"] = StudyPlan.objects.in_bulk(self.references("study_plan_id"))
+        return references
+
+    def build(self, person, item):
+        current_period_id = item.pop("current_period_id", None)
+        university = self.context["universities"][item.pop("university_identifier")]
+        student = Student(
+            personal_info=person,
+            career=self.context["careers"][item.pop("career_code")],
+            admission_period=self.context["periods"][item.pop("admission_period_id")],
+            current_period=self.context["periods"][current_period_id]
+            if current_period_id
+            else None,
+            study_plan=self.context["study_plans"][item.pop("study_plan_id")],
+            **item,
+        )
+        link = UserUniversity(
+            user=person,
+            university=university,
+            user_roles=["student"],
+            enrollment_date=student.enrollment_date,
+            campus=student.campus,
+            type="student",
+            is_active=student.is_active,
+        )
+        return student, link
+
+
+def as_change(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class StudentBulkUpdater:
+    """
+    Set-based partial update of many students from `{"id": ..., "data": {...}}` items.
+
+    The students and the rows they own are fetched with one query through
+    `get_student_queryset()`, every item is validated in memory against references and unique
+    values loaded with one `IN` query per table, and the changed rows are written with
+    `bulk_update`, one statement per model and set of changed columns (and per chunk).
+
+    Vehicles and access control entries in `data` are ignored, as the single-student update
+    does.
+    """
+
+    # Payload key -> path from the student to the row it updates.
+    NESTED = {
+        "personal_info": ("personal_info",),
+        "contact_info": ("personal_info", "contact_info"),
+        "identification": ("personal_info", "identification"),
+        "emergency_info": ("personal_info", "emergency_info"),
+    }
+    # Payload key -> (student foreign key, reference map in the context). Diffs show the key ids.
+    REFERENCES = {
+        "career_code": ("career", "careers"),
+        "admission_period_id": ("admission_period", "periods"),
+        "current_period_id": ("current_period", "periods"),
+        "study_plan_id": ("study_plan", "study_plans"),
+    }
+    IGNORED = ("vehicles", "access_control", "university_identifier")
+
+    def __init__(self, items):
+        self.items = items
+        self.errors = []
+        self.changes = {}
+
+    def update(self, queryset):
+        """
+        Validates every item and writes the valid ones.
+
+        Args:
+            queryset (QuerySet): The students to update, with the nested rows joined in.
+
+        Returns:
+            list: The updated students, in payload order.
+        """
+        parsed = []
+        for item in self.items:
+            if not isinstance(item, dict) or not isinstance(item.get("data", {}), dict):
+                self.errors.append({"id": None, "errors": "Expected an object with id and data"})
+            else:
+                parsed.append((item.get("id"), item.get("data", {})))
+
+        students = queryset.in_bulk([pk for pk, _ in parsed if isinstance(pk, int)])
+        self.context = StudentBulkCreator([data for _, data in parsed]).load_references()
+        serializer = without_unique_validators(
+            BulkStudentCreateSerializer(context=self.context, partial=True),
+        )
+
+        validated = []
+        for pk, data in parsed:
+            student = students.get(pk) if isinstance(pk, int) else None
+            if student is None:
+                self.errors.append({"id": pk, "errors": "Student not found"})
+                continue
+            try:
+                validated.append((student, serializer.run_validation(data)))
+            except serializers.ValidationError as exc:
+                self.errors.append({"id": pk, "errors": serializers.as_serializer_error(exc)})
+            except Exception as exc:
+                self.errors.append({"id": pk, "errors": str(exc)})
+
+        dirty = defaultdict(dict)
+        updated = []
+        for student, data in self.check_unique(validated):
+            try:
+                changes = self.apply(student, data, dirty)
+            except Exception as exc:
+                self.errors.append({"id": student.pk, "errors": str(exc)})
+                continue
+            self.changes.setdefault(student.pk, {}).update(changes)
+            updated.append(student)
+
+        self.write(dirty)
+        return list({student.pk: student for student in updated}.values())
+
+    def check_unique(self, validated):
+        """
+        Rejects items that would take a unique value owned by another student's rows.
+        """
+        checks = [
+            (Student, None, "student_id", lambda student: student),
+            (
+                ContactInformation,
+                "contact_info",
+                "institutional_email",
+                lambda student: student.personal_info.contact_info,
+            ),
+            (
+                Identification,
+                "identification",
+                "curp",
+                lambda student: student.personal_info.identification,
+            ),
+        ]
+
+        def read(data, parent, field_name):
+            nested = data if parent is None else data.get(parent) or {}
+            return nested.get(field_name)
+
+        owners = {}
+        for model, parent, field_name, _ in checks:
+            values = {read(data, parent, field_name) for _, data in validated} - {None, ""}
+            owners[field_name] = dict(
+                model.objects.filter(**{f"{field_name}__in": values}).values_list(field_name, "pk"),
+            )
+
+        unique = []
+        for student, data in validated:
+            errors = {}
+            claims = []
+            for model, parent, field_name, owned_row in checks:
+                value = read(data, parent, field_name)
+                if value in (None, ""):
+                    continue
+                try:
+                    own_pk = owned_row(student).pk
+                except ObjectDoesNotExist:
+                    own_pk = None
+                if owners[field_name].get(value, own_pk) != own_pk:
+                    error = {field_name: [unique_message(model, field_name)]}
+                    errors.update(error if parent is None else {parent: error})
+                claims.append((field_name, value, own_pk))
+            if errors:
+                self.errors.append({"id": student.pk, "errors": errors})
+                continue
+            for field_name, value, own_pk in claims:
+                owners[field_name][value] = own_pk
+            unique.append((student, data))
+        return unique
+
+    def apply(self, student, data, dirty):
+        """
+        Sets the validated values on the student and its rows, recording what changed.
+
+        Args:
+            student (Student): The fetched student.
+            data (dict): The validated partial payload.
+            dirty (dict): Rows to write, keyed by model and primary key, with their changed
+                fields; updated in place.
+
+        Returns:
+            dict: The changes, as `[old, new]` pairs keyed by payload path.
+        """
+        assignments = []
+        for key, path in self.NESTED.items():
+            if not data.get(key):
+                continue
+            row = student
+            for attr in path:
+                row = getattr(row, attr)
+            assignments.extend(
+                (row, f"{key}.{name}", name, value) for name, value in data[key].items()
+            )
+
+        for key, (field_name, references) in self.REFERENCES.items():
+            if data.get(key):
+                target = self.context[references][data[key]]
+                assignments.append((student, field_name, f"{field_name}_id", target.pk))
+
+        for key, value in data.items():
+            if key not in self.NESTED and key not in self.REFERENCES and key not in self.IGNORED:
+                assignments.append((student, key, key, value))
+
+        changes = {}
+        for row, path, name, value in assignments:
+            old = getattr(row, name)
+            if old == value:
+                continue
+            changes[path] = [as_change(old), as_change(value)]
+            setattr(row, name, value)
+            dirty[type(row)].setdefault(row.pk, (row, set()))[1].add(name)
+        return changes
+
+    @transaction.atomic
+    def write(self, dirty):
+        groups = defaultdict(list)
+        for model, rows in dirty.items():
+            for row, fields in rows.values():
+                groups[model, frozenset(fields)].append(row)
+        for (model, fields), rows in groups.items():
+            model.objects.bulk_update(rows, sorted(fields), batch_size=BULK_UPDATE_BATCH_SIZE)
+
+        # bulk_update sends no post_save signals.
+        person_ids = {
+            row.personal_info_id if model is Student else getattr(row, "user_id", row.pk)
+            for model, rows in dirty.items()
+            for row, _ in rows.values()
+        }
+        if person_ids:
+            invalidate_credentials(person_id__in=person_ids)
+            detail_cache.invalidate()
+            statistics_cache.invalidate()
+
+
+class BulkStaffCreateSerializer(StaffCreateUpdateSerializer):
+    def validate_supervisor_id(self, value):
+        if value not in self.context["supervisors"]:
+            raise serializers.ValidationError("Invalid or inactive supervisor")
+        return value
+
+    def validate_university_identifier(self, value):
+        if value not in self.context["universities"]:
+            raise serializers.ValidationError("Invalid university identifier")
+        return value
+
+
+class StaffBulkCreator(BulkCreator):
+    serializer_class = BulkStaffCreateSerializer
+    model = StaffProfile
+    identifier_field = "staff_id"
+    role = "staff"
+
+    def load_references(self):
+        references = super().load_references()
+        references["supervisors"] = StaffProfile.objects.filter(is_active=True).in_bulk(
+            self.references("supervisor_id"),
+        )
+        return references
+
+    def build(self, person, item):
+        supervisor_id = item.pop("supervisor_id", None)
+        university = self.context["universities"][item.pop("university_identifier")]
+        staff = StaffProfile(
+            user=person,
+            supervisor=self.context["supervisors"][supervisor_id] if supervisor_id else None,
+            **item,
+        )
+        link = UserUniversity(
+            user=person,
+            university=university,
+            user_roles=["staff"],
+            enrollment_date=staff.hire_date,
+            type="staff",
+            is_active=staff.is_active,
+        )
+        return staff, link
+
+
+class BulkProfessorCreateSerializer(ProfessorCreateUpdateSerializer):
+    def validate_university_identifier(self, value):
+        if value not in self.context["universities"]:
+            raise serializers.ValidationError("Invalid university identifier")
+        return value
+
+    def validate_courses_taught_codes(self, value):
+        for code in value:
+            if code not in self.context["subjects"]:
+                raise serializers.ValidationError(f"Invalid or inactive subject code: {code}")
+        if value:
+            # Courses taught go through ProfessorSubject, which needs a period and a group.
+            raise serializers.ValidationError(
+                "Courses taught must be assigned per period through professor subjects",
+            )
+        return value
+
+
+class ProfessorBulkCreator(BulkCreator):
+    serializer_class = BulkProfessorCreateSerializer
+    model = Professor
+    identifier_field = "professor_id"
+    role = "professor"
+
+    def load_references(self):
+        references = super().load_references()
+        subjects = Subject.objects.filter(
+            code__in=self.references("courses_taught_codes"),
+            is_active=True,
+        )
+        references["subjects"] = {subject.code: subject for subject in subjects}
+        return references
+
+    def build(self, person, item):
+        item.pop("courses_taught_codes", None)
+        university = self.context["universities"][item.pop("university_identifier")]
+        professor = Professor(user=person, **item)
+        link = UserUniversity(
+            user=person,
+            university=university,
+            user_roles=["professor"],
+            enrollment_date=professor.hire_date,
+            type="professor",
+            is_active=professor.is_active,
+        )
+        return professor, link
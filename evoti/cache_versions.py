@@ -0,0 +1,83 @@
+import threading
+import time
+import weakref
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from evoti.models import CacheVersion
+
+STATISTICS_VERSION = "statistics"
+DETAIL_VERSION = "person-detail"
+
+# Versions read by this process: name -> (version, time.monotonic() of the read).
+_checked = {}
+
+# Names with a bump queued in the open transaction of each connection, tied to the connection's
+# `run_on_commit` list, which Django replaces whenever a transaction or savepoint ends.
+_queued = weakref.WeakKeyDictionary()
+_queued_lock = threading.Lock()
+
+
+def current_version(name, max_age=0):
+    """
+    Returns the shared version of a cache, 0 until it is first bumped.
+
+    Args:
+        name (str): The cache name, e.g. `DETAIL_VERSION`.
+        max_age (float): Seconds a version read by this process is reused before the database
+            is asked again. Bumps made by this process are seen right away; bumps made by other
+            processes are seen at most `max_age` seconds late.
+    """
+    checked = _checked.get(name)
+    if checked is not None and time.monotonic() - checked[1] < max_age:
+        return checked[0]
+    version = CacheVersion.objects.filter(name=name).values_list("version", flat=True).first()
+    _checked[name] = (version or 0, time.monotonic())
+    return version or 0
+
+
+def forget_version(name):
+    """
+    Makes the next `current_version()` call of this process read the database.
+    """
+    _checked.pop(name, None)
+
+
+def bump_version(name, using=None):
+    """
+    Increments the shared version of a cache once the current transaction commits (right away
+    outside one), so every process stops serving the entries computed before the write.
+
+    A name is bumped at most once per transaction, however many writes ask for it.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        increment(name)
+        return
+
+    with _queued_lock:
+        queue, names = _queued.get(connection, (None, None))
+        if queue is not connection.run_on_commit:
+            names = set()
+            _queued[connection] = (connection.run_on_commit, names)
+        if name in names:
+            return
+        names.add(name)
+
+    def bump():
+        with _queued_lock:
+            names.discard(name)
+        increment(name)
+
+    transaction.on_commit(bump, using=using)
+
+
+def increment(name):
+    versions = CacheVersion.objects.filter(name=name)
+    if not versions.update(version=F("version") + 1, updated_at=timezone.now()):
+        # First bump: create the row, tolerating a concurrent creator, then count this write.
+        CacheVersion.objects.bulk_create([CacheVersion(name=name)], ignore_conflicts=True)
+        versions.update(version=F("version") + 1, updated_at=timezone.now())
+    forget_version(name)
@@ -0,0 +1,129 @@
+import threading
+import time
+
+from cachetools import TTLCache
+
+from evoti.cache_versions import DETAIL_VERSION, bump_version, current_version, forget_version
+
+DETAIL_CACHE_TTL = 300
+DETAIL_CACHE_MAXSIZE = 2048
+DETAIL_VERSION_MAX_AGE = 1
+
+
+class DetailCache:
+    """
+    Read-through TTL cache of rendered person detail payloads, keyed by business id.
+
+    Payloads are kept in the process, keyed by the shared `CacheVersion` current when they were
+    rendered. Writers bump that version once per transaction, on commit, so a write made by any
+    process, including the `run_bulk_jobs` worker and the CSV imports, retires the payloads of
+    every process. The version is read at most once per `version_max_age` seconds, so repeat
+    lookups skip the database: bumps of this process are seen right away, those of other
+    processes up to `version_max_age` seconds late. A payload rendered while a write landed is
+    stored under the version it started from and is never served once the bump is visible.
+
+    Invalidation is not per person: any write to a rendered model retires every payload, which
+    keeps the version a single row that readers can check cheaply.
+
+    Attributes:
+        hits (int): Number of payloads served from the cache.
+        misses (int): Number of payloads that were rendered.
+        invalidations (int): Number of invalidations requested by this process.
+    """
+
+    def __init__(
+        self,
+        ttl=DETAIL_CACHE_TTL,
+        maxsize=DETAIL_CACHE_MAXSIZE,
+        version_name=DETAIL_VERSION,
+        version_max_age=DETAIL_VERSION_MAX_AGE,
+    ):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl, timer=time.monotonic)
+        self._lock = threading.Lock()
+        self._version = None
+        self.version_name = version_name
+        self.version_max_age = version_max_age
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key, render):
+        """
+        Returns the cached payload for `key`, rendering it with `render()` on a miss.
+
+        Args:
+            key (Hashable): Identifies the rendering, e.g. family, business id and fields.
+            render (Callable[[], dict]): Loads and renders the person. Exceptions (such as
+                `Http404`) propagate and nothing is cached.
+
+        Returns:
+            dict: The rendered payload.
+        """
+        version = current_version(self.version_name, self.version_max_age)
+        key = (version, key)
+        with self._lock:
+            if version != self._version:
+                # Payloads of older versions can no longer be served.
+                self._entries.clear()
+                self._version = version
+            payload = self._entries.get(key)
+            if payload is not None:
+                self.hits += 1
+                return payload
+            self.misses += 1
+
+        payload = render()
+        with self._lock:
+            self._entries[key] = payload
+        return payload
+
+    def invalidate(self):
+        """
+        Retires every cached payload, in all processes, once the current transaction commits.
+        """
+        with self._lock:
+            self.invalidations += 1
+        bump_version(self.version_name)
+
+    def clear(self):
+        """
+        Drops the payloads of this process only, and reads the shared version again on the next
+        lookup.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+        forget_version(self.version_name)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "invalidations": self.invalidations,
+                "size": self._entries.currsize,
+                "maxsize": self._entries.maxsize,
+                "ttl": self._entries.ttl,
+            }
+
+
+detail_cache = DetailCache()
+
+
+def get_person_detail(family, business_id, fields, render):
+    """
+    Returns the rendered detail payload of a person looked up by business id.
+
+    Args:
+        family (str): "students", "staff" or "professors".
+        business_id (str): The student, staff or professor id.
+        fields (set | None): The requested serializer fields, None for all.
+        render (Callable[[], dict]): See `DetailCache.get`.
+
+    Returns:
+        dict: The rendered payload.
+    """
+    key = (family, business_id, frozenset(fields) if fields is not None else None)
+    return detail_cache.get(key, render)
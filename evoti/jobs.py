@@ -0,0 +1,226 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from evoti.bulk import (
+    ProfessorBulkCreator,
+    StaffBulkCreator,
+    StudentBulkCreator,
+    StudentBulkUpdater,
+)
+from evoti.detail_cache import detail_cache
+from evoti.models import BulkJob
+from evoti.statistics import statistics_cache
+from uvaq.models import Student
+
+logger = logging.getLogger(__name__)
+
+BULK_JOB_CHUNK_SIZE = 500
+BULK_JOB_MAX_ATTEMPTS = 3
+
+
+def create_chunk(creator_class):
+    def handle(items, offset):
+        creator = creator_class(items)
+        created = creator.create()
+        errors = [{**error, "index": error["index"] + offset} for error in creator.errors]
+        return [profile.pk for profile in created], errors
+
+    return handle
+
+
+def update_students_chunk(items, offset):
+    from evoti.views import STUDENT_UPDATE_FIELDS, get_student_queryset
+
+    updater = StudentBulkUpdater(items)
+    updated = updater.update(get_student_queryset(STUDENT_UPDATE_FIELDS))
+    return [student.pk for student in updated], updater.errors
+
+
+def set_students_active(is_active):
+    def handle(ids, offset):
+        ids = [pk for pk in ids if isinstance(pk, int)]
+        updated = list(Student.objects.filter(id__in=ids).values_list("pk", flat=True))
+        Student.objects.filter(id__in=updated).update(is_active=is_active)
+        detail_cache.invalidate()
+        statistics_cache.invalidate()
+        missing = set(ids) - set(updated)
+        return updated, [{"id": pk, "errors": "Student not found"} for pk in missing]
+
+    return handle
+
+
+# Operation -> handler(items, offset) returning (ids written, per-item errors) for one chunk.
+JOB_HANDLERS = {
+    BulkJob.Operation.CREATE_STUDENTS: create_chunk(StudentBulkCreator),
+    BulkJob.Operation.CREATE_STAFF: create_chunk(StaffBulkCreator),
+    BulkJob.Operation.CREATE_PROFESSORS: create_chunk(ProfessorBulkCreator),
+    BulkJob.Operation.UPDATE_STUDENTS: update_students_chunk,
+    BulkJob.Operation.ACTIVATE_STUDENTS: set_students_active(True),
+    BulkJob.Operation.INACTIVATE_STUDENTS: set_students_active(False),
+}
+
+
+def enqueue_bulk_job(operation, payload, chunk_size=BULK_JOB_CHUNK_SIZE):
+    """
+    Queues a bulk operation for the worker.
+
+    With `EVOTI_BULK_JOBS_EAGER = True` in the settings the job runs right away in-process,
+    so no worker is needed locally or in tests.
+
+    Args:
+        operation (str): One of `BulkJob.Operation`.
+        payload (list): The items to process.
+        chunk_size (int): Number of items committed per transaction.
+
+    Returns:
+        BulkJob: The pending job, or the finished one when running eagerly.
+    """
+    job = BulkJob.objects.create(
+        operation=operation,
+        payload=payload,
+        total=len(payload),
+        chunk_size=chunk_size,
+    )
+    if getattr(settings, "EVOTI_BULK_JOBS_EAGER", False):
+        return run_bulk_job(claim_bulk_job(job.pk))
+    return job
+
+
+class JobLost(Exception):
+    """
+    The job was claimed again by another worker since this one claimed it.
+    """
+
+
+def claim_bulk_job(pk=None, stale_after=None, retry_after=None):
+    """
+    Marks the oldest claimable job (or job `pk`) as running and returns it.
+
+    Pending jobs are always claimable. Running jobs without a heartbeat for `stale_after` are
+    considered abandoned, and failed jobs that finished `retry_after` ago are retried; both
+    resume after their last committed chunk, until they have been claimed
+    `BULK_JOB_MAX_ATTEMPTS` times.
+
+    Claiming is a conditional `UPDATE` on the job's status and claim token, so concurrent workers
+    never claim the same job and no row locks are held.
+
+    Returns:
+        BulkJob | None: The claimed job, or None if there is nothing to run.
+    """
+    now = timezone.now()
+    conditions = Q(status=BulkJob.Status.PENDING)
+    if stale_after is not None:
+        conditions |= Q(
+            status=BulkJob.Status.RUNNING,
+            heartbeat_at__lt=now - stale_after,
+            attempts__lt=BULK_JOB_MAX_ATTEMPTS,
+        )
+    if retry_after is not None:
+        conditions |= Q(
+            status=BulkJob.Status.FAILED,
+            finished_at__lt=now - retry_after,
+            attempts__lt=BULK_JOB_MAX_ATTEMPTS,
+        )
+    claimable = BulkJob.objects.filter(conditions)
+    if pk is not None:
+        claimable = claimable.filter(pk=pk)
+
+    for job in claimable.order_by("created_at", "pk")[:10]:
+        claim = {
+            "status": BulkJob.Status.RUNNING,
+            "claim_token": uuid.uuid4(),
+            "attempts": job.attempts + 1,
+            "heartbeat_at": now,
+            "started_at": job.started_at or now,
+            "finished_at": None,
+            "error_message": "",
+        }
+        claimed = BulkJob.objects.filter(
+            pk=job.pk,
+            status=job.status,
+            claim_token=job.claim_token,
+        ).update(**claim)
+        if claimed:
+            for field, value in claim.items():
+                setattr(job, field, value)
+            return job
+    return None
+
+
+def save_progress(job, **fields):
+    """
+    Writes `fields` to the job if this worker's claim is still current.
+
+    Raises:
+        JobLost: The job was claimed again by another worker; nothing was written.
+    """
+    owned = BulkJob.objects.filter(pk=job.pk, claim_token=job.claim_token).update(**fields)
+    if not owned:
+        raise JobLost(job.pk)
+    for field, value in fields.items():
+        setattr(job, field, value)
+
+
+def run_bulk_job(job):
+    """
+    Processes a claimed job chunk by chunk, starting after its last committed chunk.
+
+    Each chunk and the job's progress counters are committed together. A chunk that raises
+    is rolled back and the job is marked failed with the error; the committed chunks stay.
+    If another worker has claimed the job since (this worker stalled past `stale_after`), the
+    chunk is rolled back and the run stops, leaving the job to its new owner.
+    """
+    if job is None:
+        return None
+    handler = JOB_HANDLERS[job.operation]
+    try:
+        while job.processed < job.total:
+            start = job.processed
+            chunk = job.payload[start : start + job.chunk_size]
+            try:
+                with transaction.atomic():
+                    ids, errors = handler(chunk, start)
+                    save_progress(
+                        job,
+                        processed=start + len(chunk),
+                        succeeded=job.succeeded + len(ids),
+                        failed=job.failed + len(errors),
+                        result=job.result + ids,
+                        errors=job.errors + errors,
+                        heartbeat_at=timezone.now(),
+                    )
+            except JobLost:
+                raise
+            except Exception as exc:
+                logger.exception("Bulk job %s failed at item %s", job.pk, start)
+                job.refresh_from_db(fields=["processed", "succeeded", "failed", "result", "errors"])
+                save_progress(
+                    job,
+                    status=BulkJob.Status.FAILED,
+                    error_message=f"{type(exc).__name__}: {exc}",
+                    finished_at=timezone.now(),
+                )
+                return job
+
+        save_progress(job, status=BulkJob.Status.COMPLETED, finished_at=timezone.now())
+    except JobLost:
+        logger.warning("Bulk job %s was claimed by another worker, stopping", job.pk)
+        job.refresh_from_db()
+    return job
+
+
+def run_pending_bulk_jobs(stale_after=timedelta(minutes=10), retry_after=timedelta(minutes=1)):
+    """
+    Runs queued jobs until none is left, and returns how many ran.
+    """
+    count = 0
+    while (job := claim_bulk_job(stale_after=stale_after, retry_after=retry_after)) is not None:
+        run_bulk_job(job)
+        count += 1
+    return count
@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from evoti.jobs import claim_bulk_job, run_bulk_job
+
+
+class Command(BaseCommand):
+    help = "Run queued evoti bulk jobs, polling the database for new ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=600,
+            help="Seconds without progress after which a running job is taken over.",
+        )
+        parser.add_argument(
+            "--retry-after",
+            type=int,
+            default=60,
+            help="Seconds after which a failed job is retried, up to its maximum attempts.",
+        )
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(seconds=options["stale_after"])
+        retry_after = timedelta(seconds=options["retry_after"])
+        while True:
+            job = claim_bulk_job(stale_after=stale_after, retry_after=retry_after)
+            if job is None:
+                if options["once"]:
+                    return
+                time.sleep(options["poll_interval"])
+                continue
+
+            self.stdout.write(
+                f"Running {job} (attempt {job.attempts}): {job.total - job.processed} items left.",
+            )
+            job = run_bulk_job(job)
+            style = self.style.SUCCESS if job.status == job.Status.COMPLETED else self.style.ERROR
+            self.stdout.write(
+                style(
+                    f"{job}: {job.succeeded} succeeded, {job.failed} rejected, "
+                    f"{job.throughput or 0} items/s. {job.error_message}".strip(),
+                ),
+            )
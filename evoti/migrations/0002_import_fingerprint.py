@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evoti', '0001_initial'),
+        ('uvaq', '0002_alter_contactinformation_institutional_email_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('students', 'Students'), ('professors', 'Professors'), ('staff', 'Staff')], max_length=20)),
+                ('business_key', models.CharField(max_length=50)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('imported_at', models.DateTimeField()),
+                ('deactivated_at', models.DateTimeField(blank=True, null=True)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_fingerprints', to='uvaq.personalinformation')),
+            ],
+            options={
+                'unique_together': {('source', 'business_key')},
+            },
+        ),
+    ]
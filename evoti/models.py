@@ -1,3 +1,147 @@
 from django.db import models
 
-# Create your models here.
+
+class BulkJob(models.Model):
+    """
+    Bulk operation queued for the `run_bulk_jobs` worker.
+
+    The payload is processed in chunks of `chunk_size` items, each in its own transaction that
+    also records the job's progress, so an interrupted or failed job resumes after its last
+    committed chunk when it is claimed again. Every claim issues a new `claim_token`; progress
+    is only recorded while the worker's token is still the job's, so a worker whose job was
+    taken over stops instead of writing alongside the new owner.
+
+    Attributes:
+        operation (str): Which bulk operation `payload` is for.
+        status (str): Pending, running, completed or failed.
+        payload (list): The items to process, as the synchronous endpoint would receive them.
+        total (int): Number of items in `payload`.
+        processed (int): Number of items in committed chunks.
+        succeeded (int): Items created or updated.
+        failed (int): Items rejected, detailed in `errors`.
+        errors (list): Per-item errors, with payload indexes or student ids.
+        result (list): Ids of the created or updated rows.
+        error_message (str): Why the job failed, if it did.
+        attempts (int): Number of times the job was claimed.
+        claim_token (UUID): Identifies the worker's current claim.
+    """
+
+    class Operation(models.TextChoices):
+        CREATE_STUDENTS = "create_students", "Create students"
+        CREATE_STAFF = "create_staff", "Create staff"
+        CREATE_PROFESSORS = "create_professors", "Create professors"
+        UPDATE_STUDENTS = "update_students", "Update students"
+        ACTIVATE_STUDENTS = "activate_students", "Activate students"
+        INACTIVATE_STUDENTS = "inactivate_students", "Inactivate students"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+
+    operation = models.CharField(max_length=30, choices=Operation.choices)
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        db_index=True,
+    )
+    payload = models.JSONField()
+    chunk_size = models.PositiveIntegerField(default=500)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    succeeded = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    result = models.JSONField(default=list, blank=True)
+    error_message = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    claim_token = models.UUIDField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+
+    def __str__(self):
+        return f"{self.get_operation_display()} #{self.pk} ({self.status})"
+
+    @property
+    def progress(self):
+        return round(100 * self.processed / self.total, 2) if self.total else 100.0
+
+    @property
+    def throughput(self):
+        """
+        Items processed per second since the job started.
+        """
+        end = self.finished_at or self.heartbeat_at
+        if not self.started_at or not end:
+            return None
+        elapsed = (end - self.started_at).total_seconds()
+        return round(self.processed / elapsed, 2) if elapsed > 0 else None
+
+
+class ImportFingerprint(models.Model):
+    """
+    Hash of the CSV row a person was last imported from, per source and business id.
+
+    Incremental imports skip the rows whose hash is unchanged, so a monthly refresh only writes
+    the rows that changed. People missing from a later extract can be deactivated; they are
+    marked with `deactivated_at` and reactivated if they reappear.
+
+    Attributes:
+        source (str): Which CSV import the row came from.
+        business_key (str): The student, professor or staff id of the row.
+        fingerprint (str): SHA-256 of the row's normalized values.
+        person (PersonalInformation): The person the row was imported into.
+        imported_at (datetime): When the row was last written.
+        deactivated_at (datetime): When the person was deactivated for missing from the source.
+    """
+
+    class Source(models.TextChoices):
+        STUDENTS = "students", "Students"
+        PROFESSORS = "professors", "Professors"
+        STAFF = "staff", "Staff"
+
+    source = models.CharField(max_length=20, choices=Source.choices)
+    business_key = models.CharField(max_length=50)
+    fingerprint = models.CharField(max_length=64)
+    person = models.ForeignKey(
+        "uvaq.PersonalInformation",
+        on_delete=models.CASCADE,
+        related_name="import_fingerprints",
+    )
+    imported_at = models.DateTimeField()
+    deactivated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("source", "business_key")
+
+    def __str__(self):
+        return f"{self.get_source_display()} {self.business_key}"
+
+
+class CacheVersion(models.Model):
+    """
+    Version of an in-process cache, shared by every process through the database.
+
+    Each process keys its cached entries by the version current when they were computed, and
+    writers bump it once their transaction commits, so a write made by any process (web workers,
+    the `run_bulk_jobs` worker, the CSV imports) retires the entries cached by all the others.
+
+    Attributes:
+        name (str): Which cache the version belongs to.
+        version (int): Incremented by every committed write to the cache's sources.
+        updated_at (datetime): When the version was last bumped.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
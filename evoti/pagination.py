@@ -0,0 +1,154 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination over the queryset's current ordering plus the primary key as tiebreaker.
+
+    Each page is fetched with a `WHERE (ordering..., pk) > cursor LIMIT n` query instead of an
+    OFFSET scan, so deep pages cost the same as the first one. The total count is only computed
+    when `include_count=true` is requested.
+
+    Ordering fields must be non-nullable; rows with NULL ordering values are skipped. A requested
+    `ordering` outside the view's `ordering_fields` is rejected, since the cursors would not
+    follow the order the rows are served in.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    count_query_param = "include_count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, page_size, max_page_size):
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+        self.count = queryset.count() if self.include_count(request) else None
+
+        position, reverse = self.decode_cursor(request)
+        ordering = [self.invert(field) for field in self.ordering] if reverse else self.ordering
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position))
+
+        page = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[: self.page_size]
+        if reverse:
+            page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = page
+        return page
+
+    def get_paginated_response(self, data):
+        pagination = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "page_size": self.page_size,
+        }
+        if self.count is not None:
+            pagination["count"] = self.count
+        return Response({"pagination": pagination, "results": data})
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def include_count(self, request):
+        return request.query_params.get(self.count_query_param, "").lower() in ("1", "true")
+
+    def get_ordering(self, queryset, view):
+        self.validate_ordering(view)
+        ordering = list(queryset.query.order_by) or list(getattr(view, "ordering", None) or [])
+        if not any(field.lstrip("-") in ("pk", "id") for field in ordering):
+            direction = "-" if ordering and ordering[0].startswith("-") else ""
+            ordering.append(f"{direction}pk")
+        return ordering
+
+    def validate_ordering(self, view):
+        requested = self.request.query_params.get(api_settings.ORDERING_PARAM)
+        allowed = getattr(view, "ordering_fields", None)
+        if not requested or allowed is None or allowed == "__all__":
+            return
+        unknown = [
+            field.strip()
+            for field in requested.split(",")
+            if field.strip().lstrip("-") not in allowed
+        ]
+        if unknown:
+            raise ValidationError(
+                {api_settings.ORDERING_PARAM: f"Unknown ordering fields: {', '.join(unknown)}"}
+            )
+
+    @staticmethod
+    def invert(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def after(ordering, position):
+        """
+        Builds the filter for rows strictly after `position` in the given ordering.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_position(self, instance):
+        position = []
+        for field in self.ordering:
+            value = instance
+            for attr in field.lstrip("-").split("__"):
+                value = getattr(value, attr)
+            position.append(value)
+        return position
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({"p": position, "r": reverse}, default=str)
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        params = self.request.query_params.copy()
+        params[self.cursor_query_param] = cursor
+        return self.request.build_absolute_uri(f"{self.request.path}?{params.urlencode()}")
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            position, reverse = payload["p"], bool(payload["r"])
+        except (ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
@@ -1,4 +1,5 @@
 from datetime import date
+from functools import cached_property
 from typing import ClassVar
 
 import pycountry
@@ -6,6 +7,7 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
+from evoti.models import BulkJob
 from uvaq.models import (
     AcademicPeriod,
     AcademicProfile,
@@ -34,6 +36,18 @@ from uvaq.models import (
 )
 
 
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that takes an optional `fields` argument restricting the output to those fields.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 # Base Serializers for Common Models
 class PersonalInformationSerializer(serializers.ModelSerializer):
     age = serializers.SerializerMethodField()
@@ -55,8 +69,13 @@ class PersonalInformationSerializer(serializers.ModelSerializer):
             "role",
         ]
 
+    @cached_property
+    def today(self):
+        # Evaluated once per serializer, not once per serialized row.
+        return date.today()
+
     def get_age(self, obj):
-        today = date.today()
+        today = self.today
         return (
             today.year
             - obj.birth_date.year
@@ -134,7 +153,8 @@ class VehicleSerializer(serializers.ModelSerializer):
 
     def get_insurance_info(self, obj):
         try:
-            insurance = obj.insurance_info.first()
+            # Same row as `.first()`, picked from the prefetched insurance records.
+            insurance = min(obj.insurance_info.all(), key=lambda i: i.pk, default=None)
             if insurance:
                 return {"policy_number": insurance.policy_number, "provider": insurance.provider}
         except:
@@ -246,15 +266,17 @@ class FinancialInformationSerializer(serializers.ModelSerializer):
         ]
 
     def get_payment_summary(self, obj):
+        # Computed in memory so the `payments` prefetch of the student queryset is reused.
         try:
-            student = obj.user.student
-            payments = student.payments.all()
+            payments = obj.user.student.payments.all()
+            pending = [p for p in payments if p.status == "pending"]
+            completed = [p for p in payments if p.status == "completed"]
             return {
-                "total_payments": payments.count(),
-                "pending_payments": payments.filter(status="pending").count(),
-                "completed_payments": payments.filter(status="completed").count(),
-                "total_paid": sum(p.amount for p in payments.filter(status="completed")),
-                "total_pending": sum(p.amount for p in payments.filter(status="pending")),
+                "total_payments": len(payments),
+                "pending_payments": len(pending),
+                "completed_payments": len(completed),
+                "total_paid": sum(p.amount for p in completed),
+                "total_pending": sum(p.amount for p in pending),
             }
         except:
             return {}
@@ -458,7 +480,7 @@ class ProfessorSubjectSerializer(serializers.ModelSerializer):
 
 
 # Main Complete Serializers
-class CompleteStudentSerializer(serializers.ModelSerializer):
+class CompleteStudentSerializer(DynamicFieldsModelSerializer):
     personal_info = PersonalInformationSerializer(read_only=True)
     contact_info = ContactInformationSerializer(source="personal_info.contact_info", read_only=True)
     identification = IdentificationSerializer(source="personal_info.identification", read_only=True)
@@ -588,14 +610,14 @@ class CompleteStudentSerializer(serializers.ModelSerializer):
         return obj.periods_completed + 1 if obj.is_active else obj.periods_completed
 
     def get_gpa(self, obj):
-        enrollments = obj.enrollment_set.filter(final_grade__isnull=False)
-        if enrollments.exists():
-            total_grades = sum(enrollment.final_grade for enrollment in enrollments)
-            return round(total_grades / enrollments.count(), 2)
+        # Computed in memory so the `enrollment_set` prefetch is reused.
+        grades = [e.final_grade for e in obj.enrollment_set.all() if e.final_grade is not None]
+        if grades:
+            return round(sum(grades) / len(grades), 2)
         return None
 
 
-class CompleteStaffSerializer(serializers.ModelSerializer):
+class CompleteStaffSerializer(DynamicFieldsModelSerializer):
     user = PersonalInformationSerializer(read_only=True)
     contact_info = ContactInformationSerializer(source="user.contact_info", read_only=True)
     identification = IdentificationSerializer(source="user.identification", read_only=True)
@@ -661,11 +683,14 @@ class CompleteStaffSerializer(serializers.ModelSerializer):
         return today.year - obj.hire_date.year
 
     def get_current_responsibilities(self, obj):
-        current = obj.responsibilities.filter(is_current=True)
+        # Loaded once per page by `get_staff_queryset()`; queried for standalone instances.
+        current = getattr(obj, "current_responsibility_list", None)
+        if current is None:
+            current = obj.responsibilities.filter(is_current=True)
         return ResponsibilitySerializer(current, many=True).data
 
 
-class CompleteProfessorSerializer(serializers.ModelSerializer):
+class CompleteProfessorSerializer(DynamicFieldsModelSerializer):
     user = PersonalInformationSerializer(read_only=True)
     contact_info = ContactInformationSerializer(source="user.contact_info", read_only=True)
     identification = IdentificationSerializer(source="user.identification", read_only=True)
@@ -726,11 +751,24 @@ class CompleteProfessorSerializer(serializers.ModelSerializer):
         today = date.today()
         return today.year - obj.hire_date.year
 
+    def get_active_assignments(self, obj):
+        # Loaded once per page by `get_professor_queryset()`; queried for standalone instances.
+        assignments = getattr(obj, "active_assignments", None)
+        if assignments is None:
+            assignments = obj.professorsubject_set.filter(
+                period__is_active=True,
+            ).select_related("subject", "period")
+        return assignments
+
     def get_teaching_load(self, obj):
-        current_assignments = obj.professorsubject_set.filter(period__is_active=True)
-        total_hours = sum(assignment.subject.hours_per_week for assignment in current_assignments)
+        if hasattr(obj, "active_weekly_hours"):
+            course_count, total_hours = obj.active_courses_count, obj.active_weekly_hours
+        else:
+            current_assignments = list(self.get_active_assignments(obj))
+            course_count = len(current_assignments)
+            total_hours = sum(a.subject.hours_per_week for a in current_assignments)
         return {
-            "current_courses": current_assignments.count(),
+            "current_courses": course_count,
             "total_weekly_hours": total_hours,
             "max_hours_per_week": obj.max_hours_per_week,
             "utilization_percentage": round((total_hours / obj.max_hours_per_week) * 100, 2)
@@ -739,10 +777,6 @@ class CompleteProfessorSerializer(serializers.ModelSerializer):
         }
 
     def get_current_courses(self, obj):
-        current_assignments = obj.professorsubject_set.filter(
-            period__is_active=True,
-        ).select_related("subject", "period")
-
         return [
             {
                 "subject_code": assignment.subject.code,
@@ -753,7 +787,7 @@ class CompleteProfessorSerializer(serializers.ModelSerializer):
                 "period": assignment.period.name,
                 "credits": assignment.subject.credits,
             }
-            for assignment in current_assignments
+            for assignment in self.get_active_assignments(obj)
         ]
 
 
@@ -1523,3 +1557,34 @@ class PaymentCreateUpdateSerializer(serializers.ModelSerializer):
                 # Payment is made before due date, which is fine
                 pass
         return data
+
+
+class BulkJobSerializer(serializers.ModelSerializer):
+    """Serializer for bulk job progress"""
+
+    progress = serializers.FloatField(read_only=True)
+    throughput = serializers.FloatField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = BulkJob
+        fields = [
+            "id",
+            "operation",
+            "status",
+            "total",
+            "processed",
+            "succeeded",
+            "failed",
+            "progress",
+            "throughput",
+            "chunk_size",
+            "errors",
+            "result",
+            "error_message",
+            "attempts",
+            "created_at",
+            "started_at",
+            "heartbeat_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
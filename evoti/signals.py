@@ -0,0 +1,135 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from uvaq.models import (
+    AcademicPeriod,
+    AcademicProfile,
+    AcademicRecord,
+    AccessControl,
+    AdmissionData,
+    Career,
+    ContactInformation,
+    EmergencyInformation,
+    Enrollment,
+    FinancialInformation,
+    Graduation,
+    Identification,
+    InsuranceInformation,
+    Payment,
+    PersonalInformation,
+    Professor,
+    ProfessorSubject,
+    Responsibility,
+    StaffProfile,
+    Student,
+    StudyPlan,
+    StudyPlanSubject,
+    Subject,
+    UniversityInfo,
+    UserUniversity,
+    Vehicle,
+)
+
+from .detail_cache import detail_cache
+from .statistics import statistics_cache
+
+# Models whose rows feed the statistics endpoints. Any write to one of them drops the cached
+# snapshots; they are cheap enough to recompute on the next request.
+STATISTICS_SOURCES = (
+    Student,
+    Career,
+    Graduation,
+    FinancialInformation,
+    StaffProfile,
+    Professor,
+    ProfessorSubject,
+    AcademicPeriod,
+)
+
+
+def invalidate_statistics(sender, **kwargs):
+    statistics_cache.invalidate()
+
+
+for model in STATISTICS_SOURCES:
+    post_save.connect(
+        invalidate_statistics,
+        sender=model,
+        dispatch_uid=f"statistics-save-{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_statistics,
+        sender=model,
+        dispatch_uid=f"statistics-delete-{model.__name__}",
+    )
+
+m2m_changed.connect(
+    invalidate_statistics,
+    sender=Professor.courses_taught.through,
+    dispatch_uid="statistics-courses-taught",
+)
+
+
+# Models rendered in the person detail payloads, directly or as shared catalog rows. A write to
+# any of them retires every cached payload, in every process, once it commits.
+DETAIL_SOURCES = (
+    PersonalInformation,
+    ContactInformation,
+    Identification,
+    EmergencyInformation,
+    FinancialInformation,
+    AcademicProfile,
+    AdmissionData,
+    UserUniversity,
+    AccessControl,
+    Vehicle,
+    InsuranceInformation,
+    Student,
+    Enrollment,
+    AcademicRecord,
+    Payment,
+    Graduation,
+    Professor,
+    ProfessorSubject,
+    StaffProfile,
+    Responsibility,
+    UniversityInfo,
+    Career,
+    StudyPlan,
+    StudyPlanSubject,
+    Subject,
+    AcademicPeriod,
+)
+
+
+def invalidate_details(sender, **kwargs):
+    detail_cache.invalidate()
+
+
+def invalidate_detail_links(sender, action, **kwargs):
+    if action.startswith("post_"):
+        detail_cache.invalidate()
+
+
+for model in DETAIL_SOURCES:
+    post_save.connect(
+        invalidate_details,
+        sender=model,
+        dispatch_uid=f"detail-save-{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_details,
+        sender=model,
+        dispatch_uid=f"detail-delete-{model.__name__}",
+    )
+
+for relation in (
+    Professor.courses_taught,
+    AccessControl.vehicle,
+    Career.study_plans,
+    Subject.prerequisites,
+):
+    m2m_changed.connect(
+        invalidate_detail_links,
+        sender=relation.through,
+        dispatch_uid=f"detail-links-{relation.through.__name__}",
+    )
@@ -0,0 +1,330 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+from cachetools import TTLCache
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from evoti.cache_versions import STATISTICS_VERSION, bump_version, current_version
+from uvaq.models import Professor, ProfessorSubject, StaffProfile, Student
+
+STATISTICS_CACHE_TTL = 300
+STATISTICS_CACHE_MAXSIZE = 256
+
+
+def rollup(rows, dimensions, measures):
+    """
+    Folds finest-grain grouped rows into a grand total and one breakdown per dimension.
+
+    This is the `GROUP BY ... WITH ROLLUP` of the grouped query, done in Python so it works on
+    every backend: the grouped rows are few, and the table is still scanned once.
+
+    Args:
+        rows (Iterable[dict]): Rows from a `values(*dimensions).annotate(*measures)` query.
+        dimensions (Iterable[str]): The grouping columns.
+        measures (Iterable[str]): The additive aggregates (counts and sums) of each row.
+
+    Returns:
+        tuple: The grand total of each measure, and for each dimension the totals keyed by value.
+    """
+    total = Counter()
+    breakdowns = {dimension: defaultdict(Counter) for dimension in dimensions}
+    for row in rows:
+        for measure in measures:
+            value = row[measure] or 0
+            total[measure] += value
+            for dimension, groups in breakdowns.items():
+                groups[row[dimension]][measure] += value
+    return total, breakdowns
+
+
+def average(total, count):
+    return total / count if count else None
+
+
+def counts(groups):
+    return {value: group["count"] for value, group in groups.items()}
+
+
+def compute_student_statistics(queryset=None):
+    """
+    Computes the student statistics in a single query grouped by status, career and campus.
+
+    Every total and breakdown is folded from the grouped rows, and the debt is summed across the
+    one-to-one `personal_info -> financial_info` join in the same scan.
+    """
+    if queryset is None:
+        queryset = Student.objects.all()
+    rows = (
+        queryset.order_by()
+        .values("academic_status", "career__name", "campus")
+        .annotate(
+            count=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            graduated=Count("id", filter=Q(graduation__isnull=False)),
+            credits=Sum("credits_approved"),
+            debt=Sum("personal_info__financial_info__total_debt"),
+        )
+    )
+    total, breakdowns = rollup(
+        rows,
+        ("academic_status", "career__name", "campus"),
+        ("count", "active", "graduated", "credits", "debt"),
+    )
+
+    def summarize(groups):
+        return {
+            value: {
+                "count": group["count"],
+                "active": group["active"],
+                "graduated": group["graduated"],
+                "average_credits": average(group["credits"], group["count"]),
+                "total_debt": group["debt"],
+            }
+            for value, group in groups.items()
+        }
+
+    return {
+        "total_students": total["count"],
+        "active_students": total["active"],
+        "graduated_students": total["graduated"],
+        "by_academic_status": counts(breakdowns["academic_status"]),
+        "by_career": counts(breakdowns["career__name"]),
+        "by_campus": counts(breakdowns["campus"]),
+        "average_credits": average(total["credits"], total["count"]),
+        "total_debt": total["debt"],
+        "breakdowns": {
+            "academic_status": summarize(breakdowns["academic_status"]),
+            "career": summarize(breakdowns["career__name"]),
+            "campus": summarize(breakdowns["campus"]),
+        },
+    }
+
+
+def compute_staff_statistics(queryset=None):
+    """
+    Computes the staff statistics in a single query grouped by department and staff type.
+    """
+    if queryset is None:
+        queryset = StaffProfile.objects.all()
+    rows = (
+        queryset.order_by()
+        .values("department", "staff_type")
+        .annotate(count=Count("id"), active=Count("id", filter=Q(is_active=True)))
+    )
+    total, breakdowns = rollup(rows, ("department", "staff_type"), ("count", "active"))
+
+    def summarize(groups):
+        return {
+            value: {"count": group["count"], "active": group["active"]}
+            for value, group in groups.items()
+        }
+
+    return {
+        "total_staff": total["count"],
+        "active_staff": total["active"],
+        "by_department": counts(breakdowns["department"]),
+        "by_staff_type": counts(breakdowns["staff_type"]),
+        "breakdowns": {
+            "department": summarize(breakdowns["department"]),
+            "staff_type": summarize(breakdowns["staff_type"]),
+        },
+    }
+
+
+def compute_professor_statistics(queryset=None):
+    """
+    Computes the professor statistics in a single query grouped by department.
+
+    "Currently teaching" and the taught course count are correlated per professor (`EXISTS` and a
+    scalar count), so neither joins a many-valued relation into the grouped scan and no
+    `DISTINCT` is needed.
+    """
+    if queryset is None:
+        queryset = Professor.objects.all()
+    courses = (
+        ProfessorSubject.objects.filter(professor=OuterRef("pk"))
+        .order_by()
+        .values("professor")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    rows = (
+        queryset.order_by()
+        .annotate(
+            teaching=Exists(
+                ProfessorSubject.objects.filter(professor=OuterRef("pk"), period__is_active=True),
+            ),
+            courses=Coalesce(Subquery(courses, output_field=IntegerField()), 0),
+        )
+        .values("department")
+        .annotate(
+            count=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            teaching_count=Count("id", filter=Q(teaching=True)),
+            hours=Sum("max_hours_per_week"),
+            courses_count=Sum("courses"),
+        )
+    )
+    total, breakdowns = rollup(
+        rows,
+        ("department",),
+        ("count", "active", "teaching_count", "hours", "courses_count"),
+    )
+
+    return {
+        "total_professors": total["count"],
+        "active_professors": total["active"],
+        "currently_teaching": total["teaching_count"],
+        "by_department": counts(breakdowns["department"]),
+        "average_teaching_hours": average(total["hours"], total["count"]),
+        "total_courses_taught": total["courses_count"],
+        "breakdowns": {
+            "department": {
+                value: {
+                    "count": group["count"],
+                    "active": group["active"],
+                    "currently_teaching": group["teaching_count"],
+                    "average_teaching_hours": average(group["hours"], group["count"]),
+                    "total_courses_taught": group["courses_count"],
+                }
+                for value, group in breakdowns["department"].items()
+            },
+        },
+    }
+
+
+class StatisticsCache:
+    """
+    TTL cache of statistics snapshots with write-triggered invalidation.
+
+    Snapshots are kept in the process, keyed by the shared `CacheVersion` current when they were
+    computed. Every read checks that version (one indexed query) and writers bump it once per
+    transaction, on commit, so a write made by any process, including the `run_bulk_jobs` worker
+    and the CSV imports, retires the snapshots of every process. A snapshot computed while a
+    write landed is stored under the version it started from and is never served once the bump
+    is visible.
+
+    Concurrent requests for the same snapshot are coalesced: the first caller computes it while
+    the others wait on a per-key lock and then read the stored result.
+
+    Writes that bypass model signals (`QuerySet.update`, `bulk_update`, raw SQL) must call
+    `invalidate()` themselves, or are only picked up once the TTL expires.
+
+    Attributes:
+        hits (int): Number of snapshots served from the cache.
+        misses (int): Number of snapshots that were recomputed.
+    """
+
+    def __init__(
+        self,
+        ttl=STATISTICS_CACHE_TTL,
+        maxsize=STATISTICS_CACHE_MAXSIZE,
+        version_name=STATISTICS_VERSION,
+    ):
+        self._snapshots = TTLCache(maxsize=maxsize, ttl=ttl, timer=time.monotonic)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._version = None
+        self.version_name = version_name
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        """
+        Returns the cached snapshot for `key`, computing it with `compute()` on a miss.
+
+        Args:
+            key (Hashable): Identifies the snapshot.
+            compute (Callable[[], dict]): Builds the statistics when the snapshot is missing.
+
+        Returns:
+            dict: The statistics plus the `computed_at` timestamp of the snapshot.
+        """
+        version = current_version(self.version_name)
+        with self._lock:
+            if version != self._version:
+                # Snapshots of older versions can no longer be served.
+                self._snapshots.clear()
+                self._version = version
+        key = (version, key)
+        snapshot = self._lookup(key)
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            snapshot = self._lookup(key)
+            if snapshot is not None:
+                return snapshot
+
+            with self._lock:
+                self.misses += 1
+            try:
+                snapshot = {**compute(), "computed_at": timezone.now()}
+                with self._lock:
+                    self._snapshots[key] = snapshot
+            finally:
+                # Also when `compute()` raises, so failed keys do not pile up.
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return snapshot
+
+    def _lookup(self, key):
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self.hits += 1
+            return snapshot
+
+    def invalidate(self):
+        """
+        Retires every snapshot, in all processes, once the current transaction commits.
+        """
+        bump_version(self.version_name)
+
+    def clear(self):
+        """
+        Drops the snapshots of this process only.
+        """
+        with self._lock:
+            self._snapshots.clear()
+            self._version = None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": self._snapshots.currsize,
+                "maxsize": self._snapshots.maxsize,
+            }
+
+
+statistics_cache = StatisticsCache()
+
+
+STATISTICS = {
+    "students": compute_student_statistics,
+    "staff": compute_staff_statistics,
+    "professors": compute_professor_statistics,
+}
+
+
+def get_statistics(family, queryset=None, filters=()):
+    """
+    Returns the cached statistics snapshot of a family, optionally restricted to a queryset.
+
+    Args:
+        family (str): One of `STATISTICS`.
+        queryset (QuerySet | None): The rows to aggregate; the whole table when None.
+        filters (tuple): Hashable, normalized description of the filters behind `queryset`.
+            Snapshots are cached per family and filters.
+
+    Returns:
+        dict: The statistics plus the `computed_at` timestamp of the snapshot.
+    """
+    return statistics_cache.get((family, filters), lambda: STATISTICS[family](queryset))
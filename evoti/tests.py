@@ -1,3 +1,663 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import F
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from evoti.bulk import bulk_insert, natural_key
+from evoti import jobs
+from evoti.cache_versions import (
+    DETAIL_VERSION,
+    STATISTICS_VERSION,
+    current_version,
+    increment,
+)
+from evoti.detail_cache import DetailCache, detail_cache
+from evoti.models import BulkJob, CacheVersion
+from evoti.serializers import CompleteProfessorSerializer, CompleteStaffSerializer
+from evoti.statistics import StatisticsCache, statistics_cache
+from evoti.views import get_professor_queryset, get_student_queryset
+from uvaq import factories
+from uvaq.models import (
+    Enrollment,
+    Payment,
+    PersonalInformation,
+    Professor,
+    StaffProfile,
+    Student,
+    Subject,
+    Vehicle,
+)
+
+
+class EvotiAPITestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username="evoti"))
+
+    def list(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+
+class StudentListTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for _ in range(5):
+            factories.student(enrollments=4, payments=3)
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(14):
+                self.assertEqual(len(self.list("student-list", page_size=page_size)), page_size)
+
+    def test_gpa_and_payment_summary_are_computed_from_prefetched_rows(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(4):
+                results = self.list(
+                    "student-list", page_size=page_size, fields="gpa,financial_info"
+                )
+
+        # Three of the four enrollments are graded 8.50; payments are pending, completed, partial.
+        self.assertEqual(Decimal(str(results[0]["gpa"])), Decimal("8.50"))
+        self.assertEqual(
+            results[0]["financial_info"]["payment_summary"],
+            {
+                "total_payments": 3,
+                "pending_payments": 1,
+                "completed_payments": 1,
+                "total_paid": 10.0,
+                "total_pending": 10.0,
+            },
+        )
+
+
+class StaffListTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for _ in range(5):
+            factories.staff(responsibilities=4)
+
+    def test_current_responsibilities_are_prefetched_once_per_page(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(3):
+                results = self.list(
+                    "staff-list", page_size=page_size, fields="id,current_responsibilities"
+                )
+        self.assertEqual(len(results[0]["current_responsibilities"]), 2)
+
+    def test_full_page_query_count_does_not_grow_with_the_page(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(6):
+                self.list("staff-list", page_size=page_size)
+
+    def test_standalone_instance_falls_back_to_a_query(self):
+        fields = {"id", "current_responsibilities"}
+        listed = {row["id"]: row for row in self.list("staff-list", fields=",".join(fields))}
+
+        for staff_profile in StaffProfile.objects.all():
+            with self.assertNumQueries(1):
+                data = CompleteStaffSerializer(staff_profile, fields=fields).data
+            self.assertEqual(data, listed[staff_profile.pk])
+
+
+class ProfessorListTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for _ in range(5):
+            factories.professor(assignments=4)
+
+    def test_active_assignments_are_prefetched_once_per_page(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(3):
+                results = self.list(
+                    "professor-list",
+                    page_size=page_size,
+                    fields="id,current_courses,teaching_load",
+                )
+        self.assertEqual(len(results[0]["current_courses"]), 2)
+        self.assertEqual(results[0]["teaching_load"]["current_courses"], 2)
+
+    def test_full_page_query_count_does_not_grow_with_the_page(self):
+        for page_size in (1, 5):
+            with self.subTest(page_size=page_size), self.assertNumQueries(12):
+                self.list("professor-list", page_size=page_size)
+
+    def test_standalone_instance_falls_back_to_a_query(self):
+        fields = {"id", "current_courses", "teaching_load"}
+        listed = {row["id"]: row for row in self.list("professor-list", fields=",".join(fields))}
+
+        for professor in Professor.objects.all():
+            data = CompleteProfessorSerializer(professor, fields=fields).data
+            self.assertEqual(data, listed[professor.pk])
+
+
+class TeachingLoadTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        detail_cache.clear()
+        self.professor = factories.professor(assignments=4)
+        # Two assignments are in the active period; give one of them a heavier subject.
+        Subject.objects.filter(
+            pk=self.professor.professorsubject_set.filter(period__is_active=True)
+            .values("subject")[:1]
+        ).update(hours_per_week=6)
+        factories.professor(assignments=0)
+
+    def assertTeachingLoad(self, data, courses, hours):
+        load = data["teaching_load"]
+        self.assertEqual((load["current_courses"], load["total_weekly_hours"]), (courses, hours))
+        self.assertEqual(
+            load["utilization_percentage"],
+            round(hours / self.professor.max_hours_per_week * 100, 2),
+        )
+
+    def test_list_reads_the_load_from_annotations(self):
+        with self.assertNumQueries(2):
+            results = self.list("professor-list", fields="id,teaching_load")
+
+        for row in results:
+            if row["id"] == self.professor.pk:
+                self.assertTeachingLoad(row, 2, 10)
+            else:
+                self.assertTeachingLoad(row, 0, 0)
+
+    def test_retrieve_paths_match_the_list(self):
+        listed = {row["id"]: row for row in self.list("professor-list", fields="id,teaching_load")}
+
+        for url in (
+            reverse("professor-detail", args=[self.professor.pk]),
+            reverse("professor-by-id", args=[self.professor.professor_id]),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url, {"fields": "id,teaching_load"})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), listed[self.professor.pk])
+                self.assertTeachingLoad(response.json(), 2, 10)
+
+    def test_annotations_match_the_standalone_fallback(self):
+        professor = get_professor_queryset({"teaching_load"}).get(pk=self.professor.pk)
+        self.assertEqual((professor.active_courses_count, professor.active_weekly_hours), (2, 10))
+
+        fallback = CompleteProfessorSerializer(
+            Professor.objects.get(pk=self.professor.pk), fields={"teaching_load"}
+        ).data
+        self.assertEqual(
+            CompleteProfessorSerializer(professor, fields={"teaching_load"}).data, fallback
+        )
+
+
+class StatisticsCacheTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        statistics_cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                factories.student(enrollments=0, payments=0)
+
+    def active_students(self, **params):
+        response = self.client.get(reverse("students-statistics"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["active_students"]
+
+    def test_cached_snapshot_costs_one_version_check(self):
+        self.assertEqual(self.active_students(), 3)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.active_students(), 3)
+
+    def test_write_committed_by_another_process_retires_the_snapshot(self):
+        self.assertEqual(self.active_students(), 3)
+
+        # Another process writes and bumps the shared version when its transaction commits.
+        Student.objects.filter(pk=Student.objects.first().pk).update(is_active=False)
+        increment(STATISTICS_VERSION)
+
+        self.assertEqual(self.active_students(), 2)
+
+    def test_filtered_snapshots_are_retired_with_the_unfiltered_ones(self):
+        student = Student.objects.select_related("career").first()
+        self.assertEqual(self.active_students(career=student.career.code), 1)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.active_students(career=student.career.code), 1)
+
+        Student.objects.filter(pk=student.pk).update(is_active=False)
+        increment(STATISTICS_VERSION)
+
+        self.assertEqual(self.active_students(career=student.career.code), 0)
+        self.assertEqual(self.active_students(), 2)
+
+    def test_synchronous_bulk_inactivation_retires_the_snapshot(self):
+        self.assertEqual(self.active_students(), 3)
+
+        student = Student.objects.first()
+        url = reverse("students-bulk-inactivate") + "?sync=true"
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {"ids": [student.pk]}, format="json")
+        self.assertEqual(response.json()["inactivated_count"], 1)
+
+        self.assertEqual(self.active_students(), 2)
+
+    def test_invalidate_bumps_the_shared_version_on_commit(self):
+        def compute():
+            return {"total": Student.objects.count()}
+
+        other_process = StatisticsCache()
+        self.assertEqual(other_process.get("students", compute)["total"], 3)
+
+        version = current_version(STATISTICS_VERSION)
+        with self.captureOnCommitCallbacks(execute=True):
+            factories.student()
+            statistics_cache.invalidate()
+            self.assertEqual(current_version(STATISTICS_VERSION), version)
+
+        self.assertEqual(current_version(STATISTICS_VERSION), version + 1)
+        self.assertEqual(other_process.get("students", compute)["total"], 4)
+
+    def test_failed_computation_releases_its_key_lock(self):
+        cache = StatisticsCache()
+
+        def fail():
+            raise RuntimeError("Database unavailable")
+
+        with self.assertRaises(RuntimeError):
+            cache.get("students", fail)
+
+        self.assertEqual(cache._key_locks, {})
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.get("students", lambda: {"total": 3})["total"], 3)
+
+
+class BulkInsertTests(TestCase):
+    def subjects(self, count):
+        return [
+            Subject(
+                code=f"BULK{number}",
+                name=f"Bulk {number}",
+                description="",
+                credits=5,
+                hours_per_week=4,
+                total_hours=64,
+                department="Sciences",
+                type="core",
+            )
+            for number in range(count)
+        ]
+
+    def test_natural_key_is_a_unique_field_set_on_every_object(self):
+        subjects = self.subjects(2)
+        self.assertEqual(natural_key(Subject, subjects), "code")
+        self.assertIsNone(natural_key(PersonalInformation, [PersonalInformation()]))
+
+    def test_keys_are_read_back_by_natural_key_without_returning_rows(self):
+        factories.subject()
+        subjects = self.subjects(3)
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", False):
+            bulk_insert(Subject, subjects)
+
+        for subject in subjects:
+            self.assertEqual(Subject.objects.get(pk=subject.pk).code, subject.code)
+
+    def test_people_are_read_back_by_their_bulk_insert_key(self):
+        people = [
+            PersonalInformation(
+                first_name=f"Bulk{number}",
+                last_name="Last",
+                second_last_name="Second",
+                birth_date=date(2000, 5, 5),
+                gender="male",
+                photo=f"https://uvaq.edu.mx/photos/bulk{number}.jpg",
+                role="student",
+            )
+            for number in range(20)
+        ]
+        features = type(connection.features)
+        # One INSERT and one SELECT per batch, instead of an INSERT and LAST_INSERT_ID() per row.
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", False):
+            with self.assertNumQueries(2):
+                bulk_insert(PersonalInformation, people)
+
+        stored = PersonalInformation.objects.in_bulk([person.pk for person in people])
+        self.assertEqual(
+            [stored[person.pk].first_name for person in people],
+            [person.first_name for person in people],
+        )
+
+
+class BulkJobTests(TestCase):
+    def setUp(self):
+        self.students = [factories.student(enrollments=0, payments=0) for _ in range(4)]
+        self.ids = [student.pk for student in self.students]
+        self.job = jobs.enqueue_bulk_job(
+            BulkJob.Operation.INACTIVATE_STUDENTS, self.ids, chunk_size=2
+        )
+
+    def fail_second_chunk(self):
+        handler = jobs.JOB_HANDLERS[BulkJob.Operation.INACTIVATE_STUDENTS]
+
+        def flaky(items, offset):
+            if offset:
+                raise RuntimeError("Deadlock found")
+            return handler(items, offset)
+
+        return mock.patch.dict(
+            jobs.JOB_HANDLERS, {BulkJob.Operation.INACTIVATE_STUDENTS: flaky}
+        )
+
+    def age(self, **fields):
+        BulkJob.objects.filter(pk=self.job.pk).update(
+            **{field: value - timedelta(minutes=5) for field, value in fields.items()}
+        )
+
+    def test_failed_job_is_retried_from_its_last_committed_chunk(self):
+        with self.fail_second_chunk(), self.assertLogs("evoti.jobs", "ERROR"):
+            job = jobs.run_bulk_job(jobs.claim_bulk_job())
+        self.assertEqual((job.status, job.processed, job.attempts), (BulkJob.Status.FAILED, 2, 1))
+
+        self.assertIsNone(jobs.claim_bulk_job(retry_after=timedelta(minutes=1)))
+        self.age(finished_at=job.finished_at)
+        job = jobs.run_bulk_job(jobs.claim_bulk_job(retry_after=timedelta(minutes=1)))
+
+        self.assertEqual(job.status, BulkJob.Status.COMPLETED)
+        self.assertEqual((job.processed, job.succeeded, job.attempts), (4, 4, 2))
+        self.assertEqual(job.error_message, "")
+        self.assertFalse(Student.objects.filter(pk__in=self.ids, is_active=True).exists())
+
+    def test_retries_are_bounded(self):
+        for attempt in range(1, jobs.BULK_JOB_MAX_ATTEMPTS + 1):
+            with self.fail_second_chunk(), self.assertLogs("evoti.jobs", "ERROR"):
+                job = jobs.run_bulk_job(jobs.claim_bulk_job(retry_after=timedelta(minutes=1)))
+            self.assertEqual((job.status, job.attempts), (BulkJob.Status.FAILED, attempt))
+            self.age(finished_at=job.finished_at)
+
+        self.assertIsNone(jobs.claim_bulk_job(retry_after=timedelta(minutes=1)))
+
+    def test_worker_stops_when_its_job_is_taken_over(self):
+        job = jobs.claim_bulk_job()
+        self.age(heartbeat_at=job.heartbeat_at)
+        other = jobs.claim_bulk_job(stale_after=timedelta(minutes=1))
+        self.assertEqual((other.pk, other.attempts), (job.pk, 2))
+
+        with self.assertLogs("evoti.jobs", "WARNING"):
+            job = jobs.run_bulk_job(job)
+
+        self.assertEqual((job.status, job.processed), (BulkJob.Status.RUNNING, 0))
+        self.assertEqual(job.claim_token, other.claim_token)
+        self.assertEqual(Student.objects.filter(pk__in=self.ids, is_active=True).count(), 4)
+
+
+class BulkUpdateStudentsTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student = factories.student()
+        self.old_name = self.student.personal_info.first_name
+        detail_cache.clear()
+        statistics_cache.clear()
+
+    def bulk_update(self, response_mode=None):
+        params = {"sync": "true"}
+        if response_mode:
+            params["response"] = response_mode
+        payload = [
+            {"id": self.student.pk, "data": {"personal_info": {"first_name": "Renamed"}}},
+            {"id": 0, "data": {}},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("students-bulk-update") + "?" + urlencode(params), payload, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["updated"], 1)
+        self.assertEqual(data["errors"], [{"id": 0, "errors": "Student not found"}])
+        return data["students"]
+
+    def test_summary_lists_only_the_changed_fields(self):
+        self.assertEqual(
+            self.bulk_update(),
+            [
+                {
+                    "id": self.student.pk,
+                    "changes": {"personal_info.first_name": [self.old_name, "Renamed"]},
+                },
+            ],
+        )
+
+    def test_full_returns_the_complete_students(self):
+        (student,) = self.bulk_update("full")
+
+        self.assertEqual(student["id"], self.student.pk)
+        self.assertEqual(student["personal_info"]["first_name"], "Renamed")
+        self.assertIn("financial_info", student)
+        self.assertNotIn("changes", student)
+
+    def test_unknown_response_mode_is_rejected(self):
+        url = reverse("students-bulk-update") + "?sync=true&response=diff"
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.patch(url, [], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_update_retires_the_cached_detail_and_statistics(self):
+        url = reverse("student-by-id", args=[self.student.student_id])
+        self.assertEqual(
+            self.client.get(url).json()["personal_info"]["first_name"], self.old_name
+        )
+        versions = [current_version(name) for name in (DETAIL_VERSION, STATISTICS_VERSION)]
+
+        self.bulk_update()
+
+        self.assertEqual(
+            [current_version(name) for name in (DETAIL_VERSION, STATISTICS_VERSION)],
+            [version + 1 for version in versions],
+        )
+        self.assertEqual(self.client.get(url).json()["personal_info"]["first_name"], "Renamed")
+
+
+class DetailCacheTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student = factories.student()
+        detail_cache.clear()
+
+    def first_name(self):
+        url = reverse("student-by-id", args=[self.student.student_id])
+        response = self.client.get(url, {"fields": "personal_info"})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["personal_info"]["first_name"]
+
+    def test_repeat_lookups_skip_the_database(self):
+        name = self.first_name()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.first_name(), name)
+
+    def test_write_committed_by_another_process_retires_the_payload(self):
+        self.first_name()
+
+        # Another process writes and bumps the shared version when its transaction commits.
+        PersonalInformation.objects.filter(pk=self.student.personal_info_id).update(
+            first_name="Renamed"
+        )
+        CacheVersion.objects.filter(name=DETAIL_VERSION).update(version=F("version") + 1)
+        self.assertNotEqual(self.first_name(), "Renamed")
+
+        later = time.monotonic() + detail_cache.version_max_age
+        with mock.patch("evoti.cache_versions.time.monotonic", return_value=later):
+            self.assertEqual(self.first_name(), "Renamed")
+
+    def test_writes_bump_each_version_once_per_transaction(self):
+        version = current_version(DETAIL_VERSION)
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                factories.student()
+                factories.staff()
+
+        table = CacheVersion._meta.db_table
+        bumps = [q for q in queries if q["sql"].startswith("UPDATE") and table in q["sql"]]
+        self.assertEqual(len(bumps), 2)
+        self.assertEqual(current_version(DETAIL_VERSION), version + 1)
+
+    def test_rolled_back_savepoint_does_not_swallow_later_bumps(self):
+        version = current_version(DETAIL_VERSION)
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    detail_cache.invalidate()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            detail_cache.invalidate()
+
+        self.assertEqual(current_version(DETAIL_VERSION), version + 1)
+
+    def test_signal_invalidation_reaches_other_processes_on_commit(self):
+        other_process = DetailCache()
+        person = self.student.personal_info
+
+        def render():
+            return {"first_name": PersonalInformation.objects.get(pk=person.pk).first_name}
+
+        other_process.get("person", render)
+        version = current_version(DETAIL_VERSION)
+        with self.captureOnCommitCallbacks(execute=True):
+            person.first_name = "Renamed"
+            person.save()
+
+        self.assertEqual(current_version(DETAIL_VERSION), version + 1)
+        self.assertEqual(other_process.get("person", render)["first_name"], "Renamed")
+
+
+class KeysetPaginationTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        students = [factories.student(enrollments=0, payments=0) for _ in range(5)]
+        # Two students enrolled later; the other three tie on the ordering field.
+        Student.objects.filter(pk__in=[students[1].pk, students[3].pk]).update(
+            enrollment_date=date(2022, 1, 1)
+        )
+        self.expected = list(
+            Student.objects.order_by("-enrollment_date", "-pk").values_list("pk", flat=True)
+        )
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def first_page(self, **params):
+        return self.get(
+            reverse("student-list"), pagination="cursor", page_size=2, fields="id", **params
+        )
+
+    def test_next_links_walk_every_row_once_across_ties(self):
+        page = self.first_page()
+        seen = [row["id"] for row in page["results"]]
+        while page["pagination"]["next"]:
+            page = self.get(page["pagination"]["next"])
+            seen += [row["id"] for row in page["results"]]
+
+        self.assertEqual(seen, self.expected)
+        self.assertIsNotNone(page["pagination"]["previous"])
+
+    def test_previous_links_walk_back_in_the_same_order(self):
+        page = self.first_page()
+        self.assertIsNone(page["pagination"]["previous"])
+        while page["pagination"]["next"]:
+            page = self.get(page["pagination"]["next"])
+
+        seen = [row["id"] for row in page["results"]]
+        while page["pagination"]["previous"]:
+            page = self.get(page["pagination"]["previous"])
+            seen = [row["id"] for row in page["results"]] + seen
+
+        self.assertEqual(seen, self.expected)
+        self.assertIsNotNone(page["pagination"]["next"])
+
+    def test_count_is_only_computed_on_request(self):
+        with self.assertNumQueries(1):
+            self.assertNotIn("count", self.first_page()["pagination"])
+        self.assertEqual(self.first_page(include_count="true")["pagination"]["count"], 5)
+
+    def test_invalid_cursor_is_not_found(self):
+        for cursor in ("not-base64!", "e30=", "eyJwIjogWzFdLCAiciI6IGZhbHNlfQ=="):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(reverse("student-list"), {"cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_unknown_ordering_is_rejected(self):
+        response = self.client.get(
+            reverse("student-list"), {"pagination": "cursor", "ordering": "-gpa"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+        page = self.first_page(ordering="student_id")
+        self.assertEqual(len(page["results"]), 2)
+
+    def test_page_numbers_are_served_without_a_cursor(self):
+        pagination = self.get(reverse("student-list"), page_size=2, fields="id")["pagination"]
+
+        self.assertEqual(pagination["count"], 5)
+        self.assertEqual((pagination["total_pages"], pagination["current_page"]), (3, 1))
+        self.assertIn("page=2", pagination["next"])
+
+
+class SparseFieldsTests(EvotiAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for _ in range(3):
+            factories.student(enrollments=2, payments=2)
+
+    def test_fields_prune_the_output_and_its_relations(self):
+        with CaptureQueriesContext(connection) as queries:
+            results = self.list("student-list", fields="id,student_id")
+
+        self.assertEqual({tuple(sorted(row)) for row in results}, {("id", "student_id")})
+        # The count and the page; no join or prefetch is left.
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn("JOIN", queries[1]["sql"])
+
+    def test_expand_adds_nested_fields_to_the_plain_ones(self):
+        with CaptureQueriesContext(connection) as queries:
+            row = self.list("student-list", expand="vehicles")[0]
+
+        self.assertIn("vehicles", row)
+        self.assertIn("student_id", row)
+        self.assertNotIn("enrollments", row)
+        self.assertNotIn("career", row)
+        tables = " ".join(query["sql"] for query in queries)
+        self.assertIn(Vehicle._meta.db_table, tables)
+        self.assertNotIn(Enrollment._meta.db_table, tables)
+        self.assertNotIn(Payment._meta.db_table, tables)
+
+    def test_only_the_relations_of_requested_fields_are_loaded(self):
+        for fields, loaded in (
+            ({"id"}, ()),
+            ({"gpa"}, ("enrollment_set",)),
+            ({"financial_info", "gpa"}, ("payments", "enrollment_set")),
+        ):
+            with self.subTest(fields=fields):
+                queryset = get_student_queryset(fields)
+                self.assertCountEqual(queryset._prefetch_related_lookups, loaded)
+
+        self.assertFalse(get_student_queryset({"id"}).query.select_related)
+        self.assertEqual(
+            get_student_queryset({"personal_info"}).query.select_related, {"personal_info": {}}
+        )
 
-# Create your tests here.
+    def test_unknown_fields_are_rejected(self):
+        for params in ({"fields": "id,nope"}, {"expand": "nope"}):
+            with self.subTest(params=params):
+                response = self.client.get(reverse("student-list"), params)
+                self.assertEqual(response.status_code, 400)
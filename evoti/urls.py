@@ -3,10 +3,17 @@ from django.urls import path
 from evoti.views import (
     ProfessorDetailAPIView,
     ProfessorListAPIView,
+    ProfessorListCreateAPIView,
     StaffDetailAPIView,
     StaffListAPIView,
+    StaffListCreateAPIView,
     StudentDetailAPIView,
     StudentListAPIView,
+    StudentListCreateAPIView,
+    bulk_activate_students,
+    bulk_inactivate_students,
+    bulk_job_detail,
+    bulk_update_students,
     professor_by_professor_id,
     professors_statistics,
     staff_by_staff_id,
@@ -15,17 +22,33 @@ from evoti.views import (
     students_statistics,
 )
 
+# The list endpoints stay read-only; creation goes through the ListCreate views' POST only.
+CREATE_METHODS = ["post", "options"]
+
 urlpatterns = [
     # Student endpoints
     path("students/", StudentListAPIView.as_view(), name="student-list"),
     path("students/<int:pk>/", StudentDetailAPIView.as_view(), name="student-detail"),
     path("students/by-student-id/<str:student_id>/", student_by_student_id, name="student-by-id"),
     path("students/statistics/", students_statistics, name="students-statistics"),
+    path(
+        "students/bulk-create/",
+        StudentListCreateAPIView.as_view(http_method_names=CREATE_METHODS),
+        name="students-bulk-create",
+    ),
+    path("students/bulk-update/", bulk_update_students, name="students-bulk-update"),
+    path("students/bulk-activate/", bulk_activate_students, name="students-bulk-activate"),
+    path("students/bulk-inactivate/", bulk_inactivate_students, name="students-bulk-inactivate"),
     # Staff endpoints
     path("staff/", StaffListAPIView.as_view(), name="staff-list"),
     path("staff/<int:pk>/", StaffDetailAPIView.as_view(), name="staff-detail"),
     path("staff/by-staff-id/<str:staff_id>/", staff_by_staff_id, name="staff-by-id"),
     path("staff/statistics/", staff_statistics, name="staff-statistics"),
+    path(
+        "staff/bulk-create/",
+        StaffListCreateAPIView.as_view(http_method_names=CREATE_METHODS),
+        name="staff-bulk-create",
+    ),
     # Professor endpoints
     path("professors/", ProfessorListAPIView.as_view(), name="professor-list"),
     path("professors/<int:pk>/", ProfessorDetailAPIView.as_view(), name="professor-detail"),
@@ -35,4 +58,11 @@ urlpatterns = [
         name="professor-by-id",
     ),
     path("professors/statistics/", professors_statistics, name="professors-statistics"),
+    path(
+        "professors/bulk-create/",
+        ProfessorListCreateAPIView.as_view(http_method_names=CREATE_METHODS),
+        name="professors-bulk-create",
+    ),
+    # Bulk jobs
+    path("jobs/<int:pk>/", bulk_job_detail, name="bulk-job-detail"),
 ]
@@ -2,32 +2,64 @@ from typing import ClassVar
 
 import django_filters
 from django.db import transaction
-from django.db.models import Avg, Count, Sum
+from django.db.models import Count, OuterRef, Prefetch, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, generics, status
+from rest_framework import filters, generics, serializers, status
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from evoti.bulk import (
+    ProfessorBulkCreator,
+    StaffBulkCreator,
+    StudentBulkCreator,
+    StudentBulkUpdater,
+)
+from evoti.detail_cache import detail_cache, get_person_detail
+from evoti.jobs import enqueue_bulk_job
+from evoti.models import BulkJob
+from evoti.pagination import KeysetCursorPagination
 from evoti.serializers import (
+    BulkJobSerializer,
     CompleteProfessorSerializer,
     CompleteStaffSerializer,
     CompleteStudentSerializer,
+    DynamicFieldsModelSerializer,
     ProfessorCreateUpdateSerializer,
     StaffCreateUpdateSerializer,
     StudentCreateUpdateSerializer,
 )
-from uvaq.models import Professor, StaffProfile, Student
+from evoti.statistics import get_statistics, statistics_cache
+from uvaq.models import Professor, ProfessorSubject, Responsibility, StaffProfile, Student
 
 
 # Custom Pagination Classes
 class StandardResultsSetPagination(PageNumberPagination):
+    """
+    Page number pagination, or keyset pagination when the client opts in with
+    `?pagination=cursor` (or follows a cursor link).
+    """
+
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        cursor_param = KeysetCursorPagination.cursor_query_param
+        if params.get("pagination") == "cursor" or cursor_param in params:
+            self.keyset = KeysetCursorPagination(self.page_size, self.max_page_size)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
         return Response(
             {
                 "pagination": {
@@ -217,79 +249,212 @@ class ProfessorFilter(django_filters.FilterSet):
 
 
 # Base queryset methods for optimization
-def get_student_queryset():
-    return Student.objects.select_related(
-        "personal_info",
-        "personal_info__contact_info",
-        "personal_info__identification",
-        "personal_info__financial_info",
-        "personal_info__academic_profile",
-        "personal_info__admission_data",
-        "personal_info__emergency_info",
-        "personal_info__user_university",
-        "personal_info__user_university__university",
-        "career",
-        "study_plan",
-        "admission_period",
-        "current_period",
-        "graduation",
-    ).prefetch_related(
-        "personal_info__vehicles",
-        "personal_info__vehicles__insurance_info",
-        "personal_info__access_control",
-        "personal_info__access_control__vehicle",
-        "enrollment_set__subject",
-        "enrollment_set__period",
-        "enrollment_set__professor",
-        "academicrecord_set__period",
-        "payments",
-        "career__study_plans",
-        "career__study_plans__subjects",
-    )
+# Each map lists, per serializer field, the relations its output reads. Only the relations of the
+# requested fields are loaded; `fields=None` loads all of them.
+STUDENT_FIELD_RELATIONS = {
+    "personal_info": (["personal_info"], []),
+    "contact_info": (["personal_info__contact_info"], []),
+    "identification": (["personal_info__identification"], []),
+    "financial_info": (["personal_info__financial_info"], ["payments"]),
+    "academic_profile": (["personal_info__academic_profile"], []),
+    "admission_data": (["personal_info__admission_data"], []),
+    "emergency_info": (["personal_info__emergency_info"], []),
+    "user_university": (
+        ["personal_info__user_university", "personal_info__user_university__university"],
+        [],
+    ),
+    "vehicles": ([], ["personal_info__vehicles", "personal_info__vehicles__insurance_info"]),
+    "access_control": (
+        [],
+        ["personal_info__access_control", "personal_info__access_control__vehicle"],
+    ),
+    "career": (["career"], ["career__study_plans", "career__study_plans__subjects"]),
+    "study_plan": (["study_plan"], ["study_plan__subjects"]),
+    "admission_period": (["admission_period"], []),
+    "current_period": (["current_period"], []),
+    "enrollments": (
+        [],
+        [
+            "enrollment_set__subject",
+            "enrollment_set__subject__prerequisites",
+            "enrollment_set__period",
+            "enrollment_set__professor",
+        ],
+    ),
+    "academic_records": ([], ["academicrecord_set__period"]),
+    "graduation": (["graduation"], []),
+    "academic_progress": (["study_plan"], []),
+    "gpa": ([], ["enrollment_set"]),
+}
+
+STAFF_FIELD_RELATIONS = {
+    "user": (["user"], []),
+    "contact_info": (["user__contact_info"], []),
+    "identification": (["user__identification"], []),
+    "emergency_info": (["user__emergency_info"], []),
+    "user_university": (["user__user_university", "user__user_university__university"], []),
+    "vehicles": ([], ["user__vehicles", "user__vehicles__insurance_info"]),
+    "access_control": ([], ["user__access_control", "user__access_control__vehicle"]),
+    "supervisor_info": (["supervisor", "supervisor__user"], []),
+    "responsibilities": ([], ["responsibilities"]),
+}
+
+PROFESSOR_FIELD_RELATIONS = {
+    "user": (["user"], []),
+    "contact_info": (["user__contact_info"], []),
+    "identification": (["user__identification"], []),
+    "emergency_info": (["user__emergency_info"], []),
+    "user_university": (["user__user_university", "user__user_university__university"], []),
+    "vehicles": ([], ["user__vehicles", "user__vehicles__insurance_info"]),
+    "access_control": ([], ["user__access_control", "user__access_control__vehicle"]),
+    "courses_taught": ([], ["courses_taught", "courses_taught__prerequisites"]),
+    "current_assignments": (
+        [],
+        [
+            "professorsubject_set__subject",
+            "professorsubject_set__subject__prerequisites",
+            "professorsubject_set__period",
+        ],
+    ),
+    "advised_graduations": ([], ["graduation_set__student", "graduation_set__graduation_period"]),
+}
+
+
+def select_field_relations(queryset, field_relations, fields=None):
+    select_related, prefetch_related = {}, {}
+    for name, (select, prefetch) in field_relations.items():
+        if fields is None or name in fields:
+            select_related.update(dict.fromkeys(select))
+            prefetch_related.update(dict.fromkeys(prefetch))
+    if select_related:
+        # Without arguments, select_related() would join every non-null foreign key.
+        queryset = queryset.select_related(*select_related)
+    return queryset.prefetch_related(*prefetch_related)
+
+
+def get_student_queryset(fields=None):
+    return select_field_relations(Student.objects.all(), STUDENT_FIELD_RELATIONS, fields)
+
+
+def get_staff_queryset(fields=None):
+    queryset = select_field_relations(StaffProfile.objects.all(), STAFF_FIELD_RELATIONS, fields)
+    if fields is None or "current_responsibilities" in fields:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "responsibilities",
+                queryset=Responsibility.objects.filter(is_current=True),
+                to_attr="current_responsibility_list",
+            ),
+        )
+    return queryset
+
+
+def get_professor_queryset(fields=None):
+    queryset = select_field_relations(Professor.objects.all(), PROFESSOR_FIELD_RELATIONS, fields)
+    if fields is None or "current_courses" in fields:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "professorsubject_set",
+                queryset=ProfessorSubject.objects.filter(period__is_active=True).select_related(
+                    "subject",
+                    "period",
+                ),
+                to_attr="active_assignments",
+            ),
+        )
+    if fields is None or "teaching_load" in fields:
+        # Correlated subqueries, so filters joining the same tables cannot inflate the totals.
+        active = ProfessorSubject.objects.filter(
+            professor=OuterRef("pk"),
+            period__is_active=True,
+        ).values("professor")
+        queryset = queryset.annotate(
+            active_courses_count=Coalesce(
+                Subquery(active.annotate(total=Count("pk")).values("total")),
+                0,
+            ),
+            active_weekly_hours=Coalesce(
+                Subquery(active.annotate(total=Sum("subject__hours_per_week")).values("total")),
+                0,
+            ),
+        )
+    return queryset
 
 
-def get_staff_queryset():
-    return StaffProfile.objects.select_related(
-        "user",
-        "user__contact_info",
-        "user__identification",
-        "user__emergency_info",
-        "user__user_university",
-        "user__user_university__university",
-        "supervisor",
-        "supervisor__user",
-    ).prefetch_related(
-        "user__vehicles",
-        "user__vehicles__insurance_info",
-        "user__access_control",
-        "user__access_control__vehicle",
-        "responsibilities",
-    )
+def get_requested_fields(request, serializer_class):
+    """
+    Resolves `?fields=` and `?expand=` into the serializer fields to render, or None for all.
 
+    `fields` selects fields by name and `expand` adds nested and computed fields to them. With
+    `expand` alone, every plain field is returned plus the expanded ones.
+    """
+    fields = {name for name in request.query_params.get("fields", "").split(",") if name}
+    expand = {name for name in request.query_params.get("expand", "").split(",") if name}
+    if not (fields or expand) or not issubclass(serializer_class, DynamicFieldsModelSerializer):
+        return None
 
-def get_professor_queryset():
-    return Professor.objects.select_related(
-        "user",
-        "user__contact_info",
-        "user__identification",
-        "user__emergency_info",
-        "user__user_university",
-        "user__user_university__university",
-    ).prefetch_related(
-        "user__vehicles",
-        "user__vehicles__insurance_info",
-        "user__access_control",
-        "user__access_control__vehicle",
-        "courses_taught",
-        "professorsubject_set__subject",
-        "professorsubject_set__period",
-        "graduation_set__student",
-        "graduation_set__graduation_period",
-    )
+    available = serializer_class().fields
+    unknown = (fields | expand) - set(available)
+    if unknown:
+        raise ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}"})
+
+    if not fields:
+        expandable = (serializers.BaseSerializer, serializers.SerializerMethodField)
+        fields = {name for name, field in available.items() if not isinstance(field, expandable)}
+    return fields | expand
+
+
+class SparseFieldsMixin:
+    """
+    Adds `?fields=` / `?expand=` support to the evoti student, staff and professor views: the
+    output is pruned to the requested fields and only their relations are loaded.
+    """
+
+    def get_requested_fields(self):
+        if not hasattr(self, "_requested_fields"):
+            serializer_class = self.get_serializer_class()
+            self._requested_fields = get_requested_fields(self.request, serializer_class)
+        return self._requested_fields
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
 
 
 # API Views
-class StudentListAPIView(generics.ListAPIView):
+# Bulk payloads up to this size can still be processed within the request with `?sync=true`.
+BULK_SYNC_MAX_ITEMS = 500
+
+
+def run_synchronously(request, items):
+    """
+    Whether a bulk payload is processed within the request instead of queued as a job.
+    """
+    if request.query_params.get("sync", "").lower() not in ("1", "true"):
+        return False
+    if len(items) > BULK_SYNC_MAX_ITEMS:
+        raise ValidationError(
+            {"sync": f"Payloads over {BULK_SYNC_MAX_ITEMS} items can only run as a job"},
+        )
+    return True
+
+
+def bulk_job_response(request, operation, items):
+    """
+    Queues a bulk payload and answers 202 with the job to poll.
+    """
+    job = enqueue_bulk_job(operation, items)
+    url = request.build_absolute_uri(reverse("bulk-job-detail", args=[job.id]))
+    return Response(
+        {"job_id": job.id, "status": job.status, "total": job.total, "url": url},
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": url},
+    )
+
+
+class StudentListAPIView(SparseFieldsMixin, generics.ListAPIView):
     """
     GET /api/students/
 
@@ -303,6 +468,10 @@ class StudentListAPIView(generics.ListAPIView):
     Query Parameters:
     - page: Page number (default: 1)
     - page_size: Items per page (default: 20, max: 100)
+    - pagination: 'cursor' for keyset pagination (next/previous cursors, no page numbers)
+    - include_count: Include the total count in cursor mode (true/false)
+    - fields: Comma-separated fields to return (default: all)
+    - expand: Comma-separated nested/computed fields to add (alone: plain fields plus these)
     - search: Search in name, student_id, email
     - student_id: Filter by student ID (partial match)
     - career: Filter by career code
@@ -338,37 +507,10 @@ class StudentListAPIView(generics.ListAPIView):
     ordering: ClassVar[list] = ["-enrollment_date"]
 
     def get_queryset(self):
-        return Student.objects.select_related(
-            "personal_info",
-            "personal_info__contact_info",
-            "personal_info__identification",
-            "personal_info__financial_info",
-            "personal_info__academic_profile",
-            "personal_info__admission_data",
-            "personal_info__emergency_info",
-            "personal_info__user_university",
-            "personal_info__user_university__university",
-            "career",
-            "study_plan",
-            "admission_period",
-            "current_period",
-            "graduation",
-        ).prefetch_related(
-            "personal_info__vehicles",
-            "personal_info__vehicles__insurance_info",
-            "personal_info__access_control",
-            "personal_info__access_control__vehicle",
-            "enrollment_set__subject",
-            "enrollment_set__period",
-            "enrollment_set__professor",
-            "academicrecord_set__period",
-            "payments",
-            "career__study_plans",
-            "career__study_plans__subjects",
-        )
+        return get_student_queryset(self.get_requested_fields())
 
 
-class StudentListCreateAPIView(generics.ListCreateAPIView):
+class StudentListCreateAPIView(SparseFieldsMixin, generics.ListCreateAPIView):
     """
     GET /api/students/
     POST /api/students/
@@ -400,7 +542,7 @@ class StudentListCreateAPIView(generics.ListCreateAPIView):
     ordering: ClassVar[list] = ["-enrollment_date"]
 
     def get_queryset(self):
-        return get_student_queryset()
+        return get_student_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -410,12 +552,16 @@ class StudentListCreateAPIView(generics.ListCreateAPIView):
     def create(self, request, *args, **kwargs):
         """
         Create single or multiple students
+
+        Lists are queued as a background job unless `?sync=true` is given for a small payload.
         """
         # Check if data is a list (bulk creation)
         is_bulk = isinstance(request.data, list)
 
         if is_bulk:
-            return self.bulk_create(request.data)
+            if run_synchronously(request, request.data):
+                return self.bulk_create(request.data)
+            return bulk_job_response(request, BulkJob.Operation.CREATE_STUDENTS, request.data)
         else:
             return self.single_create(request.data)
 
@@ -434,39 +580,32 @@ class StudentListCreateAPIView(generics.ListCreateAPIView):
         """
         Bulk create students
         """
-        created_students = []
-        errors = []
-
-        for i, student_data in enumerate(data_list):
-            try:
-                serializer = StudentCreateUpdateSerializer(data=student_data)
-                if serializer.is_valid():
-                    student = serializer.save()
-                    created_students.append(student)
-                else:
-                    errors.append({"index": i, "errors": serializer.errors})
-            except Exception as e:
-                errors.append({"index": i, "errors": str(e)})
-
-        if errors:
+        creator = StudentBulkCreator(data_list)
+        created_students = creator.create()
+
+        if creator.errors:
             return Response(
                 {
                     "created": len(created_students),
-                    "errors": errors,
+                    "errors": creator.errors,
                     "created_students": [s.id for s in created_students],
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         # Return created students with complete data
-        complete_serializer = CompleteStudentSerializer(created_students, many=True)
+        students = get_student_queryset().in_bulk([s.id for s in created_students])
+        complete_serializer = CompleteStudentSerializer(
+            [students[s.id] for s in created_students],
+            many=True,
+        )
         return Response(
             {"created": len(created_students), "students": complete_serializer.data},
             status=status.HTTP_201_CREATED,
         )
 
 
-class StudentDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class StudentDetailAPIView(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET /api/students/{id}/
     PATCH /api/students/{id}/
@@ -476,7 +615,7 @@ class StudentDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     lookup_field = "pk"
 
     def get_queryset(self):
-        return get_student_queryset()
+        return get_student_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method in ["PATCH", "PUT"]:
@@ -525,7 +664,7 @@ class StudentDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
-class StaffListAPIView(generics.ListAPIView):
+class StaffListAPIView(SparseFieldsMixin, generics.ListAPIView):
     """
     GET /api/staff/
 
@@ -538,6 +677,10 @@ class StaffListAPIView(generics.ListAPIView):
     Query Parameters:
     - page: Page number (default: 1)
     - page_size: Items per page (default: 20, max: 100)
+    - pagination: 'cursor' for keyset pagination (next/previous cursors, no page numbers)
+    - include_count: Include the total count in cursor mode (true/false)
+    - fields: Comma-separated fields to return (default: all)
+    - expand: Comma-separated nested/computed fields to add (alone: plain fields plus these)
     - search: Search in name, staff_id, email
     - department: Filter by department
     - staff_type: Filter by staff type
@@ -572,25 +715,10 @@ class StaffListAPIView(generics.ListAPIView):
     ordering: ClassVar[list] = ["-hire_date"]
 
     def get_queryset(self):
-        return StaffProfile.objects.select_related(
-            "user",
-            "user__contact_info",
-            "user__identification",
-            "user__emergency_info",
-            "user__user_university",
-            "user__user_university__university",
-            "supervisor",
-            "supervisor__user",
-        ).prefetch_related(
-            "user__vehicles",
-            "user__vehicles__insurance_info",
-            "user__access_control",
-            "user__access_control__vehicle",
-            "responsibilities",
-        )
+        return get_staff_queryset(self.get_requested_fields())
 
 
-class StaffListCreateAPIView(generics.ListCreateAPIView):
+class StaffListCreateAPIView(SparseFieldsMixin, generics.ListCreateAPIView):
     """
     GET /api/staff/
     POST /api/staff/
@@ -622,7 +750,7 @@ class StaffListCreateAPIView(generics.ListCreateAPIView):
     ordering: ClassVar[list] = ["-hire_date"]
 
     def get_queryset(self):
-        return get_staff_queryset()
+        return get_staff_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -633,7 +761,9 @@ class StaffListCreateAPIView(generics.ListCreateAPIView):
         is_bulk = isinstance(request.data, list)
 
         if is_bulk:
-            return self.bulk_create(request.data)
+            if run_synchronously(request, request.data):
+                return self.bulk_create(request.data)
+            return bulk_job_response(request, BulkJob.Operation.CREATE_STAFF, request.data)
         else:
             return self.single_create(request.data)
 
@@ -648,38 +778,31 @@ class StaffListCreateAPIView(generics.ListCreateAPIView):
 
     @transaction.atomic
     def bulk_create(self, data_list):
-        created_staff = []
-        errors = []
-
-        for i, staff_data in enumerate(data_list):
-            try:
-                serializer = StaffCreateUpdateSerializer(data=staff_data)
-                if serializer.is_valid():
-                    staff = serializer.save()
-                    created_staff.append(staff)
-                else:
-                    errors.append({"index": i, "errors": serializer.errors})
-            except Exception as e:
-                errors.append({"index": i, "errors": str(e)})
-
-        if errors:
+        creator = StaffBulkCreator(data_list)
+        created_staff = creator.create()
+
+        if creator.errors:
             return Response(
                 {
                     "created": len(created_staff),
-                    "errors": errors,
+                    "errors": creator.errors,
                     "created_staff": [s.id for s in created_staff],
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        complete_serializer = CompleteStaffSerializer(created_staff, many=True)
+        staff = get_staff_queryset().in_bulk([s.id for s in created_staff])
+        complete_serializer = CompleteStaffSerializer(
+            [staff[s.id] for s in created_staff],
+            many=True,
+        )
         return Response(
             {"created": len(created_staff), "staff": complete_serializer.data},
             status=status.HTTP_201_CREATED,
         )
 
 
-class StaffDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class StaffDetailAPIView(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET /api/staff/{id}/
     PATCH /api/staff/{id}/
@@ -689,7 +812,7 @@ class StaffDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     lookup_field = "pk"
 
     def get_queryset(self):
-        return get_staff_queryset()
+        return get_staff_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method in ["PATCH", "PUT"]:
@@ -728,7 +851,7 @@ class StaffDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
-class ProfessorListAPIView(generics.ListAPIView):
+class ProfessorListAPIView(SparseFieldsMixin, generics.ListAPIView):
     """
     GET /api/professors/
 
@@ -742,6 +865,10 @@ class ProfessorListAPIView(generics.ListAPIView):
     Query Parameters:
     - page: Page number (default: 1)
     - page_size: Items per page (default: 20, max: 100)
+    - pagination: 'cursor' for keyset pagination (next/previous cursors, no page numbers)
+    - include_count: Include the total count in cursor mode (true/false)
+    - fields: Comma-separated fields to return (default: all)
+    - expand: Comma-separated nested/computed fields to add (alone: plain fields plus these)
     - search: Search in name, professor_id, email
     - department: Filter by department
     - specialization: Filter by specialization
@@ -778,27 +905,10 @@ class ProfessorListAPIView(generics.ListAPIView):
     ordering: ClassVar[list] = ["-hire_date"]
 
     def get_queryset(self):
-        return Professor.objects.select_related(
-            "user",
-            "user__contact_info",
-            "user__identification",
-            "user__emergency_info",
-            "user__user_university",
-            "user__user_university__university",
-        ).prefetch_related(
-            "user__vehicles",
-            "user__vehicles__insurance_info",
-            "user__access_control",
-            "user__access_control__vehicle",
-            "courses_taught",
-            "professorsubject_set__subject",
-            "professorsubject_set__period",
-            "graduation_set__student",
-            "graduation_set__graduation_period",
-        )
+        return get_professor_queryset(self.get_requested_fields())
 
 
-class ProfessorListCreateAPIView(generics.ListCreateAPIView):
+class ProfessorListCreateAPIView(SparseFieldsMixin, generics.ListCreateAPIView):
     """
     GET /api/professors/
     POST /api/professors/
@@ -831,7 +941,7 @@ class ProfessorListCreateAPIView(generics.ListCreateAPIView):
     ordering: ClassVar[list] = ["-hire_date"]
 
     def get_queryset(self):
-        return get_professor_queryset()
+        return get_professor_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method == "POST":
@@ -842,7 +952,9 @@ class ProfessorListCreateAPIView(generics.ListCreateAPIView):
         is_bulk = isinstance(request.data, list)
 
         if is_bulk:
-            return self.bulk_create(request.data)
+            if run_synchronously(request, request.data):
+                return self.bulk_create(request.data)
+            return bulk_job_response(request, BulkJob.Operation.CREATE_PROFESSORS, request.data)
         else:
             return self.single_create(request.data)
 
@@ -857,38 +969,31 @@ class ProfessorListCreateAPIView(generics.ListCreateAPIView):
 
     @transaction.atomic
     def bulk_create(self, data_list):
-        created_professors = []
-        errors = []
-
-        for i, professor_data in enumerate(data_list):
-            try:
-                serializer = ProfessorCreateUpdateSerializer(data=professor_data)
-                if serializer.is_valid():
-                    professor = serializer.save()
-                    created_professors.append(professor)
-                else:
-                    errors.append({"index": i, "errors": serializer.errors})
-            except Exception as e:
-                errors.append({"index": i, "errors": str(e)})
-
-        if errors:
+        creator = ProfessorBulkCreator(data_list)
+        created_professors = creator.create()
+
+        if creator.errors:
             return Response(
                 {
                     "created": len(created_professors),
-                    "errors": errors,
+                    "errors": creator.errors,
                     "created_professors": [p.id for p in created_professors],
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        complete_serializer = CompleteProfessorSerializer(created_professors, many=True)
+        professors = get_professor_queryset().in_bulk([p.id for p in created_professors])
+        complete_serializer = CompleteProfessorSerializer(
+            [professors[p.id] for p in created_professors],
+            many=True,
+        )
         return Response(
             {"created": len(created_professors), "professors": complete_serializer.data},
             status=status.HTTP_201_CREATED,
         )
 
 
-class ProfessorDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class ProfessorDetailAPIView(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET /api/professors/{id}/
     PATCH /api/professors/{id}/
@@ -898,7 +1003,7 @@ class ProfessorDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     lookup_field = "pk"
 
     def get_queryset(self):
-        return get_professor_queryset()
+        return get_professor_queryset(self.get_requested_fields())
 
     def get_serializer_class(self):
         if self.request.method in ["PATCH", "PUT"]:
@@ -942,20 +1047,32 @@ class ProfessorDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
 def student_by_student_id(request, student_id):
     """
     GET /api/students/by-student-id/{student_id}/
+
+    Served from the detail cache after the first lookup
     """
-    student = get_object_or_404(get_student_queryset(), student_id=student_id)
-    serializer = CompleteStudentSerializer(student)
-    return Response(serializer.data)
+    fields = get_requested_fields(request, CompleteStudentSerializer)
+
+    def render():
+        student = get_object_or_404(get_student_queryset(fields), student_id=student_id)
+        return CompleteStudentSerializer(student, fields=fields).data
+
+    return Response(get_person_detail("students", student_id, fields, render))
 
 
 @api_view(["GET"])
 def professor_by_professor_id(request, professor_id):
     """
     GET /api/professors/by-professor-id/{professor_id}/
+
+    Served from the detail cache after the first lookup
     """
-    professor = get_object_or_404(get_professor_queryset(), professor_id=professor_id)
-    serializer = CompleteProfessorSerializer(professor)
-    return Response(serializer.data)
+    fields = get_requested_fields(request, CompleteProfessorSerializer)
+
+    def render():
+        professor = get_object_or_404(get_professor_queryset(fields), professor_id=professor_id)
+        return CompleteProfessorSerializer(professor, fields=fields).data
+
+    return Response(get_person_detail("professors", professor_id, fields, render))
 
 
 @api_view(["GET"])
@@ -963,18 +1080,26 @@ def staff_by_staff_id(request, staff_id):
     """
     GET /api/staff/by-staff-id/{staff_id}/
 
-    Retrieve staff member by staff_id instead of primary key
+    Retrieve staff member by staff_id instead of primary key, served from the detail cache
+    after the first lookup
     """
-    staff = get_object_or_404(
-        get_staff_queryset(),
-        staff_id=staff_id,
-    )
-    serializer = CompleteStaffSerializer(staff)
-    return Response(serializer.data)
+    fields = get_requested_fields(request, CompleteStaffSerializer)
+
+    def render():
+        staff = get_object_or_404(
+            get_staff_queryset(fields),
+            staff_id=staff_id,
+        )
+        return CompleteStaffSerializer(staff, fields=fields).data
+
+    return Response(get_person_detail("staff", staff_id, fields, render))
+
+
+# Relations the bulk update writes to, joined into the single fetch of its targets.
+STUDENT_UPDATE_FIELDS = ("personal_info", "contact_info", "identification", "emergency_info")
 
 
 @api_view(["PATCH"])
-@transaction.atomic
 def bulk_update_students(request):
     """
     PATCH /api/students/bulk-update/
@@ -985,56 +1110,66 @@ def bulk_update_students(request):
         {"id": 1, "data": {...}},
         {"id": 2, "data": {...}},
     ]
+
+    The payload is queued as a background job; `?sync=true` processes a small payload within
+    the request instead.
+
+    Query Parameters:
+    - sync: 'true' to update within the request
+    - response: 'summary' (default) for the updated ids and their changed fields as
+      [old, new] pairs, or 'full' for the complete updated students (sync only)
     """
     if not isinstance(request.data, list):
         return Response(
             {"error": "Expected list of objects with id and data fields"},
             status=status.HTTP_400_BAD_REQUEST,
         )
-
-    updated_students = []
-    errors = []
-
-    for item in request.data:
-        try:
-            student_id = item.get("id")
-            data = item.get("data", {})
-
-            student = Student.objects.get(pk=student_id)
-            serializer = StudentCreateUpdateSerializer(student, data=data, partial=True)
-
-            if serializer.is_valid():
-                updated_student = serializer.save()
-                updated_students.append(updated_student)
-            else:
-                errors.append({"id": student_id, "errors": serializer.errors})
-        except Student.DoesNotExist:
-            errors.append({"id": student_id, "errors": "Student not found"})
-        except Exception as e:
-            errors.append({"id": student_id, "errors": str(e)})
-
-    complete_serializer = CompleteStudentSerializer(updated_students, many=True)
+    response_mode = request.query_params.get("response", "summary")
+    if response_mode not in ("summary", "full"):
+        raise ValidationError({"response": "Expected 'summary' or 'full'"})
+    if not run_synchronously(request, request.data):
+        return bulk_job_response(request, BulkJob.Operation.UPDATE_STUDENTS, request.data)
+
+    with transaction.atomic():
+        updater = StudentBulkUpdater(request.data)
+        updated_students = updater.update(get_student_queryset(STUDENT_UPDATE_FIELDS))
+
+    if response_mode == "full":
+        students = get_student_queryset().in_bulk([s.id for s in updated_students])
+        results = CompleteStudentSerializer(
+            [students[s.id] for s in updated_students],
+            many=True,
+        ).data
+    else:
+        results = [{"id": s.id, "changes": updater.changes[s.id]} for s in updated_students]
 
     return Response(
-        {"updated": len(updated_students), "errors": errors, "students": complete_serializer.data},
+        {"updated": len(updated_students), "errors": updater.errors, "students": results},
     )
 
 
 @api_view(["POST"])
-@transaction.atomic
 def bulk_inactivate_students(request):
     """
     POST /api/students/bulk-inactivate/
 
     Bulk inactivate students
     Expected format: {"ids": [1, 2, 3, ...]}
+
+    The ids are queued as a background job unless `?sync=true` is given for a short list.
     """
     student_ids = request.data.get("ids", [])
 
-    if not student_ids:
+    if not student_ids or not isinstance(student_ids, list):
         return Response({"error": "No student IDs provided"}, status=status.HTTP_400_BAD_REQUEST)
+    if not run_synchronously(request, student_ids):
+        return bulk_job_response(request, BulkJob.Operation.INACTIVATE_STUDENTS, student_ids)
 
-    updated_count = Student.objects.filter(id__in=student_ids).update(is_active=False)
+    # QuerySet.update() sends no signals: retire the cached payloads once the update commits.
+    with transaction.atomic():
+        updated_count = Student.objects.filter(id__in=student_ids).update(is_active=False)
+        detail_cache.invalidate()
+        statistics_cache.invalidate()
 
     return Response(
         {"message": f"{updated_count} students inactivated", "inactivated_count": updated_count},
@@ -1042,63 +1177,79 @@ def bulk_inactivate_students(request):
 
 
 @api_view(["POST"])
-@transaction.atomic
 def bulk_activate_students(request):
     """
     POST /api/students/bulk-activate/
 
     Bulk activate students
     Expected format: {"ids": [1, 2, 3, ...]}
+
+    The ids are queued as a background job unless `?sync=true` is given for a short list.
     """
     student_ids = request.data.get("ids", [])
 
-    if not student_ids:
+    if not student_ids or not isinstance(student_ids, list):
         return Response({"error": "No student IDs provided"}, status=status.HTTP_400_BAD_REQUEST)
+    if not run_synchronously(request, student_ids):
+        return bulk_job_response(request, BulkJob.Operation.ACTIVATE_STUDENTS, student_ids)
 
-    updated_count = Student.objects.filter(id__in=student_ids).update(is_active=True)
+    # QuerySet.update() sends no signals: retire the cached payloads once the update commits.
+    with transaction.atomic():
+        updated_count = Student.objects.filter(id__in=student_ids).update(is_active=True)
+        detail_cache.invalidate()
+        statistics_cache.invalidate()
 
     return Response(
         {"message": f"{updated_count} students activated", "activated_count": updated_count},
     )
 
 
+@api_view(["GET"])
+def bulk_job_detail(request, pk):
+    """
+    GET /api/jobs/<id>/
+
+    Progress, throughput and per-item errors of a queued bulk operation
+    """
+    job = get_object_or_404(BulkJob, pk=pk)
+    return Response(BulkJobSerializer(job).data)
+
+
 # Statistics views
+def get_filtered_statistics(request, family, filterset_class):
+    """
+    Returns the statistics of a family over the rows matching the request's filter parameters.
+
+    The filtered rows are selected with a `pk IN (subquery)`, so filters that join many-valued
+    relations narrow the set without duplicating rows in the aggregation.
+    """
+    model = filterset_class._meta.model
+    filterset = filterset_class(request.query_params, queryset=model.objects.all(), request=request)
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+
+    filters = tuple(
+        sorted(
+            (name, value)
+            for name, value in filterset.form.cleaned_data.items()
+            if value not in (None, "")
+        ),
+    )
+    if not filters:
+        return get_statistics(family)
+    queryset = model.objects.filter(pk__in=filterset.qs.values("pk"))
+    return get_statistics(family, queryset, filters)
+
+
 @api_view(["GET"])
 def students_statistics(request):
     """
     GET /api/students/statistics/
 
-    Get general statistics about students
+    Get general statistics about students, optionally over the students matching the
+    `StudentFilter` parameters
     """
-    stats = {
-        "total_students": Student.objects.count(),
-        "active_students": Student.objects.filter(is_active=True).count(),
-        "graduated_students": Student.objects.filter(graduation__isnull=False).count(),
-        "by_academic_status": dict(
-            Student.objects.values("academic_status")
-            .annotate(count=Count("id"))
-            .values_list("academic_status", "count"),
-        ),
-        "by_career": dict(
-            Student.objects.values("career__name")
-            .annotate(count=Count("id"))
-            .values_list("career__name", "count"),
-        ),
-        "by_campus": dict(
-            Student.objects.values("campus")
-            .annotate(count=Count("id"))
-            .values_list("campus", "count"),
-        ),
-        "average_credits": Student.objects.aggregate(avg_credits=Avg("credits_approved"))[
-            "avg_credits"
-        ],
-        "total_debt": Student.objects.aggregate(
-            total=Sum("personal_info__financial_info__total_debt"),
-        )["total"]
-        or 0,
-    }
-
-    return Response(stats)
+    return Response(get_filtered_statistics(request, "students", StudentFilter))
 
 
 @api_view(["GET"])
@@ -1106,24 +1257,10 @@ def staff_statistics(request):
     """
     GET /api/staff/statistics/
 
-    Get general statistics about staff
+    Get general statistics about staff, optionally over the staff matching the `StaffFilter`
+    parameters
     """
-    stats = {
-        "total_staff": StaffProfile.objects.count(),
-        "active_staff": StaffProfile.objects.filter(is_active=True).count(),
-        "by_department": dict(
-            StaffProfile.objects.values("department")
-            .annotate(count=Count("id"))
-            .values_list("department", "count"),
-        ),
-        "by_staff_type": dict(
-            StaffProfile.objects.values("staff_type")
-            .annotate(count=Count("id"))
-            .values_list("staff_type", "count"),
-        ),
-    }
-
-    return Response(stats)
+    return Response(get_filtered_statistics(request, "staff", StaffFilter))
 
 
 @api_view(["GET"])
@@ -1131,23 +1268,7 @@ def professors_statistics(request):
     """
     GET /api/professors/statistics/
 
-    Get general statistics about professors
+    Get general statistics about professors, optionally over the professors matching the
+    `ProfessorFilter` parameters
     """
-    stats = {
-        "total_professors": Professor.objects.count(),
-        "active_professors": Professor.objects.filter(is_active=True).count(),
-        "currently_teaching": Professor.objects.filter(professorsubject__period__is_active=True)
-        .distinct()
-        .count(),
-        "by_department": dict(
-            Professor.objects.values("department")
-            .annotate(count=Count("id"))
-            .values_list("department", "count"),
-        ),
-        "average_teaching_hours": Professor.objects.aggregate(avg_hours=Avg("max_hours_per_week"))[
-            "avg_hours"
-        ],
-        "total_courses_taught": Professor.objects.aggregate(total=Count("courses_taught"))["total"],
-    }
-
-    return Response(stats)
+    return Response(get_filtered_statistics(request, "professors", ProfessorFilter))
@@ -0,0 +1,64 @@
+import json
+
+from .documents import materialize_credential_documents
+from .loaders import get_credential_queryset
+
+MAX_BATCH_SIZE = 5000
+
+# Request key -> (lookup on PersonalInformation, attribute reading the key back from a person).
+BATCH_KEYS = {
+    "emails": (
+        "contact_info__institutional_email__in",
+        lambda person: person.contact_info.institutional_email,
+    ),
+    "ids": ("pk__in", lambda person: person.pk),
+}
+
+
+def lookup_credentials(key, values):
+    """
+    Resolves many people to their credential documents at once.
+
+    The people and each of their relations are loaded with one `IN` query per table, whatever
+    the number of values.
+
+    Args:
+        key (str): One of `BATCH_KEYS`, naming what `values` contains.
+        values (list): Institutional emails or `PersonalInformation` ids.
+
+    Returns:
+        tuple: Documents keyed by the requested value (in request order), the values that did
+        not match anyone and the values whose person has no credential content.
+    """
+    lookup, read_key = BATCH_KEYS[key]
+    values = list(dict.fromkeys(values))
+    people = list(get_credential_queryset().filter(**{lookup: values}))
+    documents = materialize_credential_documents(people)
+
+    people_by_value = {read_key(person): person for person in people}
+    found = {}
+    not_found = []
+    no_content = []
+    for value in values:
+        person = people_by_value.get(value)
+        if person is None:
+            not_found.append(value)
+        elif person.pk in documents:
+            found[value] = documents[person.pk]
+        else:
+            no_content.append(value)
+    return found, not_found, no_content
+
+
+def render_batch(found, not_found, no_content):
+    """
+    Renders a batch lookup result to JSON, embedding the stored payloads without re-parsing them.
+    """
+    results = ",".join(
+        f"{json.dumps(str(value))}:{document.payload}" for value, document in found.items()
+    )
+    return (
+        f'{{"results":{{{results}}},'
+        f'"not_found":{json.dumps(not_found)},'
+        f'"no_content":{json.dumps(no_content)}}}'
+    )
@@ -0,0 +1,177 @@
+import datetime
+import hashlib
+
+from django.db import connections, router, transaction
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from .models import CredentialDocument
+from .serializers import SantanderPersonSerializer
+
+UPSERT_FIELDS = ["institutional_email", "payload", "payload_hash", "updated_at"]
+
+# Seconds a stored document is served before it is rendered again. Bounds how long a rendering
+# that raced a write (see `invalidate_credentials`) can be served.
+CREDENTIAL_DOCUMENT_MAX_AGE = 3600
+
+
+def render_credential(person):
+    """
+    Renders the Santander credential of a person to JSON.
+
+    Args:
+        person (PersonalInformation | UserProxy): A person loaded with `get_credential_queryset()`.
+
+    Returns:
+        tuple: The rendered JSON text and its SHA-256 hex digest.
+    """
+    payload = JSONRenderer().render(SantanderPersonSerializer(person).data)
+    return payload.decode("utf-8"), hashlib.sha256(payload).hexdigest()
+
+
+def build_credential_document(person):
+    payload, payload_hash = render_credential(person)
+    return CredentialDocument(
+        person_id=person.pk,
+        institutional_email=person.contact_info.institutional_email,
+        payload=payload,
+        payload_hash=payload_hash,
+    )
+
+
+def expired_before():
+    """
+    Returns the moment before which stored documents are past `CREDENTIAL_DOCUMENT_MAX_AGE`.
+    """
+    return timezone.now() - datetime.timedelta(seconds=CREDENTIAL_DOCUMENT_MAX_AGE)
+
+
+def is_fresh(document):
+    return document is not None and document.updated_at >= expired_before()
+
+
+def without_fresh_document():
+    """
+    Returns the `PersonalInformation` filter matching people with no stored document, or an
+    expired one.
+    """
+    return Q(credential_document__isnull=True) | Q(
+        credential_document__updated_at__lt=expired_before()
+    )
+
+
+def save_credential_document(person):
+    """
+    Renders and stores the credential document of a person, replacing any previous version.
+    """
+    document = build_credential_document(person)
+    CredentialDocument.objects.update_or_create(
+        person_id=document.person_id,
+        defaults={
+            "institutional_email": document.institutional_email,
+            "payload": document.payload,
+            "payload_hash": document.payload_hash,
+        },
+    )
+    return document
+
+
+def materialize_credential_documents(people):
+    """
+    Returns the credential documents of the given people, rendering the missing and expired ones.
+
+    Args:
+        people (Iterable[PersonalInformation]): People loaded with `get_credential_queryset()`.
+
+    Returns:
+        dict: Documents keyed by person id. People without content are left out.
+
+    Newly rendered documents are stored with a single upsert.
+    """
+    documents = {}
+    rendered = []
+    for person in people:
+        document = getattr(person, "credential_document", None)
+        if not is_fresh(document):
+            if not person.has_content():
+                continue
+            document = build_credential_document(person)
+            rendered.append(document)
+        documents[person.pk] = document
+
+    if rendered:
+        store_credential_documents(rendered)
+    return documents
+
+
+def upsert_options():
+    """
+    Returns the `bulk_create()` arguments that insert credential documents or replace the stored
+    version of the same person.
+
+    MySQL's `ON DUPLICATE KEY UPDATE` takes no conflict target and Django refuses `unique_fields`
+    there, so the person is only named as the target on backends that support one.
+    """
+    connection = connections[router.db_for_write(CredentialDocument)]
+    options = {"update_conflicts": True, "update_fields": UPSERT_FIELDS}
+    if connection.features.supports_update_conflicts_with_target:
+        options["unique_fields"] = ["person"]
+    return options
+
+
+def store_credential_documents(documents):
+    """
+    Stores credential documents with a single upsert, replacing previous versions.
+    """
+    return CredentialDocument.objects.bulk_create(documents, **upsert_options())
+
+
+def get_credential_document(institutional_email):
+    return CredentialDocument.objects.filter(
+        institutional_email=institutional_email,
+        updated_at__gte=expired_before(),
+    ).first()
+
+
+def invalidate_credentials(*conditions, **lookup):
+    """
+    Deletes the stored documents matching a `CredentialDocument` lookup (`Q` objects and/or
+    keyword arguments, as for `filter()`).
+
+    Signals call this for single-row writes; bulk writers (`QuerySet.update()`, `bulk_create`)
+    bypass signals and must call it themselves, e.g. `invalidate_credentials(person_id__in=ids)`.
+
+    A request that loaded the person before the write committed can still store its rendering
+    after this delete, so the documents are deleted again once the write commits. A rendering
+    stored after that is served for at most `CREDENTIAL_DOCUMENT_MAX_AGE` seconds.
+    """
+    using = router.db_for_write(CredentialDocument)
+    documents = CredentialDocument.objects.filter(*conditions, **lookup)
+    deleted = documents.delete()
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(documents.delete, using=using)
+    return deleted
+
+
+def credential_response(document, request=None):
+    """
+    Serves a stored credential document with a strong ETag derived from its payload hash.
+
+    When `request` carries a matching `If-None-Match` header, a 304 response is returned without
+    the payload. Clients are asked to revalidate on every use, so a changed credential is picked
+    up on the next request.
+    """
+    response = HttpResponse(
+        document.payload,
+        content_type="application/json",
+        status=status.HTTP_200_OK,
+    )
+    response.headers["ETag"] = f'"{document.payload_hash}"'
+    patch_cache_control(response, private=True, no_cache=True)
+    if request is None:
+        return response
+    return get_conditional_response(request, etag=response.headers["ETag"], response=response)
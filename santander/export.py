@@ -0,0 +1,46 @@
+from django.db.models import Q
+
+from .documents import materialize_credential_documents, without_fresh_document
+from .loaders import get_credential_queryset
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def get_export_queryset(role=None, updated_since=None):
+    """
+    Returns the people included in a credential export.
+
+    Args:
+        role (str | None): Only export people with this `PersonalInformation.role`.
+        updated_since (datetime | None): Only export people whose credential may have changed
+            since this moment: those without a fresh stored document (never rendered, invalidated
+            by a change or expired) and those whose document was rendered at or after it.
+    """
+    queryset = get_credential_queryset().filter(contact_info__institutional_email__isnull=False)
+    if role:
+        queryset = queryset.filter(role=role)
+    if updated_since:
+        queryset = queryset.filter(
+            without_fresh_document() | Q(credential_document__updated_at__gte=updated_since)
+        )
+    return queryset
+
+
+def iter_credential_lines(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields one NDJSON line per person with content, reading the queryset in keyset-ordered chunks.
+
+    Each chunk runs the credential queryset's joins and prefetches once, so memory stays bounded
+    by `chunk_size` regardless of the population. Stored documents are emitted as-is; missing ones
+    are rendered and stored in a single upsert per chunk.
+    """
+    last_pk = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk).order_by("pk")[:chunk_size])
+        if not chunk:
+            return
+        last_pk = chunk[-1].pk
+
+        documents = materialize_credential_documents(chunk)
+        for document in documents.values():
+            yield document.payload + "\n"
@@ -0,0 +1,63 @@
+from authentication.hybrid_authentication import IdPAuthentication
+from uvaq.models import PersonalInformation
+
+from .documents import get_credential_document
+
+
+def get_credential_queryset():
+    """
+    Returns the `PersonalInformation` queryset with every relation the Santander payload reads.
+
+    One-to-one relations are joined in the main query; the many-to-many collections
+    (notifications, student subjects and professor courses) are loaded with one prefetch each,
+    and only when the person actually has the related profile.
+    """
+    return PersonalInformation.objects.select_related(
+        "contact_info",
+        "identification",
+        "academic_profile",
+        "financial_info",
+        "student",
+        "professor",
+        "staff_profile",
+        "user_university",
+        "user_university__university",
+        "user_university__career",
+        "credential_document",
+    ).prefetch_related(
+        "user_university__optional_notifications",
+        "student__subjects",
+        "professor__courses_taught",
+    )
+
+
+class CredentialDocumentUser:
+    """
+    Authenticated user backed only by a stored `CredentialDocument`.
+    """
+
+    is_authenticated = True
+
+    def __init__(self, credential_document):
+        self.credential_document = credential_document
+
+
+class CredentialIdPAuthentication(IdPAuthentication):
+    """
+    IdP authentication that resolves the person with the complete Santander credential graph,
+    so the credential views render without any further lazy loads.
+
+    When a materialized credential document exists for the token's email, the person is not
+    loaded at all and the document is returned as the user instead.
+    """
+
+    def get_queryset(self):
+        return get_credential_queryset()
+
+    def authenticate(self, request):
+        auth_type, token = self.authenticate_header(request)
+        if auth_type == "bearer":
+            document = get_credential_document(self.authenticate_bearer_token(token))
+            if document is not None:
+                return (CredentialDocumentUser(document), token)
+        return super().authenticate(request)
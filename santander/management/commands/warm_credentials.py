@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from santander.documents import (
+    build_credential_document,
+    store_credential_documents,
+    without_fresh_document,
+)
+from santander.loaders import get_credential_queryset
+
+
+class Command(BaseCommand):
+    help = "Render and store the Santander credential document of every person."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of people loaded and written per batch.",
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only render people that do not have a fresh stored document.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = get_credential_queryset().filter(
+            contact_info__institutional_email__isnull=False,
+        )
+        if options["missing_only"]:
+            queryset = queryset.filter(without_fresh_document())
+
+        stored = skipped = 0
+        batch = []
+        for person in queryset.order_by("pk").iterator(chunk_size=batch_size):
+            if not person.has_content():
+                skipped += 1
+                continue
+            batch.append(build_credential_document(person))
+            if len(batch) >= batch_size:
+                stored += self.store(batch)
+                batch = []
+        stored += self.store(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {stored} credential documents, skipped {skipped} without content.",
+            ),
+        )
+
+    def store(self, documents):
+        store_credential_documents(documents)
+        return len(documents)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('uvaq', '0002_alter_contactinformation_institutional_email_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CredentialDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('institutional_email', models.EmailField(max_length=254, unique=True)),
+                ('payload', models.TextField()),
+                ('payload_hash', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('person', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='credential_document', to='uvaq.personalinformation')),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import models
+
+from uvaq.models import PersonalInformation
+
+
+class CredentialDocument(models.Model):
+    """
+    Materialized Santander credential payload for a single person.
+
+    The rendered JSON is stored exactly as `SantanderPersonSerializer` would produce it, so the
+    credential endpoint can serve it without touching the person's graph or the serializer.
+    Documents are removed by `santander.signals` whenever a contributing row changes and are
+    rebuilt on the next request or by the `warm_credentials` management command.
+
+    Attributes:
+        person (PersonalInformation): The person the credential belongs to.
+        institutional_email (str): Lookup key used by the IdP authentication.
+        payload (str): The rendered JSON document.
+        payload_hash (str): SHA-256 of `payload`.
+        updated_at (DateTimeField): When the document was last rendered.
+    """
+
+    person = models.OneToOneField(
+        PersonalInformation,
+        on_delete=models.CASCADE,
+        related_name="credential_document",
+    )
+    institutional_email = models.EmailField(unique=True)
+    payload = models.TextField()
+    payload_hash = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.institutional_email
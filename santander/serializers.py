@@ -7,9 +7,7 @@ from uvaq.models import (
     ContactInformation,
     Identification,
     PersonalInformation,
-    Professor,
     Role,
-    Student,
     UserUniversity,
 )
 
@@ -148,41 +146,36 @@ class UserUniversitySerializer(serializers.ModelSerializer):
             department_name = staff_profile.department if staff_profile else "Default Department"
             return [{"name": department_name, "type": "other"}]
         elif obj.user.role == "student":
-            user_university = getattr(obj.user, "user_university", None)
-            if user_university:
-                try:
-                    student = Student.objects.get(student_id=user_university.user_identifier)
-                    subjects = student.get_subjects_list()
-                    university_career = {
-                        "name": user_university.career,
-                        "type": user_university.type,
-                    }
-                    return [university_career] + subjects
-
-                except Student.DoesNotExist as e:
-                    logger.error(f"Student not found {e.args}.", exc_info=True)
-                    return None
-                except Exception as e:
-                    logger.error(f"Unexpected error occurred {e.args}.", exc_info=True)
-                    return None
+            # The student profile and its subjects come preloaded from get_credential_queryset()
+            student = getattr(obj.user, "student", None)
+            if student is None:
+                logger.error(f"Student not found for {obj.user_identifier}.")
+                return None
+            try:
+                subjects = student.get_subjects_list()
+                university_career = {
+                    "name": obj.career,
+                    "type": obj.type,
+                }
+                return [university_career] + subjects
+            except Exception as e:
+                logger.error(f"Unexpected error occurred {e.args}.", exc_info=True)
+                return None
         elif obj.user.role == "professor":
-            user_university = getattr(obj.user, "user_university", None)
-            if user_university:
-                try:
-                    professor = Professor.objects.get(professor_id=user_university.user_identifier)
-                    subject_list = professor.get_courses_list()
-                    university_career = {
-                        "name": user_university.career,
-                        "type": user_university.type,
-                    }
-                    return [university_career] + subject_list
-
-                except Professor.DoesNotExist as e:
-                    logger.error(f"Professor not found {e.args}.", exc_info=True)
-                    return None
-                except Exception as e:
-                    logger.error(f"Unexpected error occurred {e.args}.", exc_info=True)
-                    return None
+            professor = getattr(obj.user, "professor", None)
+            if professor is None:
+                logger.error(f"Professor not found for {obj.user_identifier}.")
+                return None
+            try:
+                subject_list = professor.get_courses_list()
+                university_career = {
+                    "name": obj.career,
+                    "type": obj.type,
+                }
+                return [university_career] + subject_list
+            except Exception as e:
+                logger.error(f"Unexpected error occurred {e.args}.", exc_info=True)
+                return None
         elif obj.career and obj.type:
             # For other roles, include career and type
             return [{"name": obj.career, "type": obj.type}]
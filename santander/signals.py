@@ -0,0 +1,72 @@
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+
+from uvaq.models import (
+    AcademicProfile,
+    Career,
+    ContactInformation,
+    Enrollment,
+    FinancialInformation,
+    Identification,
+    Notification,
+    PersonalInformation,
+    Professor,
+    ProfessorSubject,
+    StaffProfile,
+    Student,
+    Subject,
+    UserUniversity,
+)
+
+from .documents import invalidate_credentials
+
+# Maps each model that contributes to the credential payload, or to `has_content()`, to the `Q`
+# that finds the affected documents from one of its instances. Deletes are handled on pre_delete,
+# while the rows linking the instance to its people still exist.
+CREDENTIAL_SOURCES = {
+    PersonalInformation: lambda instance: Q(person_id=instance.pk),
+    ContactInformation: lambda instance: Q(person_id=instance.user_id),
+    Identification: lambda instance: Q(person_id=instance.user_id),
+    AcademicProfile: lambda instance: Q(person_id=instance.user_id),
+    FinancialInformation: lambda instance: Q(person_id=instance.user_id),
+    UserUniversity: lambda instance: Q(person_id=instance.user_id),
+    Student: lambda instance: Q(person_id=instance.personal_info_id),
+    Professor: lambda instance: Q(person_id=instance.user_id),
+    StaffProfile: lambda instance: Q(person_id=instance.user_id),
+    Enrollment: lambda instance: Q(person__student__id=instance.student_id),
+    ProfessorSubject: lambda instance: Q(person__professor__id=instance.professor_id),
+    Subject: lambda instance: (
+        Q(person__student__subjects=instance.pk) | Q(person__professor__courses_taught=instance.pk)
+    ),
+    Career: lambda instance: Q(person__user_university__career=instance.pk),
+    Notification: lambda instance: Q(person__user_university__optional_notifications=instance.pk),
+}
+
+def invalidate_credential_source(sender, instance, **kwargs):
+    invalidate_credentials(CREDENTIAL_SOURCES[sender](instance))
+
+
+for model in CREDENTIAL_SOURCES:
+    post_save.connect(
+        invalidate_credential_source,
+        sender=model,
+        dispatch_uid=f"credential-save-{model.__name__}",
+    )
+    pre_delete.connect(
+        invalidate_credential_source,
+        sender=model,
+        dispatch_uid=f"credential-delete-{model.__name__}",
+    )
+
+
+@receiver(m2m_changed, sender=UserUniversity.optional_notifications.through)
+def invalidate_notification_links(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # Clearing from the notification side: resolve the users before the links disappear.
+        invalidate_credentials(person__user_university__optional_notifications=instance.pk)
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if not reverse:
+            invalidate_credentials(person_id=instance.user_id)
+        elif pk_set:
+            invalidate_credentials(person__user_university__in=pk_set)
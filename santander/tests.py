@@ -0,0 +1,232 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from santander.batch import lookup_credentials
+from santander.documents import (
+    CREDENTIAL_DOCUMENT_MAX_AGE,
+    build_credential_document,
+    get_credential_document,
+    materialize_credential_documents,
+    store_credential_documents,
+    upsert_options,
+)
+from santander.export import get_export_queryset, iter_credential_lines
+from santander.loaders import CredentialIdPAuthentication, get_credential_queryset
+from santander.models import CredentialDocument
+from uvaq import factories
+from uvaq.models import ProfessorSubject, UserUniversity
+
+
+class CredentialEndpointTests(TestCase):
+    """
+    The credential endpoint renders from the graph preloaded by `get_credential_queryset()`,
+    so its query count does not depend on how many subjects or notifications a person has.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get_credential(self, person):
+        email = person.contact_info.institutional_email
+        with mock.patch.object(
+            CredentialIdPAuthentication, "authenticate_bearer_token", return_value=email
+        ):
+            return self.client.get(
+                reverse("santander-credential-list"), HTTP_AUTHORIZATION="Bearer token"
+            )
+
+    def test_cold_credential_query_count_is_fixed(self):
+        few = factories.student(enrollments=1).personal_info
+        many = factories.student(enrollments=8).personal_info
+        CredentialDocument.objects.all().delete()
+
+        for person in (few, many):
+            with self.subTest(person=person.pk), self.assertNumQueries(10):
+                response = self.get_credential(person)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(CredentialDocument.objects.filter(person=person).exists())
+
+    def test_stored_credential_is_served_in_one_query(self):
+        person = factories.professor(assignments=5).user
+        self.get_credential(person)
+
+        with self.assertNumQueries(1):
+            response = self.get_credential(person)
+        self.assertEqual(response.status_code, 200)
+
+
+class CredentialUpsertTests(TestCase):
+    def setUp(self):
+        self.person = factories.student().personal_info
+
+    def store_stale_document(self):
+        return CredentialDocument.objects.create(
+            person=self.person,
+            institutional_email=self.person.contact_info.institutional_email,
+            payload="{}",
+            payload_hash="stale",
+        )
+
+    def test_materialize_replaces_a_document_stored_concurrently(self):
+        people = list(get_credential_queryset().filter(pk=self.person.pk))
+        self.store_stale_document()
+
+        documents = materialize_credential_documents(people)
+
+        stored = CredentialDocument.objects.get(person=self.person)
+        self.assertEqual(stored.payload_hash, documents[self.person.pk].payload_hash)
+        self.assertNotEqual(stored.payload, "{}")
+
+    def test_warm_credentials_replaces_stale_documents(self):
+        self.store_stale_document()
+
+        call_command("warm_credentials", stdout=StringIO())
+
+        stored = CredentialDocument.objects.get(person=self.person)
+        self.assertNotEqual(stored.payload_hash, "stale")
+        self.assertEqual(CredentialDocument.objects.count(), 1)
+
+    def test_conflict_target_is_only_named_where_supported(self):
+        features = connection.features
+        with mock.patch.object(features, "supports_update_conflicts_with_target", False):
+            self.assertNotIn("unique_fields", upsert_options())
+        with mock.patch.object(features, "supports_update_conflicts_with_target", True):
+            self.assertEqual(upsert_options()["unique_fields"], ["person"])
+
+
+class CredentialExportTests(TestCase):
+    def test_export_renders_and_stores_cold_documents(self):
+        warm = factories.student().personal_info
+        cold = factories.professor().user
+        materialize_credential_documents(get_credential_queryset().filter(pk=warm.pk))
+        warm_document = CredentialDocument.objects.get(person=warm)
+
+        lines = list(iter_credential_lines(get_export_queryset(), chunk_size=1))
+
+        cold_document = CredentialDocument.objects.get(person=cold)
+        self.assertEqual(lines, [warm_document.payload + "\n", cold_document.payload + "\n"])
+
+    def test_incremental_export_includes_invalidated_documents(self):
+        person = factories.student().personal_info
+        materialize_credential_documents(get_credential_queryset())
+        since = CredentialDocument.objects.get(person=person).updated_at + timedelta(seconds=1)
+        self.assertEqual(list(iter_credential_lines(get_export_queryset(updated_since=since))), [])
+
+        person.first_name = "Renamed"
+        person.save()
+        lines = list(iter_credential_lines(get_export_queryset(updated_since=since)))
+
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"givenName":"Renamed"', lines[0])
+        self.assertEqual(CredentialDocument.objects.get(person=person).payload + "\n", lines[0])
+
+
+class CredentialBatchTests(TestCase):
+    def test_batch_with_a_cold_document(self):
+        warm = factories.student().personal_info
+        cold = factories.professor().user
+        materialize_credential_documents(get_credential_queryset().filter(pk=warm.pk))
+        emails = [
+            cold.contact_info.institutional_email,
+            "missing@uvaq.edu.mx",
+            warm.contact_info.institutional_email,
+        ]
+
+        found, not_found, no_content = lookup_credentials("emails", emails)
+
+        self.assertEqual(list(found), [emails[0], emails[2]])
+        self.assertEqual(not_found, ["missing@uvaq.edu.mx"])
+        self.assertEqual(no_content, [])
+        self.assertEqual(
+            found[emails[0]].payload, CredentialDocument.objects.get(person=cold).payload
+        )
+        self.assertEqual(CredentialDocument.objects.count(), 2)
+
+
+class CredentialInvalidationTests(TestCase):
+    def setUp(self):
+        self.student = factories.student()
+        self.professor = factories.professor()
+        self.bystander = factories.student()
+        materialize_credential_documents(get_credential_queryset())
+
+    def stored_people(self):
+        return set(CredentialDocument.objects.values_list("person_id", flat=True))
+
+    def assertInvalidated(self, *people):
+        expected = {self.student.personal_info_id, self.professor.user_id}
+        expected |= {self.bystander.personal_info_id}
+        self.assertEqual(self.stored_people(), expected - {person.pk for person in people})
+
+    def test_subject_change_invalidates_its_students_and_professors(self):
+        subject = self.student.subjects.first()
+        ProfessorSubject.objects.create(
+            professor=self.professor,
+            subject=subject,
+            period=factories.period(),
+            group="B",
+            classroom="102",
+            schedule="Tue 8-10",
+        )
+        materialize_credential_documents(get_credential_queryset())
+
+        subject.name = "Renamed"
+        subject.save()
+
+        self.assertInvalidated(self.student.personal_info, self.professor.user)
+
+    def test_career_change_invalidates_its_people(self):
+        career, _ = factories.career()
+        UserUniversity.objects.filter(user=self.student.personal_info).update(career=career)
+
+        career.name = "Renamed"
+        career.save()
+
+        self.assertInvalidated(self.student.personal_info)
+
+    def test_academic_profile_change_invalidates_its_person(self):
+        self.student.personal_info.academic_profile.delete()
+
+        self.assertInvalidated(self.student.personal_info)
+
+    def test_financial_information_change_invalidates_its_person(self):
+        financial_info = self.student.personal_info.financial_info
+        financial_info.scholarship = "50%"
+        financial_info.save()
+
+        self.assertInvalidated(self.student.personal_info)
+
+    def test_rendering_that_raced_the_write_is_deleted_on_commit(self):
+        person = self.student.personal_info
+        with self.captureOnCommitCallbacks(execute=True):
+            # A request loads the person, then the write lands before it stores its rendering.
+            loaded = get_credential_queryset().get(pk=person.pk)
+            person.first_name = "Renamed"
+            person.save()
+            store_credential_documents([build_credential_document(loaded)])
+            self.assertIn(person.pk, self.stored_people())
+
+        self.assertInvalidated(person)
+
+    def test_expired_documents_are_rendered_again(self):
+        person = self.student.personal_info
+        expired = timezone.now() - timedelta(seconds=CREDENTIAL_DOCUMENT_MAX_AGE + 1)
+        CredentialDocument.objects.filter(person=person).update(
+            payload="{}", payload_hash="stale", updated_at=expired
+        )
+        self.assertIsNone(get_credential_document(person.contact_info.institutional_email))
+
+        documents = materialize_credential_documents(get_credential_queryset())
+
+        stored = CredentialDocument.objects.get(person=person)
+        self.assertNotEqual(stored.payload_hash, "stale")
+        self.assertEqual(stored.payload_hash, documents[person.pk].payload_hash)
+        self.assertGreater(stored.updated_at, expired)
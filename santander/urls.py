@@ -1,7 +1,11 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import SantanderCredentialViewSet
+from .views import (
+    SantanderCredentialBatchView,
+    SantanderCredentialExportView,
+    SantanderCredentialViewSet,
+)
 
 router = DefaultRouter()
 router.register(
@@ -9,5 +13,15 @@ router.register(
 )
 
 urlpatterns = [
+    path(
+        "credentials/export/",
+        SantanderCredentialExportView.as_view(),
+        name="santander-credential-export",
+    ),
+    path(
+        "credentials/batch/",
+        SantanderCredentialBatchView.as_view(),
+        name="santander-credential-batch",
+    ),
     path("", include(router.urls)),
 ]
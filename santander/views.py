@@ -1,15 +1,23 @@
+import datetime
 import logging
 
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status, viewsets
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.views import exception_handler
+from rest_framework.views import APIView, exception_handler
 
-from authentication.hybrid_authentication import IdPAuthentication
-from uvaq.models import PersonalInformation
+from authentication.hybrid_authentication import HybridAuthentication
+from authentication.mixins import AuthorizedUserRequiredMixin
+from uvaq.models import PersonalInformation, Role
 
-from .serializers import SantanderPersonSerializer
+from .batch import BATCH_KEYS, MAX_BATCH_SIZE, lookup_credentials, render_batch
+from .documents import credential_response, is_fresh, save_credential_document
+from .export import get_export_queryset, iter_credential_lines
+from .loaders import CredentialIdPAuthentication
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +73,7 @@ logger = logging.getLogger(__name__)
 
 
 class SantanderCredentialViewSet(viewsets.ViewSet):
-    authentication_classes = [IdPAuthentication]
+    authentication_classes = [CredentialIdPAuthentication]
     permission_classes = [IsAuthenticated]
 
     def handle_exception(self, exc):
@@ -111,6 +119,11 @@ class SantanderCredentialViewSet(viewsets.ViewSet):
     def list(self, request):
         user = request.user
 
+        # Materialized documents are served as-is, without loading the person or serializing.
+        document = getattr(user, "credential_document", None)
+        if is_fresh(document):
+            return credential_response(document, request)
+
         if not user.has_content():
             return Response(
                 {
@@ -120,5 +133,110 @@ class SantanderCredentialViewSet(viewsets.ViewSet):
                 status=status.HTTP_204_NO_CONTENT,
             )
 
-        serializer = SantanderPersonSerializer(user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        document = save_credential_document(user)
+        return credential_response(document, request)
+
+
+def parse_updated_since(value):
+    """
+    Parses an ISO 8601 date or datetime into an aware datetime, or returns None if invalid.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        date = parse_date(value)
+        if date is None:
+            return None
+        moment = datetime.datetime.combine(date, datetime.time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class SantanderCredentialExportView(AuthorizedUserRequiredMixin, APIView):
+    """
+    GET /api/santander/credentials/export/
+
+    Streams every Santander credential as NDJSON, one `SantanderPersonSerializer` document per line.
+
+    Query params:
+        role: Only export people with this role.
+        updated_since: ISO 8601 date or datetime; only export credentials that may have changed
+            since then.
+    """
+
+    authentication_classes = [HybridAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        role = request.query_params.get("role")
+        if role and role not in Role.values:
+            return Response(
+                {"error": f"Invalid role. Expected one of: {', '.join(Role.values)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        updated_since = request.query_params.get("updated_since")
+        if updated_since:
+            updated_since = parse_updated_since(updated_since)
+            if updated_since is None:
+                return Response(
+                    {"error": "Invalid updated_since. Expected an ISO 8601 date or datetime"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        queryset = get_export_queryset(role=role, updated_since=updated_since)
+        return StreamingHttpResponse(
+            iter_credential_lines(queryset),
+            content_type="application/x-ndjson",
+        )
+
+
+class SantanderCredentialBatchView(AuthorizedUserRequiredMixin, APIView):
+    """
+    POST /api/santander/credentials/batch/
+
+    Resolves up to `MAX_BATCH_SIZE` people in one call. The body holds either `emails`
+    (institutional emails) or `ids` (person ids); the response maps each found value to its
+    credential and lists the values that were not found or have no content.
+    """
+
+    authentication_classes = [HybridAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        keys = [key for key in BATCH_KEYS if key in request.data]
+        if len(keys) != 1:
+            return Response(
+                {"error": f"Provide exactly one of: {', '.join(BATCH_KEYS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        key = keys[0]
+        values = request.data[key]
+        if not isinstance(values, list):
+            return Response(
+                {"error": f"{key} must be a list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(values) > MAX_BATCH_SIZE:
+            return Response(
+                {"error": f"At most {MAX_BATCH_SIZE} values are allowed per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if key == "ids" and not all(isinstance(value, int) for value in values):
+            return Response(
+                {"error": "ids must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if key == "emails" and not all(isinstance(value, str) for value in values):
+            return Response(
+                {"error": "emails must be strings"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        found, not_found, no_content = lookup_credentials(key, values)
+        return HttpResponse(
+            render_batch(found, not_found, no_content),
+            content_type="application/json",
+            status=status.HTTP_200_OK,
+        )
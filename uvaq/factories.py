@@ -0,0 +1,250 @@
+"""
+Builders of complete people (and the rows they hang from) for the apps' tests.
+
+Every builder creates the minimum valid graph: `student()` returns a student with contact,
+identification, university link, academic, admission and financial rows, plus the requested
+number of enrollments and payments.
+"""
+
+import datetime
+import itertools
+from decimal import Decimal
+
+from uvaq.models import (
+    AcademicPeriod,
+    AcademicProfile,
+    AcademicRecord,
+    AdmissionData,
+    Career,
+    ContactInformation,
+    EmergencyInformation,
+    Enrollment,
+    FinancialInformation,
+    Identification,
+    Notification,
+    Payment,
+    PersonalInformation,
+    Professor,
+    ProfessorSubject,
+    Responsibility,
+    Role,
+    StaffProfile,
+    Student,
+    StudyPlan,
+    Subject,
+    UniversityInfo,
+    UserUniversity,
+)
+
+_sequence = itertools.count(1)
+
+
+def university():
+    return UniversityInfo.objects.get_or_create(
+        identifier="UVAQ",
+        defaults={
+            "name": "UVAQ",
+            "address": "Morelia",
+            "website": "https://uvaq.edu.mx",
+            "rector": "Rector",
+            "foundation_date": datetime.date(1990, 1, 1),
+        },
+    )[0]
+
+
+def period(is_active=True):
+    number = next(_sequence)
+    return AcademicPeriod.objects.create(
+        name=f"Period {number}",
+        start_date=datetime.date(2025, 1, 10),
+        end_date=datetime.date(2025, 6, 1),
+        is_active=is_active,
+        cohort="2025",
+        registration_start=datetime.date(2024, 12, 1),
+        registration_end=datetime.date(2025, 1, 1),
+        term_code=f"T{number}",
+        academic_year=2025,
+        period_number=1,
+        period_type="semester",
+    )
+
+
+def subject():
+    number = next(_sequence)
+    return Subject.objects.create(
+        code=f"SUB{number}",
+        name=f"Subject {number}",
+        description="",
+        credits=5,
+        hours_per_week=4,
+        total_hours=64,
+        department="Sciences",
+        type="core",
+    )
+
+
+def career():
+    """
+    Returns a career and its active study plan.
+    """
+    number = next(_sequence)
+    study_plan = StudyPlan.objects.create(
+        name=f"Plan {number}",
+        version="1",
+        start_date=datetime.date(2020, 1, 1),
+        total_credits=300,
+        required_credits=200,
+        elective_credits=100,
+    )
+    career = Career.objects.create(
+        name=f"Career {number}",
+        code=f"CAR{number}",
+        description="",
+        duration_semesters=8,
+        total_credits=300,
+        faculty="Engineering",
+    )
+    career.study_plans.add(study_plan)
+    return career, study_plan
+
+
+def person(role, notifications=1):
+    number = next(_sequence)
+    person = PersonalInformation.objects.create(
+        first_name=f"Name{number}",
+        last_name="Last",
+        second_last_name="Second",
+        birth_date=datetime.date(2000, 5, 5),
+        gender="male",
+        photo=f"https://uvaq.edu.mx/photos/{number}.jpg",
+        role=role,
+    )
+    ContactInformation.objects.create(
+        user=person,
+        phone="4431234567",
+        cell_phone="4431234567",
+        personal_email=f"person{number}@example.com",
+        institutional_email=f"person{number}@uvaq.edu.mx",
+    )
+    Identification.objects.create(
+        user=person,
+        curp=f"CURP{number:014d}",
+        identity_number=f"ID{number}",
+        nationality="MX",
+    )
+    EmergencyInformation.objects.create(user=person, name="Contact", relationship="mother")
+    user_university = UserUniversity.objects.create(
+        user=person,
+        user_identifier=f"U{number}",
+        university=university(),
+        user_roles=role,
+        mandatory_notification=role,
+        enrollment_date=datetime.date(2020, 1, 1),
+        campus="Centro",
+    )
+    for _ in range(notifications):
+        user_university.optional_notifications.add(
+            Notification.objects.create(
+                name=f"Notification {next(_sequence)}",
+                notification_type="event",
+                description="",
+                target_roles=role,
+            )
+        )
+    return person
+
+
+def student(enrollments=3, payments=3):
+    person_info = person(Role.STUDENT)
+    AcademicProfile.objects.create(user=person_info)
+    AdmissionData.objects.create(user=person_info)
+    FinancialInformation.objects.create(user=person_info, total_debt=Decimal("100.00"))
+    student_career, study_plan = career()
+    current_period = period()
+    student = Student.objects.create(
+        personal_info=person_info,
+        student_id=f"ST{person_info.pk}",
+        career=student_career,
+        current_grade="1",
+        admission_type="regular",
+        admission_period=current_period,
+        study_modality="schooling",
+        campus="Centro",
+        study_plan=study_plan,
+        enrollment_date=datetime.date(2021, 1, 1),
+        education_level="undergraduate",
+        credits_approved=100,
+    )
+    for number in range(enrollments):
+        Enrollment.objects.create(
+            student=student,
+            subject=subject(),
+            period=current_period,
+            enrollment_date=datetime.date(2021, 1, 1),
+            final_grade=Decimal("8.50") if number else None,
+            group="A",
+        )
+    for number in range(payments):
+        Payment.objects.create(
+            student=student,
+            payment_type="monthly",
+            amount=Decimal("10.00"),
+            payment_date=datetime.date(2021, 1, 1),
+            status=["pending", "completed", "partial"][number % 3],
+            period=current_period,
+            receipt_number=f"R{person_info.pk}-{number}",
+            payment_method="cash",
+            due_date=datetime.date(2021, 1, 1),
+        )
+    AcademicRecord.objects.create(
+        student=student, period=current_period, start_date=datetime.date(2021, 1, 1)
+    )
+    return student
+
+
+def professor(assignments=3):
+    person_info = person(Role.PROFESSOR)
+    professor = Professor.objects.create(
+        user=person_info,
+        professor_id=f"PR{person_info.pk}",
+        department="Sciences",
+        work_hours="40",
+        hire_date=datetime.date(2010, 1, 1),
+        academic_degree="PhD",
+        specialization="Physics",
+    )
+    active, previous = period(is_active=True), period(is_active=False)
+    for number in range(assignments):
+        ProfessorSubject.objects.create(
+            professor=professor,
+            subject=subject(),
+            period=active if number % 2 == 0 else previous,
+            group="A",
+            classroom="101",
+            schedule="Mon 8-10",
+        )
+    return professor
+
+
+def staff(responsibilities=3, supervisor=None):
+    person_info = person(Role.SERVICES)
+    staff_profile = StaffProfile.objects.create(
+        user=person_info,
+        staff_id=f"SF{person_info.pk}",
+        department="IT",
+        job_title="Developer",
+        work_hours="40",
+        hire_date=datetime.date(2015, 1, 1),
+        staff_type="administrative",
+        office_location="B-12",
+        supervisor=supervisor,
+    )
+    for number in range(responsibilities):
+        Responsibility.objects.create(
+            staff_profile=staff_profile,
+            description=f"Responsibility {number}",
+            start_date=datetime.date(2020, 1, 1),
+            is_current=bool(number % 2),
+            area="Systems",
+        )
+    return staff_profile
@@ -0,0 +1,191 @@
+import django_filters
+
+from .models import (
+    AccessControl,
+    ContactInformation,
+    EmergencyInformation,
+    Enrollment,
+    FinancialInformation,
+    Identification,
+    InsuranceInformation,
+    PersonalInformation,
+    Professor,
+    Responsibility,
+    StaffProfile,
+    Student,
+    Subject,
+    UniversityInfo,
+    UserUniversity,
+    Vehicle,
+)
+
+
+class PersonalInformationFilter(django_filters.FilterSet):
+    class Meta:
+        model = PersonalInformation
+        fields = {
+            "first_name": ["exact", "icontains"],
+            "last_name": ["exact", "icontains"],
+            "role": ["exact"],
+            "gender": ["exact"],
+        }
+
+
+class ContactInformationFilter(django_filters.FilterSet):
+    class Meta:
+        model = ContactInformation
+        fields = {
+            "user": ["exact"],
+            "institutional_email": ["iexact"],
+            "personal_email": ["iexact"],
+        }
+
+
+class IdentificationFilter(django_filters.FilterSet):
+    class Meta:
+        model = Identification
+        fields = {
+            "user": ["exact"],
+            "curp": ["iexact"],
+            "nationality": ["exact"],
+        }
+
+
+class AccessControlFilter(django_filters.FilterSet):
+    class Meta:
+        model = AccessControl
+        fields = {
+            "user": ["exact"],
+            "device_id": ["exact"],
+            "is_active": ["exact"],
+        }
+
+
+class EmergencyInformationFilter(django_filters.FilterSet):
+    class Meta:
+        model = EmergencyInformation
+        fields = {
+            "user": ["exact"],
+            "is_primary": ["exact"],
+        }
+
+
+class EnrollmentFilter(django_filters.FilterSet):
+    class Meta:
+        model = Enrollment
+        fields = {
+            "student": ["exact"],
+            "subject": ["exact"],
+            "period": ["exact"],
+            "professor": ["exact"],
+            "status": ["exact"],
+            "group": ["exact"],
+        }
+
+
+class FinancialInformationFilter(django_filters.FilterSet):
+    class Meta:
+        model = FinancialInformation
+        fields = {
+            "user": ["exact"],
+        }
+
+
+class InsuranceInformationFilter(django_filters.FilterSet):
+    class Meta:
+        model = InsuranceInformation
+        fields = {
+            "vehicle": ["exact"],
+            "policy_number": ["exact"],
+            "provider": ["icontains"],
+        }
+
+
+class ProfessorFilter(django_filters.FilterSet):
+    class Meta:
+        model = Professor
+        fields = {
+            "user": ["exact"],
+            "professor_id": ["exact"],
+            "department": ["exact", "icontains"],
+            "is_active": ["exact"],
+        }
+
+
+class ResponsibilityFilter(django_filters.FilterSet):
+    class Meta:
+        model = Responsibility
+        fields = {
+            "staff_profile": ["exact"],
+            "area": ["exact", "icontains"],
+            "is_current": ["exact"],
+        }
+
+
+class StaffProfileFilter(django_filters.FilterSet):
+    class Meta:
+        model = StaffProfile
+        fields = {
+            "user": ["exact"],
+            "staff_id": ["exact"],
+            "department": ["exact", "icontains"],
+            "staff_type": ["exact"],
+            "supervisor": ["exact"],
+            "is_active": ["exact"],
+        }
+
+
+class StudentFilter(django_filters.FilterSet):
+    class Meta:
+        model = Student
+        fields = {
+            "personal_info": ["exact"],
+            "student_id": ["exact"],
+            "career": ["exact"],
+            "academic_status": ["exact"],
+            "campus": ["exact", "icontains"],
+            "is_active": ["exact"],
+        }
+
+
+class SubjectFilter(django_filters.FilterSet):
+    class Meta:
+        model = Subject
+        fields = {
+            "code": ["exact"],
+            "name": ["icontains"],
+            "department": ["exact", "icontains"],
+            "type": ["exact"],
+            "is_active": ["exact"],
+        }
+
+
+class UniversityInfoFilter(django_filters.FilterSet):
+    class Meta:
+        model = UniversityInfo
+        fields = {
+            "identifier": ["exact"],
+            "name": ["icontains"],
+        }
+
+
+class UserUniversityFilter(django_filters.FilterSet):
+    class Meta:
+        model = UserUniversity
+        fields = {
+            "user": ["exact"],
+            "user_identifier": ["exact"],
+            "university": ["exact"],
+            "user_roles": ["exact"],
+            "is_active": ["exact"],
+        }
+
+
+class VehicleFilter(django_filters.FilterSet):
+    class Meta:
+        model = Vehicle
+        fields = {
+            "owner": ["exact"],
+            "plate_number": ["iexact"],
+            "is_active": ["exact"],
+        }
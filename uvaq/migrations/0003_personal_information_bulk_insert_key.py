@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uvaq', '0002_alter_contactinformation_institutional_email_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='personalinformation',
+            name='bulk_insert_key',
+            field=models.UUIDField(blank=True, editable=False, null=True, unique=True),
+        ),
+    ]
@@ -130,6 +130,9 @@ class PersonalInformation(models.Model):
     photo = models.URLField(max_length=254)
     digital_signature = models.URLField(blank=True, max_length=254)
     role = models.CharField(max_length=20, choices=Role.choices)
+    # Set by `evoti.bulk.bulk_insert` where the backend cannot return inserted rows (MySQL), so
+    # the new primary keys are read back with one query per batch.
+    bulk_insert_key = models.UUIDField(null=True, blank=True, unique=True, editable=False)
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} {self.second_last_name or ''}".strip()
@@ -345,6 +348,9 @@ class Professor(models.Model):
     def __str__(self):
         return f"Prof. {self.user.first_name} {self.user.last_name}"
 
+    def get_courses_list(self):
+        return [{"code": subject.code, "name": subject.name} for subject in self.courses_taught.all()]
+
 
 class ProfessorSubject(models.Model):
     professor = models.ForeignKey(Professor, on_delete=models.CASCADE)
@@ -38,7 +38,7 @@ class PersonalInformationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PersonalInformation
-        fields = "__all__"
+        exclude = ["bulk_insert_key"]
 
 
 class ContactInformationSerializer(serializers.ModelSerializer):
@@ -77,12 +77,12 @@ class AccessControlSerializer(serializers.ModelSerializer):
 
     Attributes:
         user (PrimaryKeyRelatedField): Links to the `PersonalInformation` model.
-        vehicle (PrimaryKeyRelatedField): Links to the `Vehicle` model (optional).
+        vehicle (PrimaryKeyRelatedField): Links to the `Vehicle` models (optional).
     """
 
     user = serializers.PrimaryKeyRelatedField(queryset=PersonalInformation.objects.all())
     vehicle = serializers.PrimaryKeyRelatedField(
-        queryset=Vehicle.objects.all(), required=False, allow_null=True
+        queryset=Vehicle.objects.all(), many=True, required=False
     )
 
     class Meta:
@@ -225,8 +225,6 @@ class NotificationSerializer(serializers.ModelSerializer):
 
 
 class UniversityInfoSerializer(serializers.ModelSerializer):
-    user_university = serializers.PrimaryKeyRelatedField(queryset=UserUniversity.objects.all())
-
     class Meta:
         model = UniversityInfo
         fields = "__all__"
@@ -0,0 +1,296 @@
+import csv
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authentication.models import AuthorizedUser
+from authentication.session_tokens import issue_session_token
+from evoti.cache_versions import DETAIL_VERSION, STATISTICS_VERSION, current_version
+from evoti.models import ImportFingerprint
+from uvaq import factories
+from uvaq.models import Enrollment, Notification, StaffProfile, Subject
+
+sys.path.append(os.path.join(settings.BASE_DIR, "csv"))
+
+from common.diff import CsvDiff  # noqa: E402
+from common.importer import PersonImporter, StaffImporter, StudentImporter  # noqa: E402
+from common.utils import merge_names  # noqa: E402
+
+
+def authorized_client():
+    """
+    An API client authenticated as an authorized user with a local session token.
+    """
+    user = User.objects.create(username="uvaq", email="uvaq@uvaq.edu.mx")
+    AuthorizedUser.objects.create(user=user, is_authorized=True)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_session_token(user.email)}")
+    return client
+
+
+def csv_row(number, **values):
+    """
+    A cleaned CSV row of a person, as produced by the `process_*` scripts.
+    """
+    return {
+        "first_name": f"Ana{number}",
+        "last_name": "Lopez",
+        "second_last_name": "Garcia",
+        "birth_date": "2001-02-03",
+        "gender": "female",
+        "photo": f"https://uvaq.edu.mx/photos/csv{number}.jpg",
+        "digital_signature": "",
+        "institutional_email": f"csv{number}@uvaq.edu.mx",
+        "phone": "4431234567",
+        "cell_phone": "4431234567",
+        "personal_email": f"csv{number}@example.com",
+        "preferred_contact_method": "email",
+        "curp": f"CSVC{number:014d}",
+        "identity_number": f"CSV{number}",
+        "nationality": "MX",
+        "previous_school": "",
+        "current_study": "",
+        "study_interest": "",
+        "academic_offer": "",
+        "university_name": "UVAQ",
+        "university_identifier": "UVAQ",
+        "university_additional_info": "",
+        "campus": "Centro",
+        "enrollment_date": "2024-08-01",
+        "vehicle_details": "",
+        "biometric_data": "",
+        "access_devices": json.dumps([{"device_type": "card", "device_id": f"D{number}"}]),
+        "optional_notifications": "",
+        "financial_info": "",
+        "found_out_through": "",
+        "educational_advisor": "",
+        "comments": "",
+        "emergency_name": "Contact",
+        "emergency_phone": "4439999999",
+        "access_level": "1",
+        "access_hours": "8-5",
+        **values,
+    }
+
+
+def staff_row(number, **values):
+    return csv_row(
+        number,
+        staff_id=f"CSV-ST{number}",
+        department="IT",
+        job_title="Developer",
+        work_hours="40",
+        career="",
+        **values,
+    )
+
+
+def student_row(number, career, **values):
+    return csv_row(
+        number,
+        student_id=f"CSV-S{number}",
+        career=career.name,
+        career_type="degree",
+        current_grade="1",
+        subjects=json.dumps(
+            [{"name": f"CSV subject {number}", "grade": "9", "status": "approved"}]
+        ),
+        optional_notifications=json.dumps([{"name": f"CSV notification {number}"}]),
+        **values,
+    )
+
+
+class ModelViewSetTests(TestCase):
+    def setUp(self):
+        self.client = authorized_client()
+        self.students = [factories.student(enrollments=3, payments=0) for _ in range(4)]
+        factories.professor(assignments=0)
+
+    def get(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_lists_are_paginated_by_default(self):
+        page = self.get("enrollment-list")
+        self.assertEqual((page["count"], len(page["results"])), (12, 10))
+        self.assertIn("page=2", page["next"])
+
+        page = self.get("enrollment-list", page_size=5, page=3)
+        self.assertEqual(len(page["results"]), 2)
+        self.assertIsNone(page["next"])
+
+    def test_lists_are_filtered(self):
+        student = self.students[0]
+        page = self.get("enrollment-list", student=student.pk)
+        self.assertEqual(
+            {row["id"] for row in page["results"]},
+            set(Enrollment.objects.filter(student=student).values_list("pk", flat=True)),
+        )
+
+        page = self.get("personalinformation-list", role="professor")
+        self.assertEqual(page["count"], 1)
+        page = self.get("personalinformation-list", first_name__icontains="NAME")
+        self.assertEqual(page["count"], 5)
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        subjects = list(Subject.objects.order_by("pk"))
+        for subject, prerequisite in zip(subjects[1:], subjects):
+            subject.prerequisites.add(prerequisite)
+
+        # Count, page and one prefetch of the prerequisites the serializer lists.
+        for page_size in (1, len(subjects)):
+            with self.subTest(page_size=page_size), self.assertNumQueries(3):
+                page = self.get("subject-list", page_size=page_size)
+            self.assertEqual(len(page["results"]), page_size)
+        self.assertEqual(page["results"][-1]["prerequisites"], [subjects[-2].pk])
+
+
+class PersonImportTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            factories.university()
+        self.log = logging.getLogger("uvaq.tests")
+
+    def test_importer_requires_write_profiles(self):
+        with self.assertRaises(TypeError):
+            PersonImporter(pd.DataFrame([]))
+
+    def test_import_retires_the_evoti_caches_on_commit(self):
+        df = pd.DataFrame([staff_row(number) for number in range(3)])
+        versions = current_version(DETAIL_VERSION), current_version(STATISTICS_VERSION)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            report = StaffImporter(df, log=self.log).run()
+
+        self.assertEqual((report.inserted, report.failed), (3, 0))
+        self.assertEqual(StaffProfile.objects.filter(staff_id__startswith="CSV-ST").count(), 3)
+        self.assertEqual(current_version(DETAIL_VERSION), versions[0] + 1)
+        self.assertEqual(current_version(STATISTICS_VERSION), versions[1] + 1)
+
+    def test_incremental_import_only_rewrites_changed_rows(self):
+        def run(df):
+            with self.captureOnCommitCallbacks(execute=True):
+                return StaffImporter(df, log=self.log, incremental=True).run()
+
+        def fingerprints():
+            return dict(
+                ImportFingerprint.objects.filter(source=ImportFingerprint.Source.STAFF)
+                .values_list("business_key", "fingerprint")
+            )
+
+        report = run(pd.DataFrame([staff_row(number) for number in range(3)]))
+        self.assertEqual((report.inserted, report.unchanged), (3, 0))
+        before = fingerprints()
+
+        rows = [staff_row(0), staff_row(1), {**staff_row(2), "job_title": "Architect"}]
+        # Columns in another order hash the same.
+        report = run(pd.DataFrame(rows).iloc[:, ::-1])
+
+        self.assertEqual((report.inserted, report.updated), (0, 1))
+        self.assertEqual((report.unchanged, report.failed), (2, 0))
+        after = fingerprints()
+        self.assertEqual({key for key in after if after[key] != before[key]}, {"CSV-ST2"})
+        self.assertEqual(StaffProfile.objects.get(staff_id="CSV-ST2").job_title, "Architect")
+
+    def test_reference_preload_query_count_does_not_grow_with_the_file(self):
+        factories.period()
+        career, _ = factories.career()
+
+        def resolve(numbers):
+            df = pd.DataFrame([student_row(number, career) for number in numbers])
+            importer = StudentImporter(df, log=self.log)
+            with CaptureQueriesContext(connection) as queries:
+                rows = importer.resolve(importer.find_existing(importer.parse()))
+            self.assertEqual(len(rows), len(numbers))
+            return len(queries)
+
+        # Every file names new subjects and notifications, so both runs create their rows.
+        self.assertEqual(resolve(range(5)), resolve(range(100, 140)))
+        self.assertEqual(Subject.objects.filter(name__startswith="CSV subject").count(), 45)
+        self.assertEqual(
+            Notification.objects.filter(name__startswith="CSV notification").count(), 45
+        )
+
+
+class MergeNamesTests(SimpleTestCase):
+    def test_middle_names_of_any_column_type(self):
+        for middle_names, expected in (
+            ([np.nan, np.nan], ["Ana", "Luis"]),
+            ([np.nan, 2.0], ["Ana", "Luis 2.0"]),
+            (["", " Maria "], ["Ana", "Luis Maria"]),
+        ):
+            with self.subTest(middle_names=middle_names):
+                df = pd.DataFrame({"first_name": ["Ana", "Luis"], "middle_name": middle_names})
+                merged = merge_names(df)
+                self.assertEqual(merged["name"].tolist(), expected)
+                self.assertEqual(list(merged.columns), ["name"])
+
+
+class CsvDiffTests(SimpleTestCase):
+    OLD = [
+        ["identity_number", "name", "email"],
+        ["3", "Carla", "carla@uvaq.edu.mx"],
+        ["1", "Ana", "ana@uvaq.edu.mx"],
+        ["5", "Eva", "eva@uvaq.edu.mx"],
+        ["2", "Luis", "luis@uvaq.edu.mx"],
+        ["2", "Luis Repeated", "luis@uvaq.edu.mx"],
+        ["4", "Dora"],
+    ]
+    # Columns reordered; 1 unchanged, 2 and 4 changed, 3 deleted, 6 and 7 new, 5 repeated.
+    NEW = [
+        ["email", "identity_number", "name"],
+        ["eva@uvaq.edu.mx", "5", "Eva"],
+        ["new@uvaq.edu.mx", "7", "Gil"],
+        ["ana@uvaq.edu.mx", "1", "Ana"],
+        ["luis@uvaq.edu.mx", "2", "Luis Alberto"],
+        ["dora@uvaq.edu.mx", "4", "Dora"],
+        ["eva@uvaq.edu.mx", "5", "Eva Maria"],
+        ["", "6", "Fer"],
+    ]
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.old_file = os.path.join(tmpdir.name, "old.csv")
+        self.new_file = os.path.join(tmpdir.name, "new.csv")
+        for path, rows in ((self.old_file, self.OLD), (self.new_file, self.NEW)):
+            with open(path, "w", newline="", encoding="utf-8") as csvfile:
+                csv.writer(csvfile).writerows(rows)
+
+    def diff(self, **options):
+        diff = CsvDiff(self.old_file, self.new_file)
+        rows = sorted(diff.rows(**options), key=lambda row: (row[0], row[1]))
+        report = diff.report
+        return rows, (report.new, report.changed, report.unchanged, report.deleted)
+
+    def test_indexed_and_sorted_merge_yield_the_same_rows(self):
+        rows, report = self.diff()
+
+        self.assertEqual(report, (2, 3, 2, 1))
+        self.assertEqual(
+            rows,
+            [
+                ("changed", ["dora@uvaq.edu.mx", "4", "Dora"], ["email"]),
+                ("changed", ["eva@uvaq.edu.mx", "5", "Eva Maria"], ["name"]),
+                ("changed", ["luis@uvaq.edu.mx", "2", "Luis Alberto"], ["name"]),
+                ("deleted", ["3", "Carla", "carla@uvaq.edu.mx"], None),
+                ("new", ["", "6", "Fer"], None),
+                ("new", ["new@uvaq.edu.mx", "7", "Gil"], None),
+            ],
+        )
+        for run_size in (2, 100):
+            with self.subTest(run_size=run_size):
+                self.assertEqual(self.diff(sort=True, run_size=run_size), (rows, report))
@@ -1,10 +1,31 @@
-from rest_framework import viewsets
+import functools
+
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import serializers, viewsets
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 
 from authentication.hybrid_authentication import HybridAuthentication
 from authentication.mixins import AuthorizedUserRequiredMixin
 
+from .filters import (
+    AccessControlFilter,
+    ContactInformationFilter,
+    EmergencyInformationFilter,
+    EnrollmentFilter,
+    FinancialInformationFilter,
+    IdentificationFilter,
+    InsuranceInformationFilter,
+    PersonalInformationFilter,
+    ProfessorFilter,
+    ResponsibilityFilter,
+    StaffProfileFilter,
+    StudentFilter,
+    SubjectFilter,
+    UniversityInfoFilter,
+    UserUniversityFilter,
+    VehicleFilter,
+)
 from .models import (
     AccessControl,
     ContactInformation,
@@ -49,113 +70,212 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class PersonalInformationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+@functools.cache
+def get_serializer_relations(serializer_class):
+    """
+    Returns the `select_related` and `prefetch_related` paths a serializer reads.
+
+    Primary key fields are read from the `<field>_id` column and need no join. Other single
+    relations and nested serializers are joined, and many-valued relations are prefetched.
+    """
+    select_related, prefetch_related = [], []
+
+    def collect(serializer, prefix, many):
+        for field in serializer.fields.values():
+            if field.write_only or field.source == "*":
+                continue
+            path = prefix + field.source.replace(".", "__")
+            if isinstance(field, (serializers.ManyRelatedField, serializers.ListSerializer)):
+                prefetch_related.append(path)
+                if isinstance(field, serializers.ListSerializer):
+                    collect(field.child, f"{path}__", True)
+            elif isinstance(field, serializers.BaseSerializer):
+                (prefetch_related if many else select_related).append(path)
+                collect(field, f"{path}__", many)
+            elif isinstance(field, serializers.RelatedField):
+                if not field.use_pk_only_optimization():
+                    (prefetch_related if many else select_related).append(path)
+
+    collect(serializer_class(), "", False)
+    return tuple(select_related), tuple(prefetch_related)
+
+
+class OptimizedModelViewSetMixin:
+    """
+    Paginates and filters a ModelViewSet, and loads every relation its serializer reads up front,
+    so list responses take a constant number of queries whatever the table size.
+    """
+
+    pagination_class = StandardResultsSetPagination
+    filter_backends = [DjangoFilterBackend]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select_related, prefetch_related = get_serializer_relations(self.get_serializer_class())
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+        return queryset
+
+
+class PersonalInformationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = PersonalInformation.objects.all()
     serializer_class = PersonalInformationSerializer
+    filterset_class = PersonalInformationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class ContactInformationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class ContactInformationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = ContactInformation.objects.all()
     serializer_class = ContactInformationSerializer
+    filterset_class = ContactInformationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class IdentificationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class IdentificationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Identification.objects.all()
     serializer_class = IdentificationSerializer
+    filterset_class = IdentificationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class AccessControlViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class AccessControlViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = AccessControl.objects.all()
     serializer_class = AccessControlSerializer
+    filterset_class = AccessControlFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class EmergencyInformationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class EmergencyInformationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = EmergencyInformation.objects.all()
     serializer_class = EmergencyInformationSerializer
+    filterset_class = EmergencyInformationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class EnrollmentViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class EnrollmentViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Enrollment.objects.all()
     serializer_class = EnrollmentSerializer
+    filterset_class = EnrollmentFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class FinancialInformationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class FinancialInformationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = FinancialInformation.objects.all()
     serializer_class = FinancialInformationSerializer
+    filterset_class = FinancialInformationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class InsuranceInformationViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class InsuranceInformationViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = InsuranceInformation.objects.all()
     serializer_class = InsuranceInformationSerializer
+    filterset_class = InsuranceInformationFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class ProfessorViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class ProfessorViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Professor.objects.all()
     serializer_class = ProfessorSerializer
+    filterset_class = ProfessorFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class ResponsibilityViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class ResponsibilityViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Responsibility.objects.all()
     serializer_class = ResponsibilitySerializer
+    filterset_class = ResponsibilityFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class StaffProfileViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class StaffProfileViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = StaffProfile.objects.all()
     serializer_class = StaffProfileSerializer
+    filterset_class = StaffProfileFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class StudentViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class StudentViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
+    filterset_class = StudentFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class SubjectViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class SubjectViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Subject.objects.all()
     serializer_class = SubjectSerializer
+    filterset_class = SubjectFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class UniversityInfoViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class UniversityInfoViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = UniversityInfo.objects.all()
     serializer_class = UniversityInfoSerializer
+    filterset_class = UniversityInfoFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class UserUniversityViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class UserUniversityViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = UserUniversity.objects.all()
     serializer_class = UserUniversitySerializer
+    filterset_class = UserUniversityFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]
 
 
-class VehicleViewSet(AuthorizedUserRequiredMixin, viewsets.ModelViewSet):
+class VehicleViewSet(
+    AuthorizedUserRequiredMixin, OptimizedModelViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Vehicle.objects.all()
     serializer_class = VehicleSerializer
+    filterset_class = VehicleFilter
     authentication_classes = [HybridAuthentication]
     permission_classes = [IsAuthenticated]